@@ -0,0 +1,67 @@
+"""use native enums for task columns
+
+Revision ID: a2c6e8f0b4d7
+Revises: e7b3c9d5a1f4
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c6e8f0b4d7'
+down_revision: Union[str, Sequence[str], None] = 'e7b3c9d5a1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Enum type name -> (column, labels)
+TASK_ENUMS = {
+    'task_status': ('status', ('PENDING', 'IN_PROGRESS', 'COMPLETED', 'FAILED')),
+    'task_type': ('task_type', ('EMBEDDING', 'QUERY', 'REPORT_GENERATION', 'DATA_PROCESSING', 'EMAIL')),
+}
+
+
+def _column_type(column: str) -> Optional[str]:
+    """Return the current udt_name of a tasks column."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT udt_name FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'tasks' AND column_name = :column"
+        ),
+        {"column": column},
+    ).scalar()
+
+
+def upgrade() -> None:
+    # Other databases keep VARCHAR, which is what SQLAlchemy's Enum maps to there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # 4-byte enum values instead of text in the status/type indexes;
+    # existing indexes on these columns are rebuilt by ALTER COLUMN TYPE.
+    # init_db's create_all may already have created the types and columns,
+    # so both steps are skipped when already done.
+    for type_name, (column, labels) in TASK_ENUMS.items():
+        values = ", ".join(f"'{label}'" for label in labels)
+        op.execute(
+            f"DO $$ BEGIN CREATE TYPE {type_name} AS ENUM ({values}); "
+            "EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+        )
+        if _column_type(column) != type_name:
+            op.execute(
+                f'ALTER TABLE tasks ALTER COLUMN {column} TYPE {type_name} USING {column}::text::{type_name}'
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for type_name, (column, _) in reversed(list(TASK_ENUMS.items())):
+        if _column_type(column) == type_name:
+            op.execute(f'ALTER TABLE tasks ALTER COLUMN {column} TYPE VARCHAR USING {column}::text')
+        op.execute(f'DROP TYPE IF EXISTS {type_name}')
@@ -0,0 +1,34 @@
+"""add keyset index to tasks
+
+Revision ID: b9d4f1a7c3e6
+Revises: a2c6e8f0b4d7
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d4f1a7c3e6'
+down_revision: Union[str, Sequence[str], None] = 'a2c6e8f0b4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination in list_tasks: ORDER BY created_at DESC, id DESC
+    # (init_db's create_all may already have built it on a fresh database)
+    op.create_index(
+        'ix_tasks_created_id',
+        'tasks',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_created_id', table_name='tasks', if_exists=True)
@@ -0,0 +1,42 @@
+"""add trigram index to slide deck titles
+
+Revision ID: c8e2a5f7d913
+Revises: a7c3e9f1b5d2
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2a5f7d913'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9f1b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Slide deck search: WHERE title ILIKE '%term%'. A leading wildcard
+    # cannot use the btree title index; a pg_trgm GIN index can.
+    # Trigram indexes are PostgreSQL-only, so other databases skip this.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_slide_decks_title_trgm',
+        'slide_decks',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_slide_decks_title_trgm', table_name='slide_decks')
@@ -0,0 +1,52 @@
+"""add search indexes to tags
+
+Revision ID: d4a1f6b8c2e7
+Revises: c8e2a5f7d913
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a1f6b8c2e7'
+down_revision: Union[str, Sequence[str], None] = 'c8e2a5f7d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both indexes use PostgreSQL operator classes; other databases skip this
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Tag search: WHERE name ILIKE '%term%'
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_tags_name_trgm',
+        'tags',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+    # Prefix search: WHERE name LIKE 'term%' (names are stored lowercased);
+    # the unique btree index can't serve LIKE under a non-C collation
+    op.create_index(
+        'ix_tags_name_pattern',
+        'tags',
+        ['name'],
+        unique=False,
+        postgresql_ops={'name': 'varchar_pattern_ops'}
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_tags_name_pattern', table_name='tags')
+    op.drop_index('ix_tags_name_trgm', table_name='tags')
@@ -0,0 +1,29 @@
+"""Add generation_status column to quizzes table.
+
+Revision ID: e41a7c9b2d10
+Revises: 1b25c0043c3b
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41a7c9b2d10'
+down_revision = '1b25c0043c3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing quizzes were generated synchronously, so they are complete
+    op.add_column(
+        'quizzes',
+        sa.Column('generation_status', sa.String(length=20), nullable=False, server_default='completed')
+    )
+    op.alter_column('quizzes', 'generation_status', server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column('quizzes', 'generation_status')
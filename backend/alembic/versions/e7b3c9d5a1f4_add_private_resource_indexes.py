@@ -0,0 +1,48 @@
+"""add private resource indexes
+
+Revision ID: e7b3c9d5a1f4
+Revises: d4a1f6b8c2e7
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c9d5a1f4'
+down_revision: Union[str, Sequence[str], None] = 'd4a1f6b8c2e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_my_resources: WHERE created_by_id = ? AND visibility = 'PRIVATE'
+    # AND is_active ORDER BY created_at DESC -- scanned in index order, no sort
+    private_active = sa.text("visibility = 'PRIVATE' AND is_active")
+    op.create_index(
+        'resources_user_private_active',
+        'resources',
+        ['created_by_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=private_active,
+        sqlite_where=private_active
+    )
+
+    # delete/toggle-pin/download: WHERE id = ? AND created_by_id = ? AND is_active
+    active = sa.text('is_active')
+    op.create_index(
+        'resources_id_owner_active',
+        'resources',
+        ['id', 'created_by_id'],
+        unique=False,
+        postgresql_where=active,
+        sqlite_where=active
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('resources_id_owner_active', table_name='resources')
+    op.drop_index('resources_user_private_active', table_name='resources')
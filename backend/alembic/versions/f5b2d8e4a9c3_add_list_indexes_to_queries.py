@@ -0,0 +1,44 @@
+"""add list indexes to queries
+
+Revision ID: f5b2d8e4a9c3
+Revises: e41a7c9b2d10
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b2d8e4a9c3'
+down_revision: Union[str, Sequence[str], None] = 'e41a7c9b2d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Student listing: WHERE student_id = ? ORDER BY created_at DESC
+    # (INCLUDE columns are only emitted on PostgreSQL)
+    op.create_index(
+        'ix_queries_student_created',
+        'queries',
+        ['student_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_include=['status', 'category', 'priority']
+    )
+
+    # Staff listing: ORDER BY created_at DESC over all queries
+    op.create_index(
+        'ix_queries_created',
+        'queries',
+        [sa.text('created_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    # Drop indexes in reverse order
+    op.drop_index('ix_queries_created', table_name='queries')
+    op.drop_index('ix_queries_student_created', table_name='queries')
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 from jose import JWTError
 
 from app.core.db import get_db
-from app.core.security import create_tokens, decode_token
+from app.core.security import create_tokens, decode_token, hash_password_async, verify_password_async
 from app.models.user import User
 from app.models.profile import Profile
 from app.models.course import Course
@@ -430,14 +430,14 @@ async def update_current_user_profile(
                 detail="Current password is required to change password"
             )
 
-        if not current_user.verify_password(user_update.current_password):
+        if not await verify_password_async(user_update.current_password, current_user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect current password"
             )
 
-        # Set new password
-        current_user.set_password(user_update.new_password)
+        # Set new password (hashed off the event loop)
+        current_user.password = await hash_password_async(user_update.new_password)
 
     # Commit changes
     db.commit()
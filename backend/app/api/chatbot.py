@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
+from cachetools import TTLCache
 
 from app.core.db import get_db
 from app.models.user import User
@@ -117,6 +118,12 @@ def build_personalization_context(previous_conversations: List[Dict[str, Any]])
     return "\n".join(context_parts)
 
 
+# (user id, conversation id) -> ChatSession id, so follow-up messages find
+# their session by primary key instead of scanning every session's metadata.
+# A stale entry (deleted or never-committed session) falls back to the scan.
+_chat_session_ids: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+
 def get_or_create_chat_session(
     db: Session,
     user: User,
@@ -137,10 +144,20 @@ def get_or_create_chat_session(
         request: FastAPI request object for IP/device info
 
     Returns:
-        ChatSession object
+        ChatSession object. A new session is added to db but not committed;
+        update_chat_session_with_message commits it together with the first
+        exchange, so a failed update leaves no empty session behind.
     """
     # If we have a conversation_id, try to find existing session for it
     if conversation_id:
+        cache_key = (user.id, conversation_id)
+        cached_id = _chat_session_ids.get(cache_key)
+        if cached_id is not None:
+            # Primary-key lookup; served from the identity map when possible
+            session = db.get(ChatSession, cached_id)
+            if session is not None:
+                return session
+
         try:
             all_sessions = db.query(ChatSession).order_by(
                 ChatSession.updated_at.desc()
@@ -153,6 +170,7 @@ def get_or_create_chat_session(
 
                     # Found existing session for this conversation and user
                     if session_conv_id == conversation_id and session_user_id == user.id:
+                        _chat_session_ids[cache_key] = session.id
                         return session
 
         except Exception as e:
@@ -178,16 +196,17 @@ def get_or_create_chat_session(
     }
 
     new_session = ChatSession(
+        id=uuid.uuid4(),  # assigned up front so the cache can point at it before flush
         ip_address=ip_address,
         device_info=device_info,
         language="en",
         metadata_=session_metadata
     )
     db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    if conversation_id:
+        _chat_session_ids[(user.id, conversation_id)] = new_session.id
 
-    logging.info(f"New chat session created for user: {user.email}, conversation: {conversation_id}")
+    logging.info(f"New chat session started for user: {user.email}, conversation: {conversation_id}")
     return new_session
 
 
@@ -300,6 +319,11 @@ async def chat(
             limit=5
         )
 
+        # End the read transaction so the pooled connection isn't held for
+        # the LLM call; the session checks out a connection again for the
+        # chat session writes below
+        db.commit()
+
         # Build personalization context
         personalization_context = build_personalization_context(previous_conversations)
 
@@ -395,6 +419,7 @@ async def chat_stream(
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # let nginx pass chunks through as they arrive
         }
     )
 
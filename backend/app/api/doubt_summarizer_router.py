@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 from pydantic import BaseModel, EmailStr
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-import tempfile
-import os
+from io import BytesIO
+from starlette.datastructures import Headers
 import logging
 
 # Import database session dependency
@@ -51,18 +52,19 @@ async def send_email_background(recipient_email: str, course_code: str, period:
     Background task to send email asynchronously.
     This prevents blocking the API response.
     """
-    temp_path = None
     try:
         conf = get_mail_config()
         if not conf:
             logger.error("Email configuration not available")
             return
         
-        # Save PDF to temporary file
+        # Attach the PDF straight from memory instead of a temp file round trip
         period_display = period or "all-time"
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.pdf', delete=False) as temp_file:
-            temp_file.write(pdf_bytes)
-            temp_path = temp_file.name
+        attachment = UploadFile(
+            file=BytesIO(pdf_bytes),
+            filename=f"doubt_summary_{course_code}_{period_display}.pdf",
+            headers=Headers({"content-type": "application/pdf"})
+        )
         
         subject = f"Doubt Summary Report - {course_code} ({period_display.title()})"
         
@@ -107,13 +109,13 @@ async def send_email_background(recipient_email: str, course_code: str, period:
             recipients=[recipient_email],
             body=body,
             subtype=MessageType.html,
-            attachments=[temp_path]
+            attachments=[attachment]
         )
         
         # Send email
         fm = FastMail(conf)
         await fm.send_message(message)
-        logger.info(f"Email sent successfully to {recipient_email}")
+        logger.info("Email sent successfully to %s", recipient_email)
         
     except Exception as e:
         error_str = str(e)
@@ -124,13 +126,6 @@ async def send_email_background(recipient_email: str, course_code: str, period:
             logger.error(f"Failed to connect to SMTP server for {recipient_email}: {error_str}")
         else:
             logger.error(f"Failed to send email to {recipient_email}: {error_str}")
-    finally:
-        # Clean up temporary file
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
 
 # Create FastAPI router
 router = APIRouter(
@@ -302,8 +297,8 @@ async def export_summary_pdf(
             'recurring_issues': recurring_count
         }
         
-        # Generate PDF
-        pdf_buffer = doubt_export_service.generate_pdf(summary, course_code, period or "all-time")
+        # Generate PDF (CPU-bound ReportLab work, kept off the event loop)
+        pdf_buffer = await run_in_threadpool(doubt_export_service.generate_pdf, summary, course_code, period or "all-time")
         
         return StreamingResponse(
             pdf_buffer,
@@ -407,8 +402,8 @@ async def email_summary_report(
             'recurring_issues': recurring_count
         }
         
-        # Generate PDF for background task
-        pdf_buffer = doubt_export_service.generate_pdf(summary, request.course_code, request.period)
+        # Generate PDF for background task (off the event loop)
+        pdf_buffer = await run_in_threadpool(doubt_export_service.generate_pdf, summary, request.course_code, request.period)
         pdf_bytes = pdf_buffer.getvalue()
         
         # Queue email to be sent in background
@@ -9,11 +9,15 @@ Provides endpoints for:
 - Updating query status
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status as http_status, Query as QueryParam
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status as http_status, Query as QueryParam
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import func, desc, insert, select
 from typing import Optional, List
 from datetime import datetime
+import hashlib
+import orjson
+from cachetools import TTLCache
 
 from app.core.db import get_db
 from app.api.dependencies import get_current_user
@@ -26,6 +30,43 @@ from pydantic import BaseModel, Field
 router = APIRouter(prefix="/queries", tags=["Queries"])
 
 
+# ============================================================================
+# Filter Lookups
+# ============================================================================
+
+
+def _enum_lookup(enum_cls) -> dict:
+    """Map both upper-case names and lower-case values to enum members."""
+    lookup = {member.name: member for member in enum_cls}
+    lookup.update({member.name.lower(): member for member in enum_cls})
+    return lookup
+
+
+_STATUS_MAP = _enum_lookup(QueryStatus)
+_CATEGORY_MAP = _enum_lookup(QueryCategory)
+_PRIORITY_MAP = _enum_lookup(QueryPriority)
+
+_VALID_STATUSES = ", ".join(member.name for member in QueryStatus)
+_VALID_CATEGORIES = ", ".join(member.name for member in QueryCategory)
+_VALID_PRIORITIES = ", ".join(member.name for member in QueryPriority)
+
+
+# ============================================================================
+# Statistics Cache
+# ============================================================================
+
+# Per-process cache of get_query_statistics results, keyed by the student id
+# (students see only their own queries) or "ALL" for staff. Writes through this
+# router clear it; the short TTL bounds staleness across worker processes.
+QUERY_STATS_TTL_SECONDS = 15
+query_stats_cache: TTLCache = TTLCache(maxsize=10_000, ttl=QUERY_STATS_TTL_SECONDS)
+
+
+def invalidate_query_statistics() -> None:
+    """Drop cached query statistics after a write that changes the counts."""
+    query_stats_cache.clear()
+
+
 # ============================================================================
 # Pydantic Schemas
 # ============================================================================
@@ -57,55 +98,198 @@ class QueryStatusUpdate(BaseModel):
 # ============================================================================
 
 
-def serialize_query(query: Query, include_responses: bool = False) -> dict:
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional timestamp as ISO 8601."""
+    return value.isoformat() if value else None
+
+
+def serialize_query_summary(query: Query) -> dict:
     """
-    Serialize a Query object to dictionary.
+    Serialize a Query object to dictionary without its responses.
 
     Args:
         query: Query model instance
-        include_responses: Whether to include responses
 
     Returns:
         Serialized query dictionary
     """
-    result = {
+    student = query.student
+    assigned_to = query.assigned_to
+    return {
         "id": query.id,
         "title": query.title,
         "description": query.description,
-        "status": query.status.value if hasattr(query.status, 'value') else str(query.status),
-        "priority": query.priority.value if hasattr(query.priority, 'value') else str(query.priority),
-        "category": query.category.value if hasattr(query.category, 'value') else str(query.category),
+        "status": query.status.value,
+        "priority": query.priority.value,
+        "category": query.category.value,
         "student_id": query.student_id,
-        "student_name": query.student.full_name if query.student else "Unknown",
+        "student_name": student.full_name if student else "Unknown",
         "assigned_to_id": query.assigned_to_id,
-        "assigned_to_name": query.assigned_to.full_name if query.assigned_to else None,
+        "assigned_to_name": assigned_to.full_name if assigned_to else None,
         "tags": query.tags or [],
         "view_count": query.view_count,
         "resolution_notes": query.resolution_notes,
-        "created_at": query.created_at.isoformat() if query.created_at else None,
-        "updated_at": query.updated_at.isoformat() if query.updated_at else None,
-        "resolved_at": query.resolved_at.isoformat() if query.resolved_at else None,
-        "response_count": len(query.responses) if query.responses else 0
+        "created_at": _isoformat(query.created_at),
+        "updated_at": _isoformat(query.updated_at),
+        "resolved_at": _isoformat(query.resolved_at),
+        "response_count": len(query.responses)
     }
 
-    if include_responses and query.responses:
-        result["responses"] = [
-            {
-                "id": r.id,
-                "content": r.content,
-                "is_solution": r.is_solution,
-                "user_id": r.user_id,
-                "user_name": r.user.full_name if r.user else "Unknown",
-                "user_role": r.user.role.value if r.user and hasattr(r.user.role, 'value') else "unknown",
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "updated_at": r.updated_at.isoformat() if r.updated_at else None
-            }
-            for r in query.responses
-        ]
 
+# Columns selected by list_queries (large per-query fields such as tags and
+# resolution notes are only returned by the detail endpoint)
+_LIST_COLUMNS = (
+    Query.id,
+    Query.title,
+    Query.description,
+    Query.status,
+    Query.priority,
+    Query.category,
+    Query.student_id,
+    Query.assigned_to_id,
+    Query.view_count,
+    Query.created_at,
+    Query.updated_at,
+    Query.resolved_at,
+)
+
+
+def serialize_query_list_row(row) -> dict:
+    """
+    Serialize a projected list_queries row to dictionary.
+
+    Args:
+        row: Row with the _LIST_COLUMNS plus student_name,
+            assigned_to_name and response_count
+
+    Returns:
+        Serialized query list item
+    """
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status.value,
+        "priority": row.priority.value,
+        "category": row.category.value,
+        "student_id": row.student_id,
+        "student_name": row.student_name,
+        "assigned_to_id": row.assigned_to_id,
+        "assigned_to_name": row.assigned_to_name,
+        "view_count": row.view_count,
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+        "resolved_at": _isoformat(row.resolved_at),
+        "response_count": row.response_count
+    }
+
+
+def serialize_new_query_row(row, student_name: Optional[str]) -> dict:
+    """
+    Serialize a freshly inserted query row returned by INSERT ... RETURNING.
+
+    A new query has no assignee and no responses yet, so those fields are
+    filled in without touching relationships.
+
+    Args:
+        row: Row with all columns of the queries table
+        student_name: Full name of the creating student
+
+    Returns:
+        Serialized query dictionary (same shape as serialize_query_summary)
+    """
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status.value,
+        "priority": row.priority.value,
+        "category": row.category.value,
+        "student_id": row.student_id,
+        "student_name": student_name,
+        "assigned_to_id": row.assigned_to_id,
+        "assigned_to_name": None,
+        "tags": row.tags or [],
+        "view_count": row.view_count,
+        "resolution_notes": row.resolution_notes,
+        "created_at": _isoformat(row.created_at),
+        "updated_at": _isoformat(row.updated_at),
+        "resolved_at": _isoformat(row.resolved_at),
+        "response_count": 0
+    }
+
+
+def serialize_query_response(response: QueryResponse) -> dict:
+    """
+    Serialize a QueryResponse object to dictionary.
+
+    Args:
+        response: QueryResponse model instance
+
+    Returns:
+        Serialized response dictionary
+    """
+    user = response.user
+    return {
+        "id": response.id,
+        "content": response.content,
+        "is_solution": response.is_solution,
+        "user_id": response.user_id,
+        "user_name": user.full_name if user else "Unknown",
+        "user_role": user.role.value if user else "unknown",
+        "created_at": _isoformat(response.created_at),
+        "updated_at": _isoformat(response.updated_at)
+    }
+
+
+def serialize_query_detail(query: Query) -> dict:
+    """
+    Serialize a Query object to dictionary including its responses.
+
+    Args:
+        query: Query model instance
+
+    Returns:
+        Serialized query dictionary with a "responses" list when the
+        query has any responses
+    """
+    result = serialize_query_summary(query)
+    responses = query.responses
+    if responses:
+        result["responses"] = [serialize_query_response(r) for r in responses]
     return result
 
 
+def compute_query_etag(detail: dict) -> str:
+    """
+    Compute an ETag for a query detail representation.
+
+    The tag hashes the serialized detail itself, so any visible change
+    (status, notes, a response edit) produces a new tag even when it lands
+    in the same second as the previous one.
+
+    Args:
+        detail: Output of serialize_query_detail
+
+    Returns:
+        Quoted ETag string
+    """
+    digest = hashlib.blake2b(
+        orjson.dumps(detail, option=orjson.OPT_SORT_KEYS),
+        digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
 # ============================================================================
 # Query Endpoints
 # ============================================================================
@@ -114,11 +298,15 @@ def serialize_query(query: Query, include_responses: bool = False) -> dict:
 @router.get(
     "/",
     summary="List queries",
+    response_class=ORJSONResponse,
     description="""
     Get list of queries with filtering options.
 
     Students see only their own queries.
     TAs/Instructors/Admins see all queries.
+
+    List items omit tags and resolution notes; fetch the query detail
+    endpoint for those.
     """
 )
 async def list_queries(
@@ -131,110 +319,124 @@ async def list_queries(
     db: Session = Depends(get_db)
 ):
     """Get list of queries with filters."""
-    try:
-        # Base query
-        query = db.query(Query)
-
-        # Students see only their queries
-        if current_user.role.value == "student":
-            query = query.filter(Query.student_id == current_user.id)
-
-        # Apply filters
-        if status_filter:
-            try:
-                # QueryStatus enum uses uppercase names with lowercase values
-                # e.g., QueryStatus.OPEN = "open"
-                status_enum = QueryStatus[status_filter.upper()]
-                query = query.filter(Query.status == status_enum)
-            except KeyError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid status: {status_filter}. Valid values: OPEN, IN_PROGRESS, RESOLVED"
-                )
-
-        if category:
-            try:
-                category_enum = QueryCategory[category.upper()]
-                query = query.filter(Query.category == category_enum)
-            except KeyError:
-                raise HTTPException(
-                    status_code=http_status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid category: {category}. Valid values: TECHNICAL, CONCEPTUAL, ASSIGNMENT, EXAM, GENERAL, OTHER"
-                )
-
-        if priority:
-            try:
-                priority_enum = QueryPriority[priority.upper()]
-                query = query.filter(Query.priority == priority_enum)
-            except KeyError:
-                raise HTTPException(
-                    status_code=http_status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid priority: {priority}. Valid values: LOW, MEDIUM, HIGH, URGENT"
-                )
-
-        # Get total count
-        total = query.count()
-
-        # Apply ordering and pagination
-        queries = query.order_by(desc(Query.created_at)).offset(offset).limit(limit).all()
-
-        return {
-            "queries": [serialize_query(q) for q in queries],
-            "total": total,
-            "limit": limit,
-            "offset": offset
-        }
+    # Base query
+    query = db.query(Query)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch queries: {str(e)}"
+    # Students see only their queries
+    if current_user.is_student:
+        query = query.filter(Query.student_id == current_user.id)
+
+    # Apply filters
+    if status_filter:
+        status_enum = _STATUS_MAP.get(status_filter)
+        if status_enum is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status: {status_filter}. Valid values: {_VALID_STATUSES}"
+            )
+        query = query.filter(Query.status == status_enum)
+
+    if category:
+        category_enum = _CATEGORY_MAP.get(category)
+        if category_enum is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid category: {category}. Valid values: {_VALID_CATEGORIES}"
+            )
+        query = query.filter(Query.category == category_enum)
+
+    if priority:
+        priority_enum = _PRIORITY_MAP.get(priority)
+        if priority_enum is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid priority: {priority}. Valid values: {_VALID_PRIORITIES}"
+            )
+        query = query.filter(Query.priority == priority_enum)
+
+    # Get total count
+    total = query.count()
+
+    # Project only the listed columns; names and response counts come from
+    # joins/subqueries instead of per-row relationship loads
+    student = aliased(User)
+    assignee = aliased(User)
+    response_count = (
+        select(func.count(QueryResponse.id))
+        .where(QueryResponse.query_id == Query.id)
+        .correlate(Query)
+        .scalar_subquery()
+    )
+    rows = (
+        query.with_entities(
+            *_LIST_COLUMNS,
+            student.full_name.label("student_name"),
+            assignee.full_name.label("assigned_to_name"),
+            response_count.label("response_count")
         )
+        .outerjoin(student, student.id == Query.student_id)
+        .outerjoin(assignee, assignee.id == Query.assigned_to_id)
+        .order_by(desc(Query.created_at))
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+
+    # serialize_query_list_row already emits JSON-native values, so hand
+    # the payload straight to orjson and skip jsonable_encoder
+    return ORJSONResponse({
+        "queries": [serialize_query_list_row(row) for row in rows],
+        "total": total,
+        "limit": limit,
+        "offset": offset
+    })
 
 
 @router.get(
     "/{query_id}",
     summary="Get query details",
-    description="Get detailed information about a specific query including all responses."
+    description="""
+    Get detailed information about a specific query including all responses.
+
+    The response carries an ETag header. Clients that send it back in
+    If-None-Match receive 304 Not Modified while the query is unchanged.
+    """
 )
 async def get_query(
     query_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get specific query with responses."""
-    try:
-        # Fetch query with eager loading of responses
-        query = db.query(Query).options(joinedload(Query.responses)).filter(Query.id == query_id).first()
+    # Fetch query with eager loading of responses
+    query = db.query(Query).options(joinedload(Query.responses)).filter(Query.id == query_id).first()
 
-        if not query:
-            raise HTTPException(
-                status_code=http_status.HTTP_404_NOT_FOUND,
-                detail=f"Query {query_id} not found"
-            )
+    if not query:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"Query {query_id} not found"
+        )
 
-        # Check access permission
-        if current_user.role.value == "student" and query.student_id != current_user.id:
-            raise HTTPException(
-                status_code=http_status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to view this query"
-            )
+    # Check access permission
+    if current_user.is_student and query.student_id != current_user.id:
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to view this query"
+        )
 
-        # Increment view count
-        query.view_count += 1
-        db.commit()
+    # Unchanged since the client's last fetch - skip the view count write
+    if etag_matches(request, compute_query_etag(serialize_query_detail(query))):
+        return Response(status_code=http_status.HTTP_304_NOT_MODIFIED)
 
-        return serialize_query(query, include_responses=True)
+    # Increment view count
+    query.view_count += 1
+    db.commit()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch query: {str(e)}"
-        )
+    detail = serialize_query_detail(query)
+    response.headers["ETag"] = compute_query_etag(detail)
+    return detail
 
 
 @router.post(
@@ -249,16 +451,17 @@ async def create_query(
     db: Session = Depends(get_db)
 ):
     """Create a new query."""
-    try:
-        # Only students can create queries
-        if current_user.role.value != "student":
-            raise HTTPException(
-                status_code=http_status.HTTP_403_FORBIDDEN,
-                detail="Only students can create queries"
-            )
+    # Only students can create queries
+    if not current_user.is_student:
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail="Only students can create queries"
+        )
 
-        # Create query
-        new_query = Query(
+    # Insert and read back the stored row in one statement
+    row = db.execute(
+        insert(Query)
+        .values(
             title=query_data.title,
             description=query_data.description,
             category=query_data.category,
@@ -267,24 +470,15 @@ async def create_query(
             student_id=current_user.id,
             status=QueryStatus.OPEN
         )
-
-        db.add(new_query)
-        db.commit()
-        db.refresh(new_query)
-
-        return {
-            "message": "Query created successfully",
-            "query": serialize_query(new_query)
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create query: {str(e)}"
-        )
+        .returning(*Query.__table__.columns)
+    ).one()
+    db.commit()
+    invalidate_query_statistics()
+
+    return {
+        "message": "Query created successfully",
+        "query": serialize_new_query_row(row, student_name=current_user.full_name)
+    }
 
 
 @router.post(
@@ -300,56 +494,59 @@ async def add_query_response(
     db: Session = Depends(get_db)
 ):
     """Add a response to a query."""
-    try:
-        # Fetch query
-        query = db.query(Query).filter(Query.id == query_id).first()
+    # Fetch query
+    query = db.query(Query).filter(Query.id == query_id).first()
 
-        if not query:
-            raise HTTPException(
-                status_code=http_status.HTTP_404_NOT_FOUND,
-                detail=f"Query {query_id} not found"
-            )
-
-        # Create response
-        new_response = QueryResponse(
-            query_id=query_id,
-            user_id=current_user.id,
-            content=response_data.content,
-            is_solution=response_data.is_solution and current_user.role.value in ["ta", "instructor", "admin"]
+    if not query:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"Query {query_id} not found"
         )
 
-        db.add(new_response)
+    is_solution = bool(response_data.is_solution and current_user.is_staff)
 
-        # Update query status if it's the first response
-        if query.status == QueryStatus.OPEN and not query.responses:
+    # Update query status if it's the first response
+    if query.status == QueryStatus.OPEN:
+        has_responses = db.query(
+            db.query(QueryResponse.id).filter(QueryResponse.query_id == query_id).exists()
+        ).scalar()
+        if not has_responses:
             query.status = QueryStatus.IN_PROGRESS
 
-        # If marked as solution, resolve query
-        if new_response.is_solution:
-            query.status = QueryStatus.RESOLVED
-            query.resolved_at = datetime.utcnow()
-
-        db.commit()
-        db.refresh(new_response)
-
-        return {
-            "message": "Response added successfully",
-            "response": {
-                "id": new_response.id,
-                "content": new_response.content,
-                "is_solution": new_response.is_solution,
-                "created_at": new_response.created_at.isoformat()
-            }
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to add response: {str(e)}"
+    # Insert the response and read back its generated columns in one statement
+    new_response = db.execute(
+        insert(QueryResponse)
+        .values(
+            query_id=query_id,
+            user_id=current_user.id,
+            content=response_data.content,
+            is_solution=is_solution
+        )
+        .returning(
+            QueryResponse.id,
+            QueryResponse.content,
+            QueryResponse.is_solution,
+            QueryResponse.created_at
         )
+    ).one()
+
+    # If marked as solution, resolve query
+    if is_solution:
+        query.status = QueryStatus.RESOLVED
+        query.resolved_at = func.now()
+
+    db.commit()
+    invalidate_query_statistics()
+
+    return {
+        "message": "Response added successfully",
+        "response": {
+            "id": new_response.id,
+            "content": new_response.content,
+            "is_solution": new_response.is_solution,
+            "created_at": new_response.created_at.isoformat()
+        }
+    }
 
 
 @router.put(
@@ -364,47 +561,38 @@ async def update_query_status(
     db: Session = Depends(get_db)
 ):
     """Update query status."""
-    try:
-        # Only TAs/Instructors/Admins can update status
-        if current_user.role.value not in ["ta", "instructor", "admin"]:
-            raise HTTPException(
-                status_code=http_status.HTTP_403_FORBIDDEN,
-                detail="Only TAs/Instructors/Admins can update query status"
-            )
-
-        # Fetch query
-        query = db.query(Query).filter(Query.id == query_id).first()
+    # Only TAs/Instructors/Admins can update status
+    if not current_user.is_staff:
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail="Only TAs/Instructors/Admins can update query status"
+        )
 
-        if not query:
-            raise HTTPException(
-                status_code=http_status.HTTP_404_NOT_FOUND,
-                detail=f"Query {query_id} not found"
-            )
+    # Fetch query
+    query = db.query(Query).filter(Query.id == query_id).first()
 
-        # Update status
-        query.status = status_data.status
+    if not query:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"Query {query_id} not found"
+        )
 
-        if status_data.resolution_notes:
-            query.resolution_notes = status_data.resolution_notes
+    # Update status
+    query.status = status_data.status
 
-        if status_data.status == QueryStatus.RESOLVED:
-            query.resolved_at = datetime.utcnow()
+    if status_data.resolution_notes:
+        query.resolution_notes = status_data.resolution_notes
 
-        db.commit()
+    if status_data.status == QueryStatus.RESOLVED:
+        query.resolved_at = func.now()
 
-        return {
-            "message": "Query status updated successfully",
-            "query": serialize_query(query)
-        }
+    db.commit()
+    invalidate_query_statistics()
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to update query status: {str(e)}"
-        )
+    return {
+        "message": "Query status updated successfully",
+        "query": serialize_query_summary(query)
+    }
 
 
 @router.get(
@@ -417,52 +605,52 @@ async def get_query_statistics(
     db: Session = Depends(get_db)
 ):
     """Get query statistics."""
-    try:
-        # Base query - students see only their stats
-        base_query = db.query(Query)
-        if current_user.role.value == "student":
-            base_query = base_query.filter(Query.student_id == current_user.id)
-
-        # Total queries
-        total_queries = base_query.count()
-
-        # By status
-        open_count = base_query.filter(Query.status == QueryStatus.OPEN).count()
-        in_progress_count = base_query.filter(Query.status == QueryStatus.IN_PROGRESS).count()
-        resolved_count = base_query.filter(Query.status == QueryStatus.RESOLVED).count()
-
-        # By priority
-        high_priority_count = base_query.filter(Query.priority == QueryPriority.HIGH).count()
-
-        # By category
-        category_stats = db.query(
-            Query.category,
-            func.count(Query.id).label('count')
-        )
-
-        if current_user.role.value == "student":
-            category_stats = category_stats.filter(Query.student_id == current_user.id)
-
-        category_stats = category_stats.group_by(Query.category).all()
-
-        return {
-            "total_queries": total_queries,
-            "by_status": {
-                "open": open_count,
-                "in_progress": in_progress_count,
-                "resolved": resolved_count
-            },
-            "by_priority": {
-                "high": high_priority_count
-            },
-            "by_category": {
-                cat.value if hasattr(cat, 'value') else str(cat): count
-                for cat, count in category_stats
-            }
+    cache_key = current_user.id if current_user.is_student else "ALL"
+    cached = query_stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Base query - students see only their stats
+    base_query = db.query(Query)
+    if current_user.is_student:
+        base_query = base_query.filter(Query.student_id == current_user.id)
+
+    # Total queries
+    total_queries = base_query.count()
+
+    # By status
+    open_count = base_query.filter(Query.status == QueryStatus.OPEN).count()
+    in_progress_count = base_query.filter(Query.status == QueryStatus.IN_PROGRESS).count()
+    resolved_count = base_query.filter(Query.status == QueryStatus.RESOLVED).count()
+
+    # By priority
+    high_priority_count = base_query.filter(Query.priority == QueryPriority.HIGH).count()
+
+    # By category
+    category_stats = db.query(
+        Query.category,
+        func.count(Query.id).label('count')
+    )
+
+    if current_user.is_student:
+        category_stats = category_stats.filter(Query.student_id == current_user.id)
+
+    category_stats = category_stats.group_by(Query.category).all()
+
+    stats = {
+        "total_queries": total_queries,
+        "by_status": {
+            "open": open_count,
+            "in_progress": in_progress_count,
+            "resolved": resolved_count
+        },
+        "by_priority": {
+            "high": high_priority_count
+        },
+        "by_category": {
+            cat.value if hasattr(cat, 'value') else str(cat): count
+            for cat, count in category_stats
         }
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch statistics: {str(e)}"
-        )
+    }
+    query_stats_cache[cache_key] = stats
+    return stats
@@ -2,11 +2,16 @@
 API router for quiz generation and attempts.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, delete, func, or_, update
 from sqlalchemy.orm import Session
 
-from app.core.db import get_db
+from app.core.config import settings
+from app.core.db import get_db, SessionLocal
 from app.models.user import User
 from app.models.course import Course
 from app.models.quiz import Quiz
@@ -19,93 +24,221 @@ from app.api.dependencies import require_ta, require_authenticated
 from app.services.quiz_service import quiz_service
 from app.services.quiz_db_service import quiz_db_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+# ============================================================================
+# Background AI Generation
+# ============================================================================
+
+
+async def run_quiz_generation(quiz_id: int, generation_kwargs: Dict[str, Any], publish: bool) -> None:
+    """
+    Generate quiz questions with the AI service and store them on the placeholder quiz.
+
+    Runs after the response has been sent and uses its own short-lived
+    database session, so the request never holds a connection during the
+    AI call.
+    """
+    try:
+        generated_questions = await quiz_service.generate_quiz(**generation_kwargs)
+    except Exception as e:
+        generated_questions = {"error": str(e)}
+    await run_in_threadpool(_store_generated_questions, quiz_id, generated_questions, publish)
+
+
+async def run_quiz_update(quiz_id: int, quiz_data: Dict[str, Any], feedback: str) -> None:
+    """Regenerate quiz questions from feedback and store them on the quiz."""
+    try:
+        updated_questions = await quiz_service.update_quiz(quiz_data=quiz_data, feedback=feedback)
+    except Exception as e:
+        updated_questions = {"error": str(e)}
+    await run_in_threadpool(_store_generated_questions, quiz_id, updated_questions, None)
+
+
+def _store_generated_questions(quiz_id: int, questions: Dict[str, Any], publish: Optional[bool]) -> None:
+    """
+    Persist AI output and flip the quiz's generation status.
+
+    Blocking session I/O, so the async jobs call it through the threadpool.
+    """
+    db = SessionLocal()
+    try:
+        db_quiz = db.get(Quiz, quiz_id)
+        if db_quiz is None:
+            # Deleted while the AI call was in flight
+            return
+
+        if "error" in questions:
+            logger.error(f"AI service error for quiz {quiz_id}: {questions.get('error')}")
+            db_quiz.generation_status = "failed"
+        else:
+            db_quiz.questions = questions
+            db_quiz.generation_status = "completed"
+            if publish is not None:
+                db_quiz.is_published = publish
+        db.commit()
+    finally:
+        db.close()
+
+
+def _generation_stale():
+    """
+    SQL condition for a job that has been 'generating' past the timeout.
+
+    A job lost to a worker restart never finishes, so without this the quiz
+    would be stuck: updates would 409 forever and pollers would never stop.
+    The claim UPDATE sets updated_at; a new quiz only has created_at.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=settings.QUIZ_GENERATION_TIMEOUT_MINUTES)
+    return and_(
+        Quiz.generation_status == "generating",
+        func.coalesce(Quiz.updated_at, Quiz.created_at) < cutoff,
+    )
+
+
+def _fail_stale_generation(db: Session, quiz_id: int) -> bool:
+    """Mark the quiz's generation as failed if its job has timed out."""
+    result = db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz_id, _generation_stale())
+        .values(generation_status="failed")
+    )
+    db.commit()
+    return result.rowcount > 0
+
+
+# ============================================================================
+# Ownership Helpers
+# ============================================================================
+
+
+def _raise_not_owned(db: Session, quiz_id: int, forbidden_detail: str) -> None:
+    """
+    Explain why an ownership-guarded statement matched no rows.
+
+    Only reached on the failure path, so the common case stays a single
+    UPDATE/DELETE with the ownership check in its WHERE clause.
+    """
+    exists = db.query(Quiz.id).filter(Quiz.id == quiz_id).first() # type: ignore
+    if exists is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    raise HTTPException(status_code=403, detail=forbidden_detail)
+
+
+def _set_published(db: Session, quiz_id: int, user_id: int, is_published: bool, forbidden_detail: str) -> Quiz:
+    """Set is_published on a quiz owned by the user in one guarded UPDATE."""
+    result = db.execute(
+        update(Quiz)
+        .where(Quiz.id == quiz_id, Quiz.created_by_id == user_id)
+        .values(is_published=is_published)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        _raise_not_owned(db, quiz_id, forbidden_detail)
+    db.commit()
+    return db.get(Quiz, quiz_id)
+
+
 @router.post(
     "/generate",
     response_model=QuizResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Generate a new quiz (TA/Admin only)",
 )
 async def generate_and_save_quiz(
     request: QuizGenerationRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_ta),
 ):
     """
-    Generates a new quiz using the AI service and saves it to the database.
-    If publish_mode is 'auto', the quiz is immediately published.
+    Queues AI generation of a new quiz and returns the placeholder immediately.
+
+    The quiz is created with generation_status 'generating'; poll
+    GET /quizzes/{id} until it becomes 'completed' (or 'failed').
+    If publish_mode is 'auto', the quiz is published once generation completes.
     """
     course = db.query(Course).filter(Course.id == request.course_id).first() # type: ignore
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
-    # Generate quiz content using the AI service
-    generated_questions = await quiz_service.generate_quiz(
-        course_name=course.name,
-        topics=request.topics,
-        difficulty=request.difficulty,
-        marks_per_question=request.marks_per_question,
-        num_questions=request.num_questions,
-    )
-
-    if "error" in generated_questions:
-        raise HTTPException(status_code=500, detail=f"AI service error: {generated_questions.get('error')}")
-
-    # Determine if quiz should be auto-published
-    is_published = request.publish_mode == "auto"
-
-    # Save the generated quiz to the database
+    # Save a placeholder quiz; questions are filled in by the background job
     db_quiz = Quiz(
         title=request.title,
         description=request.description,
         course_id=request.course_id,
         created_by_id=current_user.id,
-        questions=generated_questions,
+        questions={},
         use_latex=request.use_latex,
         publish_mode=request.publish_mode,
-        is_published=is_published,
+        is_published=False,
+        generation_status="generating",
     )
     db.add(db_quiz)
     db.commit()
     db.refresh(db_quiz)
+
+    background_tasks.add_task(
+        run_quiz_generation,
+        db_quiz.id,
+        {
+            "course_name": course.name,
+            "topics": request.topics,
+            "difficulty": request.difficulty,
+            "marks_per_question": request.marks_per_question,
+            "num_questions": request.num_questions,
+        },
+        request.publish_mode == "auto",
+    )
+
     return db_quiz
 
 
 @router.put(
     "/{quiz_id}",
     response_model=QuizResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Update an existing quiz (Creator only)",
 )
 async def update_existing_quiz(
     quiz_id: int,
     request: QuizUpdateRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_ta),
 ):
     """
-    Updates an existing quiz using AI-powered feedback. Only the original creator can update it.
-    """
-    db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first() # type: ignore
-    if not db_quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-
-    if db_quiz.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only update quizzes you have created.")
+    Queues an AI-powered update of an existing quiz. Only the original creator can update it.
 
-    # Update quiz content using the AI service
-    updated_questions = await quiz_service.update_quiz(
-        quiz_data=db_quiz.questions,
-        feedback=request.feedback,
+    The quiz is returned with generation_status 'generating'; poll
+    GET /quizzes/{id} for the updated questions.
+    """
+    # Claim the quiz for regeneration: ownership and the in-progress guard
+    # are part of the UPDATE predicate, so concurrent requests cannot both win
+    result = db.execute(
+        update(Quiz)
+        .where(
+            Quiz.id == quiz_id,
+            Quiz.created_by_id == current_user.id,
+            or_(Quiz.generation_status != "generating", _generation_stale()),
+        )
+        .values(generation_status="generating")
     )
-
-    if "error" in updated_questions:
-        raise HTTPException(status_code=500, detail=f"AI service error: {updated_questions.get('error')}")
-
-    db_quiz.questions = updated_questions
+    if result.rowcount == 0:
+        db.rollback()
+        db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first() # type: ignore
+        if not db_quiz:
+            raise HTTPException(status_code=404, detail="Quiz not found")
+        if db_quiz.created_by_id != current_user.id:
+            raise HTTPException(status_code=403, detail="You can only update quizzes you have created.")
+        raise HTTPException(status_code=409, detail="Quiz generation is already in progress.")
     db.commit()
-    db.refresh(db_quiz)
+    db_quiz = db.get(Quiz, quiz_id)
+
+    background_tasks.add_task(run_quiz_update, db_quiz.id, db_quiz.questions, request.feedback)
     return db_quiz
 
 
@@ -132,6 +265,9 @@ def get_quiz(quiz_id: int, db: Session = Depends(get_db), _: User = Depends(requ
     db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first() # type: ignore
     if not db_quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
+    # Pollers wait on this endpoint, so a timed-out job is resolved here
+    if db_quiz.generation_status == "generating" and _fail_stale_generation(db, quiz_id):
+        db.refresh(db_quiz)
     return db_quiz
 
 
@@ -188,17 +324,10 @@ def publish_quiz(
     Publishes a quiz with manual review mode. Only the creator can publish.
     Auto-published quizzes are already published at generation time.
     """
-    db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first() # type: ignore
-    if not db_quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-    
-    if db_quiz.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only publish quizzes you have created.")
-    
-    db_quiz.is_published = True
-    db.commit()
-    db.refresh(db_quiz)
-    return db_quiz
+    return _set_published(
+        db, quiz_id, current_user.id, True,
+        "You can only publish quizzes you have created.",
+    )
 
 
 @router.post(
@@ -214,17 +343,10 @@ def unpublish_quiz(
     """
     Unpublishes a quiz. Only the creator can unpublish.
     """
-    db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first() # type: ignore
-    if not db_quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-    
-    if db_quiz.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only unpublish quizzes you have created.")
-    
-    db_quiz.is_published = False
-    db.commit()
-    db.refresh(db_quiz)
-    return db_quiz
+    return _set_published(
+        db, quiz_id, current_user.id, False,
+        "You can only unpublish quizzes you have created.",
+    )
 
 
 @router.delete("/{quiz_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a quiz (Creator only)")
@@ -233,12 +355,18 @@ def delete_quiz(
     db: Session = Depends(get_db),
     current_user: User = Depends(require_ta),
 ):
-    db_quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first() # type: ignore
-    if not db_quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-    if db_quiz.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only delete quizzes you have created.")
-
-    db.delete(db_quiz)
+    owned_quiz = (
+        db.query(Quiz.id)
+        .filter(Quiz.id == quiz_id, Quiz.created_by_id == current_user.id)
+        .scalar_subquery()
+    )
+    # Attempts are removed explicitly since a Core DELETE skips ORM cascades
+    db.execute(delete(QuizAttempt).where(QuizAttempt.quiz_id == owned_quiz))
+    result = db.execute(
+        delete(Quiz).where(Quiz.id == quiz_id, Quiz.created_by_id == current_user.id)
+    )
+    if result.rowcount == 0:
+        db.rollback()
+        _raise_not_owned(db, quiz_id, "You can only delete quizzes you have created.")
     db.commit()
     return
\ No newline at end of file
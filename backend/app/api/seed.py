@@ -5,15 +5,18 @@ Access at: POST /api/seed/populate
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import delete, insert, select, text
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import random
+import threading
 
 from app.core.db import get_db
 from app.models.user import User
 from app.models.knowledge import KnowledgeSource, KnowledgeChunk
 from app.models.task import Task
 from app.models.query import Query, QueryResponse
+from app.models.seed_meta import SeedMeta
 from app.models.enums import (
     CategoryEnum,
     TaskTypeEnum,
@@ -26,9 +29,251 @@ from app.core.security import hash_password
 
 router = APIRouter(prefix="/seed", tags=["Seed Data"])
 
+# Bump when the payloads below change so existing databases pick up the
+# new rows on the next populate call
+SEED_VERSION = 1
+_SEED_NAME = "demo"
+
+# Static seed payloads, built once at import
+_USERS_DATA = (
+    {"email": "student@test.com", "full_name": "Test Student", "role": UserRole.STUDENT, "password": "student123"},
+    {"email": "ta@test.com", "full_name": "Test TA", "role": UserRole.TA, "password": "ta123"},
+    {"email": "instructor@test.com", "full_name": "Test Instructor", "role": UserRole.INSTRUCTOR, "password": "instructor123"},
+    {"email": "admin@test.com", "full_name": "Test Admin", "role": UserRole.ADMIN, "password": "admin123"}
+)
+
+_SEED_EMAILS = tuple(u["email"] for u in _USERS_DATA)
+
+_KNOWLEDGE_DATA = (
+    {
+        "title": "Introduction to Software Engineering",
+        "description": "Comprehensive guide to software engineering principles",
+        "content": "Software Engineering covers SDLC, design patterns, best practices, and quality assurance. Key topics include requirements analysis, system design, implementation strategies, testing methodologies, and deployment practices.",
+        "category": CategoryEnum.COURSES
+    },
+    {
+        "title": "Data Structures and Algorithms",
+        "description": "Essential data structures and algorithmic techniques",
+        "content": "Core concepts: Arrays, Linked Lists, Trees, Graphs, Hash Tables. Algorithms: Sorting (Quick, Merge, Heap), Searching (Binary, DFS, BFS), Dynamic Programming, Greedy Algorithms.",
+        "category": CategoryEnum.COURSES
+    },
+    {
+        "title": "Assignment 1: REST API Development",
+        "description": "Build a RESTful API using FastAPI",
+        "content": "Create a Library Management System API with CRUD operations, authentication, and testing. Requirements: Books endpoint, Users endpoint, Borrow/return functionality, Input validation, JWT authentication.",
+        "category": CategoryEnum.ASSIGNMENTS
+    },
+    {
+        "title": "Quiz: Object-Oriented Programming",
+        "description": "Test on OOP concepts",
+        "content": "Topics: Classes and Objects, Inheritance, Polymorphism, Encapsulation, Abstraction, SOLID principles. Format: 20 MCQs + 5 short answers. Time: 45 minutes.",
+        "category": CategoryEnum.QUIZZES
+    },
+    {
+        "title": "FAQ: Database Design",
+        "description": "Common questions about database normalization",
+        "content": "Q: What is normalization? A: Process of organizing data to reduce redundancy. Normal forms: 1NF, 2NF, 3NF, BCNF. Best practices: Define primary keys, use foreign keys, index frequently queried columns.",
+        "category": CategoryEnum.QUERIES
+    },
+    {
+        "title": "Graduate Program Admission Requirements",
+        "description": "Requirements for MS in Computer Science",
+        "content": "Requirements: Bachelor's degree in CS or related field, Min GPA 3.0, GRE scores (optional), Three letters of recommendation, Statement of Purpose. Deadline: January 15 for Fall admission.",
+        "category": CategoryEnum.ADMISSION
+    },
+    {
+        "title": "Technical Interview Preparation Guide",
+        "description": "Comprehensive interview prep guide",
+        "content": "Interview structure: Phone screen, coding rounds, system design, behavioral questions. Common topics: Arrays, Trees, Graphs, Dynamic Programming. Resources: LeetCode, HackerRank, Cracking the Coding Interview.",
+        "category": CategoryEnum.PLACEMENT
+    },
+    {
+        "title": "Python Programming Best Practices",
+        "description": "Guidelines for clean Python code",
+        "content": "Follow PEP 8 style guide. Use list comprehensions, context managers, generators, decorators. Write unit tests with pytest, aim for >80% coverage. Use type hints and docstrings.",
+        "category": CategoryEnum.COURSES
+    },
+    {
+        "title": "Agile Scrum Methodology",
+        "description": "Scrum framework for project management",
+        "content": "Roles: Product Owner, Scrum Master, Development Team. Events: Sprint Planning, Daily Standup, Sprint Review, Retrospective. Artifacts: Product Backlog, Sprint Backlog, Increment.",
+        "category": CategoryEnum.COURSES
+    },
+    {
+        "title": "Machine Learning Fundamentals",
+        "description": "Introduction to ML concepts and algorithms",
+        "content": "Supervised Learning: Linear Regression, Logistic Regression, Decision Trees, Random Forest. Unsupervised Learning: K-Means, PCA. Deep Learning: Neural Networks, CNN, RNN. Tools: scikit-learn, TensorFlow, PyTorch.",
+        "category": CategoryEnum.COURSES
+    }
+)
+
+_TASKS_DATA = (
+    {"task_type": TaskTypeEnum.REPORT_GENERATION.value, "status": TaskStatusEnum.COMPLETED.value},
+    {"task_type": TaskTypeEnum.DATA_PROCESSING.value, "status": TaskStatusEnum.IN_PROGRESS.value},
+    {"task_type": TaskTypeEnum.DATA_PROCESSING.value, "status": TaskStatusEnum.COMPLETED.value},
+    {"task_type": TaskTypeEnum.EMAIL.value, "status": TaskStatusEnum.PENDING.value},
+    {"task_type": TaskTypeEnum.DATA_PROCESSING.value, "status": TaskStatusEnum.FAILED.value, "error": "Connection timeout"}
+)
+
+_QUERIES_DATA = (
+    {
+        "title": "Help with Dijkstra complexity",
+        "description": "I implemented Dijkstra's algorithm using adjacency matrix and binary heap, but I'm getting O(n²) complexity. Is this expected for dense graphs? I thought using a heap would give me O((V+E)logV).",
+        "category": QueryCategory.TECHNICAL,
+        "priority": QueryPriority.MEDIUM,
+        "status": QueryStatus.OPEN,
+        "tags": ["algorithms", "graph-theory", "complexity"],
+        "days_ago": 0,
+        "responses": [
+            {
+                "user": "student",
+                "content": "I used adjacency matrix + binary heap and got O(n²). Is this expected for dense graphs?",
+                "minutes_ago": 45
+            },
+            {
+                "user": "ta",
+                "content": "Yes. With an adjacency matrix the edge scans dominate at O(n²). Use adjacency lists; on dense graphs, a Fibonacci heap won't help asymptotically versus array/heap implementations. Check that you don't relax edges already finalized. Expect O(n²) for matrix + array.",
+                "minutes_ago": 31
+            }
+        ]
+    },
+    {
+        "title": "Systems lab Docker error",
+        "description": "Docker build fails on ARM machine with error 'exec format error'. Running on M1 Mac. Works fine on Intel machines.",
+        "category": QueryCategory.TECHNICAL,
+        "priority": QueryPriority.HIGH,
+        "status": QueryStatus.RESOLVED,
+        "tags": ["docker", "systems", "ARM"],
+        "days_ago": 1,
+        "responses": [
+            {
+                "user": "student",
+                "content": "Docker build fails on ARM machine. Getting 'exec format error'",
+                "minutes_ago": 1440
+            },
+            {
+                "user": "ta",
+                "content": "Use --platform linux/amd64 flag in your Dockerfile FROM statement. Or use docker buildx for multi-platform builds.",
+                "minutes_ago": 1400,
+                "is_solution": True
+            }
+        ]
+    },
+    {
+        "title": "Office hour booking confirmation",
+        "description": "Want to confirm the location for Friday office hours. Is it still Room 301 or has it moved?",
+        "category": QueryCategory.GENERAL,
+        "priority": QueryPriority.LOW,
+        "status": QueryStatus.OPEN,
+        "tags": ["office-hours", "logistics"],
+        "days_ago": 1,
+        "responses": []
+    },
+    {
+        "title": "How to implement binary search tree?",
+        "description": "Confused about BST insert operation. Should I use recursion or iteration? How do I handle duplicate values?",
+        "category": QueryCategory.TECHNICAL,
+        "priority": QueryPriority.MEDIUM,
+        "status": QueryStatus.IN_PROGRESS,
+        "tags": ["data-structures", "BST", "trees"],
+        "days_ago": 2,
+        "responses": [
+            {
+                "user": "ta",
+                "content": "Both recursion and iteration work. Recursion is more elegant. For duplicates, you can either reject them or store count in node.",
+                "minutes_ago": 2800
+            }
+        ]
+    },
+    {
+        "title": "Assignment deadline extension",
+        "description": "Medical emergency in family. Need extension for Assignment 2. Can provide medical certificate.",
+        "category": QueryCategory.ASSIGNMENT,
+        "priority": QueryPriority.HIGH,
+        "status": QueryStatus.IN_PROGRESS,
+        "tags": ["deadline", "extension"],
+        "days_ago": 3,
+        "responses": [
+            {
+                "user": "instructor",
+                "content": "Please email me the medical certificate. Extension granted till next Monday.",
+                "minutes_ago": 4000
+            }
+        ]
+    },
+    {
+        "title": "Quiz results when?",
+        "description": "When will OOP quiz results be published? It's been a week since we took the quiz.",
+        "category": QueryCategory.EXAM,
+        "priority": QueryPriority.LOW,
+        "status": QueryStatus.RESOLVED,
+        "tags": ["quiz", "results"],
+        "days_ago": 5,
+        "responses": [
+            {
+                "user": "instructor",
+                "content": "Results will be published tomorrow. Sorry for the delay.",
+                "minutes_ago": 7000,
+                "is_solution": True
+            }
+        ]
+    },
+    {
+        "title": "PhD program requirements",
+        "description": "What are the prerequisites for PhD in AI? Do I need research experience?",
+        "category": QueryCategory.GENERAL,
+        "priority": QueryPriority.MEDIUM,
+        "status": QueryStatus.OPEN,
+        "tags": ["PhD", "admission", "AI"],
+        "days_ago": 7,
+        "responses": []
+    },
+    {
+        "title": "Interview prep resources",
+        "description": "Looking for resources to prepare for FAANG interviews. Any recommendations?",
+        "category": QueryCategory.GENERAL,
+        "priority": QueryPriority.MEDIUM,
+        "status": QueryStatus.RESOLVED,
+        "tags": ["interview", "FAANG", "placement"],
+        "days_ago": 10,
+        "responses": [
+            {
+                "user": "instructor",
+                "content": "Check out LeetCode, Cracking the Coding Interview, and System Design Interview books. Practice daily.",
+                "minutes_ago": 14000,
+                "is_solution": True
+            }
+        ]
+    }
+)
+
+_TEST_CREDENTIALS = {
+    "student": "student@test.com / student123",
+    "ta": "ta@test.com / ta123",
+    "instructor": "instructor@test.com / instructor123",
+    "admin": "admin@test.com / admin123"
+}
+
+# Concurrent populate calls would both pass the existence checks and then
+# collide on the same inserts, so seeding is serialized
+_seed_lock = threading.Lock()
+_SEED_ADVISORY_LOCK_KEY = 0x5EED
+
+# Argon2 hashes of the seed passwords, computed on first use and reused
+# by every later populate call
+_SEED_PASSWORD_HASHES = {}
+
+
+def _seed_password_hash(password: str) -> str:
+    """Return the cached hash for a seed password, hashing it once."""
+    hashed = _SEED_PASSWORD_HASHES.get(password)
+    if hashed is None:
+        hashed = _SEED_PASSWORD_HASHES[password] = hash_password(password)
+    return hashed
+
 
 @router.post("/populate")
-async def populate_database(db: Session = Depends(get_db)):
+def populate_database(db: Session = Depends(get_db)):
     """
     Populate database with mock data.
 
@@ -39,6 +284,8 @@ async def populate_database(db: Session = Depends(get_db)):
     - Sample queries
 
     **Warning**: This endpoint can be run multiple times but will skip existing data.
+    Once the current seed version has been applied, later calls return
+    without touching the data until the seed is cleared.
     """
 
     result = {
@@ -49,340 +296,173 @@ async def populate_database(db: Session = Depends(get_db)):
         "message": ""
     }
 
-    try:
-        # Create users
-        users_data = [
-            {"email": "student@test.com", "full_name": "Test Student", "role": UserRole.STUDENT, "password": "student123"},
-            {"email": "ta@test.com", "full_name": "Test TA", "role": UserRole.TA, "password": "ta123"},
-            {"email": "instructor@test.com", "full_name": "Test Instructor", "role": UserRole.INSTRUCTOR, "password": "instructor123"},
-            {"email": "admin@test.com", "full_name": "Test Admin", "role": UserRole.ADMIN, "password": "admin123"}
-        ]
+    with _seed_lock:
+        try:
+            if db.get_bind().dialect.name == "postgresql":
+                # Serialize seeding across worker processes too; released at commit
+                db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SEED_ADVISORY_LOCK_KEY})
+
+            applied_version = db.query(SeedMeta.version).filter(
+                SeedMeta.name == _SEED_NAME
+            ).scalar()
+            # The marker alone can outlive the rows it describes (e.g. users
+            # removed by hand), so the seed users must still be there too
+            seed_user_count = db.query(User.id).filter(User.email.in_(_SEED_EMAILS)).count()
+            if applied_version == SEED_VERSION and seed_user_count == len(_SEED_EMAILS):
+                result["message"] = "Database already seeded"
+                result["test_credentials"] = _TEST_CREDENTIALS
+                return result
+
+            # One timestamp for the whole seed; rows are offset from it
+            now = datetime.utcnow()
+
+            # Create users
+            existing_users = {
+                user.email: user
+                for user in db.query(User).filter(
+                    User.email.in_(_SEED_EMAILS)
+                )
+            }
 
-        created_users = {}
-        for user_data in users_data:
-            existing = db.query(User).filter(User.email == user_data["email"]).first()
-            if not existing:
-                user = User(
+            new_users = [
+                User(
                     email=user_data["email"],
                     full_name=user_data["full_name"],
                     role=user_data["role"],
-                    password=hash_password(user_data["password"]),
+                    password=_seed_password_hash(user_data["password"]),
                     is_active=True
                 )
-                db.add(user)
-                db.flush()
-                created_users[user_data["role"].value] = user
-                result["users_created"] += 1
-            else:
-                created_users[user_data["role"].value] = existing
-
-        # Create knowledge sources
-        knowledge_data = [
-            {
-                "title": "Introduction to Software Engineering",
-                "description": "Comprehensive guide to software engineering principles",
-                "content": "Software Engineering covers SDLC, design patterns, best practices, and quality assurance. Key topics include requirements analysis, system design, implementation strategies, testing methodologies, and deployment practices.",
-                "category": CategoryEnum.COURSES
-            },
-            {
-                "title": "Data Structures and Algorithms",
-                "description": "Essential data structures and algorithmic techniques",
-                "content": "Core concepts: Arrays, Linked Lists, Trees, Graphs, Hash Tables. Algorithms: Sorting (Quick, Merge, Heap), Searching (Binary, DFS, BFS), Dynamic Programming, Greedy Algorithms.",
-                "category": CategoryEnum.COURSES
-            },
-            {
-                "title": "Assignment 1: REST API Development",
-                "description": "Build a RESTful API using FastAPI",
-                "content": "Create a Library Management System API with CRUD operations, authentication, and testing. Requirements: Books endpoint, Users endpoint, Borrow/return functionality, Input validation, JWT authentication.",
-                "category": CategoryEnum.ASSIGNMENTS
-            },
-            {
-                "title": "Quiz: Object-Oriented Programming",
-                "description": "Test on OOP concepts",
-                "content": "Topics: Classes and Objects, Inheritance, Polymorphism, Encapsulation, Abstraction, SOLID principles. Format: 20 MCQs + 5 short answers. Time: 45 minutes.",
-                "category": CategoryEnum.QUIZZES
-            },
-            {
-                "title": "FAQ: Database Design",
-                "description": "Common questions about database normalization",
-                "content": "Q: What is normalization? A: Process of organizing data to reduce redundancy. Normal forms: 1NF, 2NF, 3NF, BCNF. Best practices: Define primary keys, use foreign keys, index frequently queried columns.",
-                "category": CategoryEnum.QUERIES
-            },
-            {
-                "title": "Graduate Program Admission Requirements",
-                "description": "Requirements for MS in Computer Science",
-                "content": "Requirements: Bachelor's degree in CS or related field, Min GPA 3.0, GRE scores (optional), Three letters of recommendation, Statement of Purpose. Deadline: January 15 for Fall admission.",
-                "category": CategoryEnum.ADMISSION
-            },
-            {
-                "title": "Technical Interview Preparation Guide",
-                "description": "Comprehensive interview prep guide",
-                "content": "Interview structure: Phone screen, coding rounds, system design, behavioral questions. Common topics: Arrays, Trees, Graphs, Dynamic Programming. Resources: LeetCode, HackerRank, Cracking the Coding Interview.",
-                "category": CategoryEnum.PLACEMENT
-            },
-            {
-                "title": "Python Programming Best Practices",
-                "description": "Guidelines for clean Python code",
-                "content": "Follow PEP 8 style guide. Use list comprehensions, context managers, generators, decorators. Write unit tests with pytest, aim for >80% coverage. Use type hints and docstrings.",
-                "category": CategoryEnum.COURSES
-            },
-            {
-                "title": "Agile Scrum Methodology",
-                "description": "Scrum framework for project management",
-                "content": "Roles: Product Owner, Scrum Master, Development Team. Events: Sprint Planning, Daily Standup, Sprint Review, Retrospective. Artifacts: Product Backlog, Sprint Backlog, Increment.",
-                "category": CategoryEnum.COURSES
-            },
-            {
-                "title": "Machine Learning Fundamentals",
-                "description": "Introduction to ML concepts and algorithms",
-                "content": "Supervised Learning: Linear Regression, Logistic Regression, Decision Trees, Random Forest. Unsupervised Learning: K-Means, PCA. Deep Learning: Neural Networks, CNN, RNN. Tools: scikit-learn, TensorFlow, PyTorch.",
-                "category": CategoryEnum.COURSES
+                for user_data in _USERS_DATA
+                if user_data["email"] not in existing_users
+            ]
+            db.add_all(new_users)
+            db.flush()  # Assign ids to all new users at once
+            result["users_created"] = len(new_users)
+
+            users_by_email = {**existing_users, **{user.email: user for user in new_users}}
+            created_users = {
+                user_data["role"].value: users_by_email[user_data["email"]]
+                for user_data in _USERS_DATA
             }
-        ]
 
-        for data in knowledge_data:
-            existing = db.query(KnowledgeSource).filter(
-                KnowledgeSource.title == data["title"]
-            ).first()
-
-            if not existing:
-                source = KnowledgeSource(
-                    title=data["title"],
-                    description=data["description"],
-                    content=data["content"],
-                    category=data["category"],
-                    is_active=True,
-                    chunk_count=1,  # Set chunk_count since we're creating 1 chunk
-                    created_at=datetime.utcnow()
-                )
-                db.add(source)
-                db.flush()
-
-                # Create a simple chunk
-                chunk = KnowledgeChunk(
-                    source_id=source.id,
-                    text=data["content"],
-                    index=0
+            # Create knowledge sources
+            existing_titles = {
+                title for (title,) in db.query(KnowledgeSource.title).filter(
+                    KnowledgeSource.title.in_([d["title"] for d in _KNOWLEDGE_DATA])
                 )
-                db.add(chunk)
-
-                result["knowledge_sources_created"] += 1
-
-        # Create tasks
-        tasks_data = [
-            {"task_type": TaskTypeEnum.REPORT_GENERATION.value, "status": TaskStatusEnum.COMPLETED.value},
-            {"task_type": TaskTypeEnum.DATA_PROCESSING.value, "status": TaskStatusEnum.IN_PROGRESS.value},
-            {"task_type": TaskTypeEnum.DATA_PROCESSING.value, "status": TaskStatusEnum.COMPLETED.value},
-            {"task_type": TaskTypeEnum.EMAIL.value, "status": TaskStatusEnum.PENDING.value},
-            {"task_type": TaskTypeEnum.DATA_PROCESSING.value, "status": TaskStatusEnum.FAILED.value, "error": "Connection timeout"}
-        ]
+            }
 
-        for data in tasks_data:
-            task = Task(
-                task_type=data["task_type"],
-                status=data["status"],
-                error_message=data.get("error"),
-                created_at=datetime.utcnow() - timedelta(days=random.randint(0, 7))
-            )
-            db.add(task)
-            result["tasks_created"] += 1
-
-        # Create queries and responses
-        student = created_users.get("student")
-        ta = created_users.get("ta")
-        instructor = created_users.get("instructor")
-
-        if student:
-            queries_data = [
-                {
-                    "title": "Help with Dijkstra complexity",
-                    "description": "I implemented Dijkstra's algorithm using adjacency matrix and binary heap, but I'm getting O(n²) complexity. Is this expected for dense graphs? I thought using a heap would give me O((V+E)logV).",
-                    "category": QueryCategory.TECHNICAL,
-                    "priority": QueryPriority.MEDIUM,
-                    "status": QueryStatus.OPEN,
-                    "tags": ["algorithms", "graph-theory", "complexity"],
-                    "days_ago": 0,
-                    "responses": [
-                        {
-                            "user": "student",
-                            "content": "I used adjacency matrix + binary heap and got O(n²). Is this expected for dense graphs?",
-                            "minutes_ago": 45
-                        },
-                        {
-                            "user": "ta",
-                            "content": "Yes. With an adjacency matrix the edge scans dominate at O(n²). Use adjacency lists; on dense graphs, a Fibonacci heap won't help asymptotically versus array/heap implementations. Check that you don't relax edges already finalized. Expect O(n²) for matrix + array.",
-                            "minutes_ago": 31
-                        }
-                    ]
-                },
-                {
-                    "title": "Systems lab Docker error",
-                    "description": "Docker build fails on ARM machine with error 'exec format error'. Running on M1 Mac. Works fine on Intel machines.",
-                    "category": QueryCategory.TECHNICAL,
-                    "priority": QueryPriority.HIGH,
-                    "status": QueryStatus.RESOLVED,
-                    "tags": ["docker", "systems", "ARM"],
-                    "days_ago": 1,
-                    "responses": [
-                        {
-                            "user": "student",
-                            "content": "Docker build fails on ARM machine. Getting 'exec format error'",
-                            "minutes_ago": 1440
-                        },
-                        {
-                            "user": "ta",
-                            "content": "Use --platform linux/amd64 flag in your Dockerfile FROM statement. Or use docker buildx for multi-platform builds.",
-                            "minutes_ago": 1400,
-                            "is_solution": True
-                        }
-                    ]
-                },
-                {
-                    "title": "Office hour booking confirmation",
-                    "description": "Want to confirm the location for Friday office hours. Is it still Room 301 or has it moved?",
-                    "category": QueryCategory.GENERAL,
-                    "priority": QueryPriority.LOW,
-                    "status": QueryStatus.OPEN,
-                    "tags": ["office-hours", "logistics"],
-                    "days_ago": 1,
-                    "responses": []
-                },
-                {
-                    "title": "How to implement binary search tree?",
-                    "description": "Confused about BST insert operation. Should I use recursion or iteration? How do I handle duplicate values?",
-                    "category": QueryCategory.TECHNICAL,
-                    "priority": QueryPriority.MEDIUM,
-                    "status": QueryStatus.IN_PROGRESS,
-                    "tags": ["data-structures", "BST", "trees"],
-                    "days_ago": 2,
-                    "responses": [
-                        {
-                            "user": "ta",
-                            "content": "Both recursion and iteration work. Recursion is more elegant. For duplicates, you can either reject them or store count in node.",
-                            "minutes_ago": 2800
-                        }
-                    ]
-                },
-                {
-                    "title": "Assignment deadline extension",
-                    "description": "Medical emergency in family. Need extension for Assignment 2. Can provide medical certificate.",
-                    "category": QueryCategory.ASSIGNMENT,
-                    "priority": QueryPriority.HIGH,
-                    "status": QueryStatus.IN_PROGRESS,
-                    "tags": ["deadline", "extension"],
-                    "days_ago": 3,
-                    "responses": [
-                        {
-                            "user": "instructor",
-                            "content": "Please email me the medical certificate. Extension granted till next Monday.",
-                            "minutes_ago": 4000
-                        }
-                    ]
-                },
-                {
-                    "title": "Quiz results when?",
-                    "description": "When will OOP quiz results be published? It's been a week since we took the quiz.",
-                    "category": QueryCategory.EXAM,
-                    "priority": QueryPriority.LOW,
-                    "status": QueryStatus.RESOLVED,
-                    "tags": ["quiz", "results"],
-                    "days_ago": 5,
-                    "responses": [
-                        {
-                            "user": "instructor",
-                            "content": "Results will be published tomorrow. Sorry for the delay.",
-                            "minutes_ago": 7000,
-                            "is_solution": True
-                        }
-                    ]
-                },
+            source_rows = [
                 {
-                    "title": "PhD program requirements",
-                    "description": "What are the prerequisites for PhD in AI? Do I need research experience?",
-                    "category": QueryCategory.GENERAL,
-                    "priority": QueryPriority.MEDIUM,
-                    "status": QueryStatus.OPEN,
-                    "tags": ["PhD", "admission", "AI"],
-                    "days_ago": 7,
-                    "responses": []
-                },
+                    "title": data["title"],
+                    "description": data["description"],
+                    "content": data["content"],
+                    "category": data["category"],
+                    "is_active": True,
+                    "chunk_count": 1,  # Set chunk_count since we're creating 1 chunk
+                    "created_at": now
+                }
+                for data in _KNOWLEDGE_DATA
+                if data["title"] not in existing_titles
+            ]
+            result["knowledge_sources_created"] = len(source_rows)
+
+            if source_rows:
+                # One multi-row INSERT that hands back the generated ids
+                new_sources = db.execute(
+                    insert(KnowledgeSource).returning(KnowledgeSource.id, KnowledgeSource.content),
+                    source_rows
+                ).all()
+
+                # One chunk per new source
+                KnowledgeChunk.bulk_insert(db, (
+                    {"source_id": source_id, "text": content, "index": 0}
+                    for source_id, content in new_sources
+                ))
+
+            # Create tasks
+            task_day_offsets = random.choices(range(8), k=len(_TASKS_DATA))
+            task_rows = [
                 {
-                    "title": "Interview prep resources",
-                    "description": "Looking for resources to prepare for FAANG interviews. Any recommendations?",
-                    "category": QueryCategory.GENERAL,
-                    "priority": QueryPriority.MEDIUM,
-                    "status": QueryStatus.RESOLVED,
-                    "tags": ["interview", "FAANG", "placement"],
-                    "days_ago": 10,
-                    "responses": [
-                        {
-                            "user": "instructor",
-                            "content": "Check out LeetCode, Cracking the Coding Interview, and System Design Interview books. Practice daily.",
-                            "minutes_ago": 14000,
-                            "is_solution": True
-                        }
-                    ]
+                    "task_type": data["task_type"],
+                    "status": data["status"],
+                    "error_message": data.get("error"),
+                    "created_at": now - timedelta(days=days_ago)
                 }
+                for data, days_ago in zip(_TASKS_DATA, task_day_offsets)
             ]
+            db.bulk_insert_mappings(Task, task_rows)
+            result["tasks_created"] = len(task_rows)
+
+            # Create queries and responses
+            student = created_users.get("student")
+            responder_by_role = {
+                "student": student,
+                "ta": created_users.get("ta"),
+                "instructor": created_users.get("instructor"),
+            }
 
-            for data in queries_data:
-                existing = db.query(Query).filter(Query.title == data["title"]).first()
-                if not existing:
-                    # Create query
-                    query = Query(
-                        title=data["title"],
-                        description=data["description"],
-                        category=data["category"],
-                        priority=data["priority"],
-                        status=data["status"],
-                        tags=data.get("tags", []),
-                        student_id=student.id,
-                        created_at=datetime.utcnow() - timedelta(days=data.get("days_ago", 0))
+            if student:
+                existing_query_titles = {
+                    title for (title,) in db.query(Query.title).filter(
+                        Query.title.in_([d["title"] for d in _QUERIES_DATA])
                     )
-                    db.add(query)
-                    db.flush()  # Get query.id
-
-                    # Create responses
-                    for resp_data in data.get("responses", []):
-                        responder = None
-                        if resp_data["user"] == "student":
-                            responder = student
-                        elif resp_data["user"] == "ta":
-                            responder = ta
-                        elif resp_data["user"] == "instructor":
-                            responder = instructor
-
-                        if responder:
-                            response = QueryResponse(
-                                query_id=query.id,
-                                user_id=responder.id,
-                                content=resp_data["content"],
-                                is_solution=resp_data.get("is_solution", False),
-                                created_at=datetime.utcnow() - timedelta(minutes=resp_data.get("minutes_ago", 0))
-                            )
-                            db.add(response)
-
-                    result["queries_created"] += 1
-
-        db.commit()
-
-        result["message"] = "Database populated successfully!"
-        result["test_credentials"] = {
-            "student": "student@test.com / student123",
-            "ta": "ta@test.com / ta123",
-            "instructor": "instructor@test.com / instructor123",
-            "admin": "admin@test.com / admin123"
-        }
-
-        return result
+                }
 
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error seeding database: {str(e)}")
+                query_rows = [
+                    {
+                        "title": data["title"],
+                        "description": data["description"],
+                        "category": data["category"],
+                        "priority": data["priority"],
+                        "status": data["status"],
+                        "tags": data.get("tags", []),
+                        "student_id": student.id,
+                        "created_at": now - timedelta(days=data.get("days_ago", 0))
+                    }
+                    for data in _QUERIES_DATA
+                    if data["title"] not in existing_query_titles
+                ]
+                result["queries_created"] = len(query_rows)
+
+                title_to_qid = {}
+                if query_rows:
+                    title_to_qid = dict(db.execute(
+                        insert(Query).returning(Query.title, Query.id),
+                        query_rows
+                    ).all())
+
+                # Create responses for every new query in one pass
+                response_rows = [
+                    {
+                        "query_id": title_to_qid[data["title"]],
+                        "user_id": responder_by_role[resp_data["user"]].id,
+                        "content": resp_data["content"],
+                        "is_solution": resp_data.get("is_solution", False),
+                        "created_at": now - timedelta(minutes=resp_data.get("minutes_ago", 0))
+                    }
+                    for data in _QUERIES_DATA
+                    if data["title"] in title_to_qid
+                    for resp_data in data.get("responses", [])
+                    if responder_by_role.get(resp_data["user"])
+                ]
+                db.bulk_insert_mappings(QueryResponse, response_rows)
+
+            db.merge(SeedMeta(name=_SEED_NAME, version=SEED_VERSION))
+            db.commit()
+
+            result["message"] = "Database populated successfully!"
+            result["test_credentials"] = _TEST_CREDENTIALS
+
+            return result
+
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=500, detail=f"Error seeding database: {str(e)}")
 
 
 @router.delete("/clear")
-async def clear_seed_data(db: Session = Depends(get_db)):
+def clear_seed_data(db: Session = Depends(get_db)):
     """
     Clear all seed data from database.
 
@@ -390,26 +470,27 @@ async def clear_seed_data(db: Session = Depends(get_db)):
     Test users will remain.
     """
     try:
-        # Delete in correct order to respect foreign keys
-        db.query(KnowledgeChunk).delete()
-        db.query(KnowledgeSource).delete()
-        db.query(Task).delete()
-
-        # Delete test queries and responses
-        test_emails = ["student@test.com", "ta@test.com", "instructor@test.com", "admin@test.com"]
-        test_users = db.query(User).filter(User.email.in_(test_emails)).all()
-        test_user_ids = [u.id for u in test_users]
-
-        # Get all test queries
-        test_queries = db.query(Query).filter(Query.student_id.in_(test_user_ids)).all()
-        test_query_ids = [q.id for q in test_queries]
-
-        # Delete query responses first (foreign key constraint)
-        if test_query_ids:
-            db.query(QueryResponse).filter(QueryResponse.query_id.in_(test_query_ids)).delete(synchronize_session=False)
-
-        # Then delete queries
-        db.query(Query).filter(Query.student_id.in_(test_user_ids)).delete(synchronize_session=False)
+        # Children before parents, to respect foreign key constraints
+        db.execute(delete(Task))
+        db.execute(delete(KnowledgeChunk))
+        db.execute(delete(KnowledgeSource))
+
+        # Let the next populate call seed again
+        db.execute(delete(SeedMeta).where(SeedMeta.name == _SEED_NAME))
+
+        # Delete test queries and their responses in server-side statements
+        test_user_ids = select(User.id).where(User.email.in_(_SEED_EMAILS)).scalar_subquery()
+        test_query_ids = select(Query.id).where(Query.student_id.in_(test_user_ids)).scalar_subquery()
+        db.execute(
+            delete(QueryResponse)
+            .where(QueryResponse.query_id.in_(test_query_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(Query)
+            .where(Query.student_id.in_(test_user_ids))
+            .execution_options(synchronize_session=False)
+        )
 
         db.commit()
 
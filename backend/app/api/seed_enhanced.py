@@ -5,9 +5,14 @@ Access at: POST /api/seed/populate-enhanced
 """
 
 from fastapi import APIRouter, Depends
+from sqlalchemy import insert, select, text
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
+import json
 import random
+from typing import NamedTuple, Optional
+
+import numpy as np
 
 from app.core.db import get_db
 from app.models.user import User
@@ -15,6 +20,7 @@ from app.models.knowledge import KnowledgeSource, KnowledgeChunk
 from app.models.task import Task
 from app.models.query import Query, QueryResponse
 from app.models.chat_session import ChatSession
+from app.models.seed_meta import SeedMeta
 from app.models.enums import CategoryEnum, TaskTypeEnum, TaskStatusEnum
 from app.schemas.user_schema import UserRole
 from app.schemas.query_schema import QueryStatus, QueryCategory, QueryPriority
@@ -24,8 +30,48 @@ from app.core.security import hash_password
 router = APIRouter(prefix="/seed", tags=["Seed Data"])
 
 
+class _TaskSpec(NamedTuple):
+    """A seed task; progress and error default for tasks that have neither."""
+    name: str
+    description: str
+    task_type: TaskTypeEnum
+    status: TaskStatusEnum
+    progress: int = 0
+    error: Optional[str] = None
+
+
+# Filler appended to each knowledge source description to form its content
+_SOURCE_CONTENT_SUFFIX = ". This is comprehensive material covering key concepts, examples, and best practices. "
+
+_CHAT_TOPICS = ("assignments", "exams", "concepts", "debugging")
+
+_HOUR = 3600
+_DAY = 24 * _HOUR
+
+
+def _random_past_times(now, count, min_seconds, max_seconds):
+    """Return `count` datetimes between min_seconds and max_seconds before now, drawn in one numpy call."""
+    offsets = np.random.randint(min_seconds, max_seconds + 1, size=count).astype("timedelta64[s]")
+    return (np.datetime64(now, "us") - offsets).tolist()
+
+
+def _query_row(template, student_id, status, tag, created_at):
+    """Build a Query insert mapping from a (title, description, category, priority) template."""
+    title, description, category, priority = template
+    return {
+        "title": title,
+        "description": description,
+        "category": category,
+        "priority": priority,
+        "status": status,
+        "student_id": student_id,
+        "tags": [category.value, tag],
+        "created_at": created_at
+    }
+
+
 @router.post("/populate-enhanced")
-async def populate_enhanced_database(db: Session = Depends(get_db)):
+def populate_enhanced_database(db: Session = Depends(get_db)):
     """
     Populate database with comprehensive mock data for analytics testing.
 
@@ -49,277 +95,335 @@ async def populate_enhanced_database(db: Session = Depends(get_db)):
         "tasks_created": 0
     }
 
-    # Create diverse users
-    users_data = [
-        # Core test users
-        {"email": "admin@test.com", "full_name": "Admin User", "role": UserRole.ADMIN, "password": "admin123"},
-        {"email": "instructor@test.com", "full_name": "Dr. Sarah Johnson", "role": UserRole.INSTRUCTOR, "password": "instructor123"},
-
-        # TAs
-        {"email": "ta1@test.com", "full_name": "Alex Chen", "role": UserRole.TA, "password": "ta123"},
-        {"email": "ta2@test.com", "full_name": "Maria Garcia", "role": UserRole.TA, "password": "ta123"},
-        {"email": "ta3@test.com", "full_name": "David Kim", "role": UserRole.TA, "password": "ta123"},
-
-        # Students
-        {"email": "student1@test.com", "full_name": "Emma Wilson", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student2@test.com", "full_name": "Michael Brown", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student3@test.com", "full_name": "Sophia Taylor", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student4@test.com", "full_name": "James Anderson", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student5@test.com", "full_name": "Olivia Martinez", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student6@test.com", "full_name": "William Thomas", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student7@test.com", "full_name": "Ava Jackson", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student8@test.com", "full_name": "Noah White", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student9@test.com", "full_name": "Isabella Harris", "role": UserRole.STUDENT, "password": "student123"},
-        {"email": "student10@test.com", "full_name": "Lucas Martin", "role": UserRole.STUDENT, "password": "student123"},
-    ]
-
-    created_users = []
-    for user_data in users_data:
-        existing = db.query(User).filter(User.email == user_data["email"]).first()
-        if not existing:
-            # Create user with varied creation dates
-            days_ago = random.randint(30, 180)
-            user = User(
-                email=user_data["email"],
-                full_name=user_data["full_name"],
-                role=user_data["role"],
-                password=hash_password(user_data["password"]),
-                is_active=True,
-                created_at=datetime.utcnow() - timedelta(days=days_ago)
+    # One explicit transaction for the whole seed (a SAVEPOINT if the
+    # session already has one open); nothing is flushed until the end
+    transaction = db.begin_nested() if db.in_transaction() else db.begin()
+    with db.no_autoflush, transaction:
+        # One timestamp for the whole seed; created_at values are offset from it
+        now = datetime.utcnow()
+
+        # Create diverse users
+        users_data = [
+            # Core test users
+            {"email": "admin@test.com", "full_name": "Admin User", "role": UserRole.ADMIN, "password": "admin123"},
+            {"email": "instructor@test.com", "full_name": "Dr. Sarah Johnson", "role": UserRole.INSTRUCTOR, "password": "instructor123"},
+
+            # TAs
+            {"email": "ta1@test.com", "full_name": "Alex Chen", "role": UserRole.TA, "password": "ta123"},
+            {"email": "ta2@test.com", "full_name": "Maria Garcia", "role": UserRole.TA, "password": "ta123"},
+            {"email": "ta3@test.com", "full_name": "David Kim", "role": UserRole.TA, "password": "ta123"},
+
+            # Students
+            {"email": "student1@test.com", "full_name": "Emma Wilson", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student2@test.com", "full_name": "Michael Brown", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student3@test.com", "full_name": "Sophia Taylor", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student4@test.com", "full_name": "James Anderson", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student5@test.com", "full_name": "Olivia Martinez", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student6@test.com", "full_name": "William Thomas", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student7@test.com", "full_name": "Ava Jackson", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student8@test.com", "full_name": "Noah White", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student9@test.com", "full_name": "Isabella Harris", "role": UserRole.STUDENT, "password": "student123"},
+            {"email": "student10@test.com", "full_name": "Lucas Martin", "role": UserRole.STUDENT, "password": "student123"},
+        ]
+
+        seed_emails = [u["email"] for u in users_data]
+        existing_emails = set(db.scalars(select(User.email).where(User.email.in_(seed_emails))))
+
+        missing_users = [u for u in users_data if u["email"] not in existing_emails]
+        # Seed users share a handful of passwords; hash each one once, and
+        # only when there are users left to create
+        hashed_passwords = {
+            password: hash_password(password)
+            for password in {u["password"] for u in missing_users}
+        }
+
+        # Create users with varied creation dates
+        user_rows = [
+            {
+                "email": user_data["email"],
+                "full_name": user_data["full_name"],
+                "role": user_data["role"],
+                "password": hashed_passwords[user_data["password"]],
+                "is_active": True,
+                "created_at": created_at
+            }
+            for user_data, created_at in zip(
+                missing_users, _random_past_times(now, len(missing_users), 30 * _DAY, 180 * _DAY)
             )
-            db.add(user)
-            db.flush()
-            created_users.append(user)
-            result["users_created"] += 1
-        else:
-            created_users.append(existing)
-
-    # Get users by role for easier access
-    students = [u for u in created_users if u.role == UserRole.STUDENT]
-    tas = [u for u in created_users if u.role == UserRole.TA]
-    instructors = [u for u in created_users if u.role == UserRole.INSTRUCTOR]
-
-    # Create diverse queries with realistic patterns
-    query_templates = [
-        # Technical queries
-        ("How to implement binary search tree?", "I'm trying to implement a self-balancing BST but struggling with rotations", QueryCategory.TECHNICAL, QueryPriority.MEDIUM),
-        ("Docker container won't start", "Getting 'port already allocated' error", QueryCategory.TECHNICAL, QueryPriority.HIGH),
-        ("Git merge conflict help", "Stuck on merge conflict in main.py", QueryCategory.TECHNICAL, QueryPriority.HIGH),
-        ("SQL query optimization", "My JOIN query is taking 30+ seconds", QueryCategory.TECHNICAL, QueryPriority.MEDIUM),
-        ("Memory leak in Python", "Process memory keeps growing, suspect circular references", QueryCategory.TECHNICAL, QueryPriority.HIGH),
-
-        # Assignment queries
-        ("Assignment 2 deadline extension?", "Need a few more days due to medical issue", QueryCategory.ASSIGNMENTS, QueryPriority.MEDIUM),
-        ("Clarification on Assignment 3 requirements", "Do we need to implement caching?", QueryCategory.ASSIGNMENTS, QueryPriority.LOW),
-        ("Assignment submission format", "Should I submit as ZIP or GitHub repo?", QueryCategory.ASSIGNMENTS, QueryPriority.LOW),
-        ("Test cases for Assignment 1", "Are we provided test cases or write our own?", QueryCategory.ASSIGNMENTS, QueryPriority.MEDIUM),
-
-        # Course material queries
-        ("Can't access lecture videos", "Getting 403 error on course portal", QueryCategory.COURSES, QueryPriority.HIGH),
-        ("Difference between TCP and UDP?", "Need clarification from Week 5 lecture", QueryCategory.COURSES, QueryPriority.LOW),
-        ("Recommended books for data structures?", "Looking for supplementary reading", QueryCategory.COURSES, QueryPriority.LOW),
-        ("Week 7 quiz topics", "What chapters will be covered?", QueryCategory.COURSES, QueryPriority.MEDIUM),
-
-        # Exam queries
-        ("Exam date confirmation", "Is midterm on March 15 or 16?", QueryCategory.EXAMS, QueryPriority.HIGH),
-        ("Can we use notes during exam?", "Open book or closed book?", QueryCategory.EXAMS, QueryPriority.MEDIUM),
-        ("Exam venue location", "Which building and room number?", QueryCategory.EXAMS, QueryPriority.MEDIUM),
-
-        # General queries
-        ("Office hours this week?", "Will there be office hours on Friday?", QueryCategory.GENERAL, QueryPriority.LOW),
-        ("How to join course Slack?", "Need invite link", QueryCategory.GENERAL, QueryPriority.LOW),
-        ("Lab timings change?", "Heard labs moved to afternoons", QueryCategory.GENERAL, QueryPriority.LOW),
-    ]
-
-    # Duplicate some queries to create FAQs
-    frequent_queries = [
-        ("How do I submit my assignment?", "Where is the submission portal?", QueryCategory.ASSIGNMENTS, QueryPriority.LOW),
-        ("What is the deadline for project submission?", "Final project due date?", QueryCategory.ASSIGNMENTS, QueryPriority.MEDIUM),
-        ("Can I work in a group?", "Is group work allowed?", QueryCategory.ASSIGNMENTS, QueryPriority.LOW),
-        ("How to access course materials?", "Can't find lecture slides", QueryCategory.COURSES, QueryPriority.MEDIUM),
-    ]
-
-    # Create regular queries
-    for title, description, category, priority in query_templates * 2:  # Double the queries
-        student = random.choice(students)
-        days_ago = random.randint(0, 30)
-        hours_offset = random.randint(0, 23)
-
-        status = random.choices(
+        ]
+        result["users_created"] += len(user_rows)
+        if user_rows:
+            db.execute(insert(User), user_rows)
+
+        # Only seed user ids are needed for FK references; fetch them per role
+        def seed_user_ids(role):
+            return db.scalars(
+                select(User.id)
+                .where(User.role == role, User.email.in_(seed_emails))
+                .order_by(User.id)
+            ).all()
+
+        students = seed_user_ids(UserRole.STUDENT)
+        tas = seed_user_ids(UserRole.TA)
+
+        # Create diverse queries with realistic patterns
+        query_templates = [
+            # Technical queries
+            ("How to implement binary search tree?", "I'm trying to implement a self-balancing BST but struggling with rotations", QueryCategory.TECHNICAL, QueryPriority.MEDIUM),
+            ("Docker container won't start", "Getting 'port already allocated' error", QueryCategory.TECHNICAL, QueryPriority.HIGH),
+            ("Git merge conflict help", "Stuck on merge conflict in main.py", QueryCategory.TECHNICAL, QueryPriority.HIGH),
+            ("SQL query optimization", "My JOIN query is taking 30+ seconds", QueryCategory.TECHNICAL, QueryPriority.MEDIUM),
+            ("Memory leak in Python", "Process memory keeps growing, suspect circular references", QueryCategory.TECHNICAL, QueryPriority.HIGH),
+
+            # Assignment queries
+            ("Assignment 2 deadline extension?", "Need a few more days due to medical issue", QueryCategory.ASSIGNMENT, QueryPriority.MEDIUM),
+            ("Clarification on Assignment 3 requirements", "Do we need to implement caching?", QueryCategory.ASSIGNMENT, QueryPriority.LOW),
+            ("Assignment submission format", "Should I submit as ZIP or GitHub repo?", QueryCategory.ASSIGNMENT, QueryPriority.LOW),
+            ("Test cases for Assignment 1", "Are we provided test cases or write our own?", QueryCategory.ASSIGNMENT, QueryPriority.MEDIUM),
+
+            # Course material queries
+            ("Can't access lecture videos", "Getting 403 error on course portal", QueryCategory.COURSES, QueryPriority.HIGH),
+            ("Difference between TCP and UDP?", "Need clarification from Week 5 lecture", QueryCategory.COURSES, QueryPriority.LOW),
+            ("Recommended books for data structures?", "Looking for supplementary reading", QueryCategory.COURSES, QueryPriority.LOW),
+            ("Week 7 quiz topics", "What chapters will be covered?", QueryCategory.COURSES, QueryPriority.MEDIUM),
+
+            # Exam queries
+            ("Exam date confirmation", "Is midterm on March 15 or 16?", QueryCategory.EXAM, QueryPriority.HIGH),
+            ("Can we use notes during exam?", "Open book or closed book?", QueryCategory.EXAM, QueryPriority.MEDIUM),
+            ("Exam venue location", "Which building and room number?", QueryCategory.EXAM, QueryPriority.MEDIUM),
+
+            # General queries
+            ("Office hours this week?", "Will there be office hours on Friday?", QueryCategory.GENERAL, QueryPriority.LOW),
+            ("How to join course Slack?", "Need invite link", QueryCategory.GENERAL, QueryPriority.LOW),
+            ("Lab timings change?", "Heard labs moved to afternoons", QueryCategory.GENERAL, QueryPriority.LOW),
+        ]
+
+        # Duplicate some queries to create FAQs
+        frequent_queries = [
+            ("How do I submit my assignment?", "Where is the submission portal?", QueryCategory.ASSIGNMENT, QueryPriority.LOW),
+            ("What is the deadline for project submission?", "Final project due date?", QueryCategory.ASSIGNMENT, QueryPriority.MEDIUM),
+            ("Can I work in a group?", "Is group work allowed?", QueryCategory.ASSIGNMENT, QueryPriority.LOW),
+            ("How to access course materials?", "Can't find lecture slides", QueryCategory.COURSES, QueryPriority.MEDIUM),
+        ]
+
+        # Create regular queries (each template twice); per-row random
+        # picks are drawn up front, one random.choices call each
+        query_count = 2 * len(query_templates)
+        query_times = _random_past_times(now, query_count, 0, 30 * _DAY + 23 * _HOUR)
+        query_students = random.choices(students, k=query_count)
+        query_statuses = random.choices(
             [QueryStatus.OPEN, QueryStatus.IN_PROGRESS, QueryStatus.RESOLVED, QueryStatus.CLOSED],
-            weights=[20, 15, 50, 15]  # More resolved queries
-        )[0]
-
-        query = Query(
-            title=title,
-            description=description,
-            category=category.value,
-            priority=priority.value,
-            status=status,
-            student_id=student.id,
-            tags=f"{category.value.lower()},help",
-            created_at=datetime.utcnow() - timedelta(days=days_ago, hours=hours_offset)
+            weights=[20, 15, 50, 15],  # More resolved queries
+            k=query_count
         )
-        db.add(query)
-        db.flush()
-        result["queries_created"] += 1
-
-        # Add responses to some queries
-        if status in [QueryStatus.IN_PROGRESS, QueryStatus.RESOLVED, QueryStatus.CLOSED]:
-            # TA response
-            ta = random.choice(tas) if tas else student
-            response = QueryResponse(
-                query_id=query.id,
-                user_id=ta.id,
-                content="I'm looking into this. Can you provide more details about your setup?",
-                created_at=query.created_at + timedelta(hours=random.randint(1, 12))
+        query_rows = [
+            _query_row(template, student_id=student_id, status=status, tag="help", created_at=created_at)
+            for template, student_id, status, created_at in zip(
+                (template for _ in range(2) for template in query_templates),
+                query_students, query_statuses, query_times
             )
-            db.add(response)
-            result["responses_created"] += 1
-
-            # Solution if resolved
-            if status in [QueryStatus.RESOLVED, QueryStatus.CLOSED]:
-                solution = QueryResponse(
-                    query_id=query.id,
-                    user_id=ta.id,
-                    content="Here's the solution: " + random.choice([
-                        "You need to update your configuration file.",
-                        "Try reinstalling the dependencies.",
-                        "This is a known issue, here's the workaround.",
-                        "Please refer to the documentation section 4.2",
-                        "I've uploaded the corrected version to the course portal."
-                    ]),
-                    is_solution=True,
-                    created_at=query.created_at + timedelta(hours=random.randint(13, 48))
-                )
-                db.add(solution)
-                result["responses_created"] += 1
-
-    # Create FAQ pattern (same questions multiple times)
-    for title, description, category, priority in frequent_queries:
-        for _ in range(random.randint(5, 12)):  # Each FAQ asked 5-12 times
-            student = random.choice(students)
-            days_ago = random.randint(0, 30)
-
-            query = Query(
-                title=title,
-                description=description,
-                category=category.value,
-                priority=priority.value,
+        ]
+        result["queries_created"] += len(query_rows)
+
+        # Create FAQ pattern (same questions multiple times)
+        faq_templates = [
+            template
+            for template in frequent_queries
+            for _ in range(random.randint(5, 12))  # Each FAQ asked 5-12 times
+        ]
+        faq_rows = [
+            _query_row(
+                template,
+                student_id=student_id,
                 status=QueryStatus.RESOLVED,  # FAQs are usually resolved
-                student_id=student.id,
-                tags=f"{category.value.lower()},faq",
-                created_at=datetime.utcnow() - timedelta(days=days_ago)
+                tag="faq",
+                created_at=created_at
             )
-            db.add(query)
-            db.flush()
-            result["queries_created"] += 1
-
-            # Add standard FAQ response
-            ta = random.choice(tas) if tas else student
-            response = QueryResponse(
-                query_id=query.id,
-                user_id=ta.id,
-                content="This is a frequently asked question. Please check the course FAQ page for detailed instructions.",
-                is_solution=True,
-                created_at=query.created_at + timedelta(hours=random.randint(1, 6))
+            for template, student_id, created_at in zip(
+                faq_templates,
+                random.choices(students, k=len(faq_templates)),
+                _random_past_times(now, len(faq_templates), 0, 30 * _DAY)
             )
-            db.add(response)
-            result["responses_created"] += 1
+        ]
+        result["queries_created"] += len(faq_rows)
+
+        # Insert regular and FAQ queries together; ids come back in parameter order
+        query_ids = db.scalars(
+            insert(Query).returning(Query.id, sort_by_parameter_order=True),
+            query_rows + faq_rows
+        ).all()
+        regular_ids, faq_ids = query_ids[:len(query_rows)], query_ids[len(query_rows):]
+
+        # One responding TA per query, falling back to the asking student
+        responder_ids = (
+            random.choices(tas, k=len(query_ids)) if tas
+            else [query["student_id"] for query in query_rows + faq_rows]
+        )
+        regular_responders, faq_responders = responder_ids[:len(query_rows)], responder_ids[len(query_rows):]
 
-    # Create knowledge sources
-    knowledge_sources = [
-        ("Python Programming Basics", "Introduction to Python syntax and concepts", CategoryEnum.COURSES),
-        ("Advanced Data Structures", "Trees, Graphs, Heaps, and Hash Tables", CategoryEnum.COURSES),
-        ("Database Design Principles", "Normalization and optimization techniques", CategoryEnum.COURSES),
-        ("Web Development with FastAPI", "Building RESTful APIs", CategoryEnum.COURSES),
-        ("Machine Learning Fundamentals", "Supervised and unsupervised learning", CategoryEnum.COURSES),
-        ("Assignment 1: Calculator App", "Build a command-line calculator", CategoryEnum.ASSIGNMENTS),
-        ("Assignment 2: Web Scraper", "Create a web scraping tool", CategoryEnum.ASSIGNMENTS),
-        ("Assignment 3: Database Project", "Design and implement a database", CategoryEnum.ASSIGNMENTS),
-        ("Midterm Exam Format", "What to expect in the midterm", CategoryEnum.EXAMS),
-        ("Final Project Guidelines", "Requirements and rubric", CategoryEnum.ASSIGNMENTS),
-        ("Course Syllabus", "Complete course outline and schedule", CategoryEnum.COURSES),
-        ("FAQ: Grading Policy", "How grades are calculated", CategoryEnum.QUERIES),
-        ("FAQ: Late Submission Policy", "Penalties and procedures", CategoryEnum.QUERIES),
-        ("System Architecture Overview", "Understanding the tech stack", CategoryEnum.COURSES),
-        ("Testing Best Practices", "Unit testing and integration testing", CategoryEnum.COURSES),
-    ]
-
-    for title, description, category in knowledge_sources:
-        existing = db.query(KnowledgeSource).filter(KnowledgeSource.title == title).first()
-        if not existing:
-            content = f"{description}. This is comprehensive material covering key concepts, examples, and best practices. " * 3
-
-            source = KnowledgeSource(
-                title=title,
-                description=description,
-                content=content,
-                category=category,
-                is_active=True,
-                created_at=datetime.utcnow() - timedelta(days=random.randint(10, 90))
-            )
-            db.add(source)
-            db.flush()
-
-            # Create chunk
-            chunk = KnowledgeChunk(
-                source_id=source.id,
-                text=content,
-                index=0
+        # Add responses to some queries
+        response_rows = []
+        for query, query_id, ta_id in zip(query_rows, regular_ids, regular_responders):
+            status = query["status"]
+            if status in [QueryStatus.IN_PROGRESS, QueryStatus.RESOLVED, QueryStatus.CLOSED]:
+                # TA response
+                response_rows.append({
+                    "query_id": query_id,
+                    "user_id": ta_id,
+                    "content": "I'm looking into this. Can you provide more details about your setup?",
+                    "created_at": query["created_at"] + timedelta(hours=random.randint(1, 12))
+                })
+                result["responses_created"] += 1
+
+                # Solution if resolved
+                if status in [QueryStatus.RESOLVED, QueryStatus.CLOSED]:
+                    response_rows.append({
+                        "query_id": query_id,
+                        "user_id": ta_id,
+                        "content": "Here's the solution: " + random.choice([
+                            "You need to update your configuration file.",
+                            "Try reinstalling the dependencies.",
+                            "This is a known issue, here's the workaround.",
+                            "Please refer to the documentation section 4.2",
+                            "I've uploaded the corrected version to the course portal."
+                        ]),
+                        "is_solution": True,
+                        "created_at": query["created_at"] + timedelta(hours=random.randint(13, 48))
+                    })
+                    result["responses_created"] += 1
+
+        # Add standard FAQ response
+        for query, query_id, ta_id in zip(faq_rows, faq_ids, faq_responders):
+            response_rows.append({
+                "query_id": query_id,
+                "user_id": ta_id,
+                "content": "This is a frequently asked question. Please check the course FAQ page for detailed instructions.",
+                "is_solution": True,
+                "created_at": query["created_at"] + timedelta(hours=random.randint(1, 6))
+            })
+            result["responses_created"] += 1
+        if response_rows:
+            db.execute(insert(QueryResponse), response_rows)
+
+        # Create knowledge sources
+        knowledge_sources = [
+            ("Python Programming Basics", "Introduction to Python syntax and concepts", CategoryEnum.COURSES),
+            ("Advanced Data Structures", "Trees, Graphs, Heaps, and Hash Tables", CategoryEnum.COURSES),
+            ("Database Design Principles", "Normalization and optimization techniques", CategoryEnum.COURSES),
+            ("Web Development with FastAPI", "Building RESTful APIs", CategoryEnum.COURSES),
+            ("Machine Learning Fundamentals", "Supervised and unsupervised learning", CategoryEnum.COURSES),
+            ("Assignment 1: Calculator App", "Build a command-line calculator", CategoryEnum.ASSIGNMENTS),
+            ("Assignment 2: Web Scraper", "Create a web scraping tool", CategoryEnum.ASSIGNMENTS),
+            ("Assignment 3: Database Project", "Design and implement a database", CategoryEnum.ASSIGNMENTS),
+            ("Midterm Exam Format", "What to expect in the midterm", CategoryEnum.QUIZZES),
+            ("Final Project Guidelines", "Requirements and rubric", CategoryEnum.ASSIGNMENTS),
+            ("Course Syllabus", "Complete course outline and schedule", CategoryEnum.COURSES),
+            ("FAQ: Grading Policy", "How grades are calculated", CategoryEnum.QUERIES),
+            ("FAQ: Late Submission Policy", "Penalties and procedures", CategoryEnum.QUERIES),
+            ("System Architecture Overview", "Understanding the tech stack", CategoryEnum.COURSES),
+            ("Testing Best Practices", "Unit testing and integration testing", CategoryEnum.COURSES),
+        ]
+
+        existing_titles = set(db.scalars(
+            select(KnowledgeSource.title).where(
+                KnowledgeSource.title.in_([title for title, _, _ in knowledge_sources])
             )
-            db.add(chunk)
-            result["knowledge_sources_created"] += 1
-
-    # Create chat sessions
-    for student in students[:8]:  # First 8 students have chat history
-        num_sessions = random.randint(2, 5)
-        for _ in range(num_sessions):
-            days_ago = random.randint(0, 30)
-            session = ChatSession(
-                user_id=student.id,
-                title=f"Chat session about {random.choice(['assignments', 'exams', 'concepts', 'debugging'])}",
-                created_at=datetime.utcnow() - timedelta(days=days_ago)
+        ))
+
+        missing_sources = [source for source in knowledge_sources if source[0] not in existing_titles]
+        source_rows = []
+        for (title, description, category), created_at in zip(
+            missing_sources, _random_past_times(now, len(missing_sources), 10 * _DAY, 90 * _DAY)
+        ):
+            content = (description + _SOURCE_CONTENT_SUFFIX) * 3
+
+            source_rows.append({
+                "title": title,
+                "description": description,
+                "content": content,
+                "category": category,
+                "is_active": True,
+                "chunk_count": 1,
+                "created_at": created_at
+            })
+        result["knowledge_sources_created"] += len(source_rows)
+        if source_rows:
+            # One multi-row INSERT that hands back the generated ids
+            new_sources = db.execute(
+                insert(KnowledgeSource).returning(
+                    KnowledgeSource.id, KnowledgeSource.content, sort_by_parameter_order=True
+                ),
+                source_rows
+            ).all()
+
+            # One chunk per new source
+            KnowledgeChunk.bulk_insert(db, (
+                {"source_id": source_id, "text": content, "index": 0}
+                for source_id, content in new_sources
+            ))
+
+        # Create chat sessions
+        # ChatSession has no user or title columns, so both go in its metadata
+        session_students = [
+            student_id
+            for student_id in students[:8]  # First 8 students have chat history
+            for _ in range(random.randint(2, 5))
+        ]
+        session_rows = [
+            {
+                "metadata_": {
+                    "user_id": student_id,
+                    "title": f"Chat session about {topic}"
+                },
+                "created_at": created_at
+            }
+            for student_id, topic, created_at in zip(
+                session_students,
+                random.choices(_CHAT_TOPICS, k=len(session_students)),
+                _random_past_times(now, len(session_students), 0, 30 * _DAY)
             )
-            db.add(session)
-            result["chat_sessions_created"] += 1
-
-    # Create diverse tasks
-    tasks_data = [
-        ("Weekly grade calculation", "Calculate student grades", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.COMPLETED),
-        ("Monthly performance report", "Generate analytics report", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.COMPLETED),
-        ("Process assignment submissions", "Batch process uploads", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
-        ("Index knowledge base", "Update search indices", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.IN_PROGRESS, 75),
-        ("Send deadline reminders", "Email notifications", TaskTypeEnum.EMAIL, TaskStatusEnum.COMPLETED),
-        ("Backup database", "Daily backup", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
-        ("Generate attendance report", "Weekly attendance", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.IN_PROGRESS, 50),
-        ("Clean up old sessions", "Remove expired data", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.PENDING),
-        ("Export course analytics", "Generate CSV reports", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.COMPLETED),
-        ("Update course materials", "Sync with repository", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.FAILED, 0, "Connection timeout"),
-        ("Process quiz submissions", "Grade quizzes", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
-        ("Send welcome emails", "New student onboarding", TaskTypeEnum.EMAIL, TaskStatusEnum.COMPLETED),
-        ("Archive old queries", "Clean up database", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.IN_PROGRESS, 30),
-        ("Generate completion certificates", "Create PDFs", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.PENDING),
-        ("Sync calendar events", "Update course calendar", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
-    ]
-
-    for task_data in tasks_data:
-        name, desc, task_type, status = task_data[:4]
-        progress = task_data[4] if len(task_data) > 4 else 0
-        error = task_data[5] if len(task_data) > 5 else None
-
-        task = Task(
-            name=name,
-            description=desc,
-            task_type=task_type,
-            status=status,
-            progress=progress,
-            error_message=error,
-            created_at=datetime.utcnow() - timedelta(days=random.randint(0, 14))
-        )
-        db.add(task)
-        result["tasks_created"] += 1
-
+        ]
+        result["chat_sessions_created"] += len(session_rows)
+        if session_rows:
+            db.execute(insert(ChatSession), session_rows)
+
+        # Create diverse tasks
+        tasks_data = [
+            _TaskSpec("Weekly grade calculation", "Calculate student grades", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Monthly performance report", "Generate analytics report", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Process assignment submissions", "Batch process uploads", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Index knowledge base", "Update search indices", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.IN_PROGRESS, 75),
+            _TaskSpec("Send deadline reminders", "Email notifications", TaskTypeEnum.EMAIL, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Backup database", "Daily backup", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Generate attendance report", "Weekly attendance", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.IN_PROGRESS, 50),
+            _TaskSpec("Clean up old sessions", "Remove expired data", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.PENDING),
+            _TaskSpec("Export course analytics", "Generate CSV reports", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Update course materials", "Sync with repository", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.FAILED, 0, "Connection timeout"),
+            _TaskSpec("Process quiz submissions", "Grade quizzes", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Send welcome emails", "New student onboarding", TaskTypeEnum.EMAIL, TaskStatusEnum.COMPLETED),
+            _TaskSpec("Archive old queries", "Clean up database", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.IN_PROGRESS, 30),
+            _TaskSpec("Generate completion certificates", "Create PDFs", TaskTypeEnum.REPORT_GENERATION, TaskStatusEnum.PENDING),
+            _TaskSpec("Sync calendar events", "Update course calendar", TaskTypeEnum.DATA_PROCESSING, TaskStatusEnum.COMPLETED),
+        ]
+
+        # Task has no name/description/progress columns; they go in its JSON metadata
+        task_rows = []
+        for task_data, created_at in zip(tasks_data, _random_past_times(now, len(tasks_data), 0, 14 * _DAY)):
+            task_rows.append({
+                "task_type": task_data.task_type.value,
+                "status": task_data.status.value,
+                "metadata_": json.dumps({
+                    "name": task_data.name,
+                    "description": task_data.description,
+                    "progress": task_data.progress
+                }),
+                "error_message": task_data.error,
+                "created_at": created_at
+            })
+        result["tasks_created"] += len(task_rows)
+        db.execute(insert(Task), task_rows)
+
+    # Commits the outer transaction when the seed ran in a SAVEPOINT
     db.commit()
 
     result["message"] = "Enhanced mock data created successfully"
@@ -334,22 +438,25 @@ async def populate_enhanced_database(db: Session = Depends(get_db)):
 
 
 @router.delete("/clear-all")
-async def clear_all_data(db: Session = Depends(get_db)):
+def clear_all_data(db: Session = Depends(get_db)):
     """
     Clear ALL data from database (use with caution!).
 
     **Warning**: This will delete everything including users!
     Only use in development/testing environments.
     """
+    # Children before parents, to respect foreign key constraints; the seed
+    # marker goes too so /seed/populate runs again on the empty database
+    models = (QueryResponse, Query, KnowledgeChunk, Task, KnowledgeSource, ChatSession, User, SeedMeta)
     try:
-        # Delete in correct order to respect foreign key constraints
-        db.query(QueryResponse).delete()
-        db.query(Query).delete()
-        db.query(KnowledgeChunk).delete()
-        db.query(KnowledgeSource).delete()
-        db.query(ChatSession).delete()
-        db.query(Task).delete()
-        db.query(User).delete()
+        if db.get_bind().dialect.name == "postgresql":
+            # One TRUNCATE empties every table without scanning rows; CASCADE
+            # also clears any other table that references these
+            tables = ", ".join(model.__table__.name for model in models)
+            db.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+        else:
+            for model in models:
+                db.query(model).delete()
 
         db.commit()
 
@@ -2,17 +2,20 @@
 API router for slide deck generation and management.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import hashlib
+from typing import BinaryIO, Iterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, with_expression
 
-from app.core.db import get_db
+from app.core.db import get_db, get_list_db
 from app.models.user import User
 from app.models.course import Course
 from app.models.slide_deck import SlideDeck
 from app.schemas.slide_deck_schema import (
-    SlideDeckGenerationRequest, SlideDeckUpdateRequest, SlideDeckResponse, SlideDeckPreview
+    SlideDeckGenerationRequest, SlideDeckUpdateRequest, SlideDeckResponse, SlideDeckPreview,
+    SlideDeckSummaryResponse
 )
 from app.api.dependencies import require_ta, require_authenticated
 from app.services.slide_deck_service import slide_deck_service
@@ -21,6 +24,31 @@ from app.services.pdf_export_service import export_to_pdf
 
 router = APIRouter()
 
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_file(file_buffer: BinaryIO, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield an export buffer in fixed-size chunks and close it once it has been sent."""
+    try:
+        file_buffer.seek(0)
+        yield from iter(lambda: file_buffer.read(chunk_size), b"")
+    finally:
+        file_buffer.close()
+
+
+def _check_deck_owner(db: Session, deck_id: int, current_user: User, action: str) -> None:
+    """
+    Raises 404 if the deck does not exist and 403 if current_user did not create it.
+    Only the creator id is read, so the slides JSON is never loaded for the check.
+    """
+    owner_id = db.execute(
+        select(SlideDeck.created_by_id).where(SlideDeck.id == deck_id)
+    ).scalar_one_or_none()
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="Slide deck not found")
+    if owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail=f"You can only {action} slide decks you have created.")
+
 
 @router.post(
     "/preview",
@@ -35,7 +63,7 @@ async def generate_slide_deck_preview(
     """
     Generates a preview outline of the slide deck before actual generation.
     """
-    course = db.query(Course).filter(Course.id == request.course_id).first()
+    course = db.get(Course, request.course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
@@ -72,7 +100,7 @@ async def generate_slide_deck(
     Generates a new slide deck using the AI service based on specified topics
     and saves it to the database.
     """
-    course = db.query(Course).filter(Course.id == request.course_id).first()
+    course = db.get(Course, request.course_id)
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
@@ -107,33 +135,71 @@ async def generate_slide_deck(
     return db_slide_deck
 
 
-@router.get("/", response_model=List[SlideDeckResponse], summary="List all slide decks")
+@router.get("/", response_model=List[SlideDeckSummaryResponse], summary="List all slide decks")
 def get_all_slide_decks(
     search: Optional[str] = Query(None, description="Search slide decks by title."),
+    prefix_only: bool = Query(False, description="Only match slide decks whose title starts with the search term."),
     course_id: Optional[int] = Query(None, description="Filter slide decks by course ID."),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_list_db),
     _: User = Depends(require_authenticated),
 ):
     """
     Retrieves a list of all available slide decks, accessible to any authenticated user.
+    The slides themselves are not loaded; each deck reports its slide count instead.
     """
-    query = db.query(SlideDeck)
-    if search:
+    query = db.query(SlideDeck).options(
+        load_only(
+            SlideDeck.id, SlideDeck.title, SlideDeck.description, SlideDeck.course_id,
+            SlideDeck.created_by_id, SlideDeck.created_at, SlideDeck.updated_at
+        ),
+        with_expression(SlideDeck.slide_count, func.json_array_length(SlideDeck.slides)),
+        # Creators come in the same SELECT; any other lazy load is a bug
+        joinedload(SlideDeck.creator),
+        raiseload("*"),
+    )
+    if search and prefix_only:
+        query = query.filter(SlideDeck.title.ilike(f"{search}%"))
+    elif search:
         query = query.filter(SlideDeck.title.ilike(f"%{search}%"))
     if course_id:
         query = query.filter(SlideDeck.course_id == course_id)
     return query.order_by(SlideDeck.created_at.desc()).all()
 
 
+def _deck_etag(body: bytes) -> str:
+    """
+    Strong ETag for a serialized deck.
+
+    Hashing the representation rather than updated_at keeps two edits in the
+    same second (SQLite's now() resolution) from sharing a tag.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
 @router.get("/{deck_id}", response_model=SlideDeckResponse, summary="Get a single slide deck")
-def get_slide_deck(deck_id: int, db: Session = Depends(get_db), _: User = Depends(require_authenticated)):
+def get_slide_deck(
+    deck_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    _: User = Depends(require_authenticated),
+):
     """
     Retrieves a single slide deck by its ID.
+    Returns 304 Not Modified when If-None-Match matches the deck's ETag.
     """
-    db_deck = db.query(SlideDeck).filter(SlideDeck.id == deck_id).first()
+    db_deck = db.get(SlideDeck, deck_id)
     if not db_deck:
         raise HTTPException(status_code=404, detail="Slide deck not found")
-    return db_deck
+
+    body = SlideDeckResponse.model_validate(db_deck).model_dump_json().encode()
+    etag = _deck_etag(body)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Already serialized for the tag, so send those bytes as-is
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.put("/{deck_id}", response_model=SlideDeckResponse, summary="Update a slide deck (Creator only)")
@@ -147,19 +213,34 @@ def update_slide_deck(
     Updates a slide deck's title, description, or slide content.
     Only the original creator can perform this action.
     """
-    db_deck = db.query(SlideDeck).filter(SlideDeck.id == deck_id).first()
-    if not db_deck:
-        raise HTTPException(status_code=404, detail="Slide deck not found")
-    if db_deck.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only update slide decks you have created.")
-
     update_data = request.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_deck, key, value)
+    if not update_data:
+        _check_deck_owner(db, deck_id, current_user, "update")
+        db_deck = db.get(SlideDeck, deck_id)
+        if db_deck is None:
+            raise HTTPException(status_code=404, detail="Slide deck not found")
+        return db_deck
+
+    # Ownership is part of the WHERE clause, so the check and the write are
+    # one statement; no row back means missing or not the creator's
+    db_deck = db.scalars(
+        update(SlideDeck)
+        .where(SlideDeck.id == deck_id, SlideDeck.created_by_id == current_user.id)
+        .values(**update_data)
+        .returning(SlideDeck)
+    ).one_or_none()
+    if db_deck is None:
+        _check_deck_owner(db, deck_id, current_user, "update")
+        # The deck changed hands or vanished between the UPDATE and the check
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Slide deck was modified concurrently. Please retry.",
+        )
 
+    # Serialize from the RETURNING row before commit expires it
+    response = SlideDeckResponse.model_validate(db_deck)
     db.commit()
-    db.refresh(db_deck)
-    return db_deck
+    return response
 
 
 @router.delete("/{deck_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a slide deck (Creator only)")
@@ -167,13 +248,9 @@ def delete_slide_deck(deck_id: int, db: Session = Depends(get_db), current_user:
     """
     Deletes a slide deck. Only the original creator can perform this action.
     """
-    db_deck = db.query(SlideDeck).filter(SlideDeck.id == deck_id).first()
-    if not db_deck:
-        raise HTTPException(status_code=404, detail="Slide deck not found")
-    if db_deck.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only delete slide decks you have created.")
+    _check_deck_owner(db, deck_id, current_user, "delete")
 
-    db.delete(db_deck)
+    db.execute(delete(SlideDeck).where(SlideDeck.id == deck_id))
     db.commit()
     return
 
@@ -197,14 +274,8 @@ def export_slide_deck(
     - dark: Yellow on dark gray, Segoe UI font
     - minimalist: Black and white, Arial font
     """
-    # Fetch the deck
-    db_deck = db.query(SlideDeck).filter(SlideDeck.id == deck_id).first()
-    if not db_deck:
-        raise HTTPException(status_code=404, detail="Slide deck not found")
-    
-    # Check authorization
-    if db_deck.created_by_id != current_user.id:
-        raise HTTPException(status_code=403, detail="You can only export slide decks you have created.")
+    # Check existence and authorization before loading the slides
+    _check_deck_owner(db, deck_id, current_user, "export")
 
     # Validate format
     if format not in ["pptx", "pdf"]:
@@ -218,6 +289,9 @@ def export_slide_deck(
             detail=f"Invalid theme. Choose from: {', '.join(valid_themes)}"
         )
     
+    # Fetch the deck
+    db_deck = db.get(SlideDeck, deck_id)
+
     # Prepare slide data
     slides_data = []
     for slide in db_deck.slides:
@@ -248,9 +322,10 @@ def export_slide_deck(
             media_type = "application/pdf"
             filename = f"{db_deck.title.replace(' ', '_')}.pdf"
         
-        # Return as streaming response
+        # Stream in fixed-size chunks; iterating the buffer directly would
+        # split the binary file on newline bytes
         return StreamingResponse(
-            file_buffer,
+            _iter_file(file_buffer),
             media_type=media_type,
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
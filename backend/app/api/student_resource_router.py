@@ -5,15 +5,19 @@ This module provides endpoints for students to manage their personal resources
 (documents, images, links) separate from course materials.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from datetime import datetime
+from urllib.parse import quote
+import hashlib
 import os
-import shutil
 import uuid
 
-from app.core.db import get_db
+from app.core.config import settings
+from app.core.db import get_db, get_list_db, SessionLocal
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.resource import Resource
@@ -25,13 +29,96 @@ router = APIRouter(prefix="/student-resources", tags=["Student Resources"])
 UPLOAD_DIR = "uploads/student_resources"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Leading bytes each binary upload type must start with; only the first
+# chunk's header is inspected. Plain text has no signature and is not checked.
+FILE_SIGNATURES = {
+    ".pdf": (b"%PDF-",),
+    ".doc": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),
+    ".docx": (b"PK\x03\x04",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".gif": (b"GIF87a", b"GIF89a"),
+    ".webp": (b"RIFF",),
+}
+
+
+def _has_expected_signature(head: bytes, file_ext: str) -> bool:
+    """Whether head starts with a known signature for file_ext."""
+    signatures = FILE_SIGNATURES.get(file_ext)
+    if signatures is None:
+        return True
+    if file_ext == ".webp" and head[8:12] != b"WEBP":
+        return False
+    return head.startswith(signatures)
+
+
+async def _save_upload(file: UploadFile, file_ext: str) -> str:
+    """
+    Store an upload under its SHA-256 digest and return the file path.
+
+    The upload is copied to a temporary file one chunk at a time, hashing
+    as it goes. The first chunk's header must match the extension, and the
+    size limit is checked as bytes arrive, so an oversized file is rejected
+    at the first chunk past MAX_FILE_SIZE and the partial copy is removed.
+    Identical content maps to the same path, so repeat uploads reuse the
+    stored file. Disk I/O runs in the threadpool so a large upload does
+    not block the event loop.
+    """
+    tmp_path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        buffer = await run_in_threadpool(open, tmp_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if size == 0 and not _has_expected_signature(chunk[:16], file_ext):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"File content does not match the {file_ext} file type"
+                    )
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024)}MB"
+                    )
+                digest.update(chunk)
+                await run_in_threadpool(buffer.write, chunk)
+        finally:
+            await run_in_threadpool(buffer.close)
+        return await run_in_threadpool(_store_by_digest, tmp_path, digest.hexdigest(), file_ext)
+    except HTTPException:
+        await run_in_threadpool(os.remove, tmp_path)
+        raise
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            await run_in_threadpool(os.remove, tmp_path)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to save file: {str(e)}"
+        )
+
+
+def _store_by_digest(tmp_path: str, hex_digest: str, file_ext: str) -> str:
+    """Move tmp_path to its content-addressed location, or drop it if already stored."""
+    file_path = os.path.join(UPLOAD_DIR, hex_digest[:2], hex_digest[2:4], hex_digest + file_ext)
+    if os.path.exists(file_path):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(tmp_path, file_path)
+    return file_path
 
 
 # ============================================================================
 # Schemas
 # ============================================================================
 
-from pydantic import BaseModel, HttpUrl
+from enum import Enum
+from pydantic import AliasChoices, BaseModel, Field, HttpUrl, field_validator
 
 
 class StudentResourceCreate(BaseModel):
@@ -42,6 +129,12 @@ class StudentResourceCreate(BaseModel):
     file_name: Optional[str] = None
 
 
+class LinkCreate(BaseModel):
+    """Form fields for adding a link resource."""
+    url: HttpUrl
+    title: Optional[str] = None
+
+
 class StudentResourceResponse(BaseModel):
     """Schema for student resource response."""
     id: int
@@ -49,13 +142,20 @@ class StudentResourceResponse(BaseModel):
     resource_type: str
     url: Optional[str] = None
     file_path: Optional[str] = None
-    file_name: Optional[str] = None
+    # The original filename is stored in Resource.description
+    file_name: Optional[str] = Field(None, validation_alias=AliasChoices("file_name", "description"))
     is_pinned: bool = False
     created_at: datetime
     
     class Config:
         from_attributes = True
 
+    @field_validator("resource_type", mode="before")
+    @classmethod
+    def resource_type_value(cls, value):
+        """Accept ResourceType members as well as plain strings."""
+        return value.value if isinstance(value, Enum) else value
+
 
 # ============================================================================
 # Endpoints
@@ -65,7 +165,7 @@ class StudentResourceResponse(BaseModel):
 @router.get("/my-resources", response_model=List[StudentResourceResponse])
 async def get_my_resources(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_list_db)
 ):
     """
     Get all personal resources for the current student.
@@ -73,26 +173,17 @@ async def get_my_resources(
     Returns:
         List of student resources
     """
-    resources = db.query(Resource).filter(
-        Resource.created_by_id == current_user.id,
-        Resource.visibility == ResourceVisibility.PRIVATE,
-        Resource.is_active == True
-    ).order_by(Resource.created_at.desc()).all()
-    
-    result = []
-    for res in resources:
-        result.append({
-            "id": res.id,
-            "title": res.title,
-            "resource_type": res.resource_type.value,
-            "url": res.url,
-            "file_path": res.file_path,
-            "file_name": res.description,  # We store filename in description
-            "is_pinned": res.is_pinned,
-            "created_at": res.created_at
-        })
-    
-    return result
+    # Only the response columns; rows are validated straight into the schema
+    return db.execute(
+        select(
+            Resource.id, Resource.title, Resource.resource_type, Resource.url,
+            Resource.file_path, Resource.description, Resource.is_pinned, Resource.created_at
+        ).where(
+            Resource.created_by_id == current_user.id,
+            Resource.visibility == ResourceVisibility.PRIVATE,
+            Resource.is_active == True
+        ).order_by(Resource.created_at.desc())
+    ).all()
 
 
 @router.post("/upload-document", response_model=StudentResourceResponse)
@@ -112,17 +203,6 @@ async def upload_document(
     Returns:
         Created resource details
     """
-    # Validate file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to start
-    
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024)}MB"
-        )
-    
     # Validate file type
     allowed_extensions = [".pdf", ".doc", ".docx", ".txt"]
     file_ext = os.path.splitext(file.filename)[1].lower()
@@ -132,19 +212,8 @@ async def upload_document(
             detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
         )
     
-    # Generate unique filename
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = os.path.join(UPLOAD_DIR, unique_filename)
-    
-    # Save file
-    try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to save file: {str(e)}"
-        )
+    # Save file under its content hash, enforcing the size limit while streaming
+    file_path = await _save_upload(file, file_ext)
     
     # Create resource record
     resource = Resource(
@@ -189,17 +258,6 @@ async def upload_image(
     Returns:
         Created resource details
     """
-    # Validate file size
-    file.file.seek(0, 2)
-    file_size = file.file.tell()
-    file.file.seek(0)
-    
-    if file_size > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE / (1024*1024)}MB"
-        )
-    
     # Validate file type
     allowed_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
     file_ext = os.path.splitext(file.filename)[1].lower()
@@ -209,19 +267,8 @@ async def upload_image(
             detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
         )
     
-    # Generate unique filename
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
-    file_path = os.path.join(UPLOAD_DIR, unique_filename)
-    
-    # Save file
-    try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to save file: {str(e)}"
-        )
+    # Save file under its content hash, enforcing the size limit while streaming
+    file_path = await _save_upload(file, file_ext)
     
     # Create resource record
     resource = Resource(
@@ -251,8 +298,7 @@ async def upload_image(
 
 @router.post("/add-link", response_model=StudentResourceResponse)
 async def add_link(
-    url: str = Form(...),
-    title: Optional[str] = Form(None),
+    link: Annotated[LinkCreate, Form()],
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -260,22 +306,16 @@ async def add_link(
     Add a link as a personal resource.
     
     Args:
-        url: URL to add
-        title: Optional title for the resource
+        link: URL to add (http/https, validated by HttpUrl) and optional title
         
     Returns:
         Created resource details
     """
-    # Basic URL validation
-    if not url.startswith(("http://", "https://")):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="URL must start with http:// or https://"
-        )
+    url = str(link.url)
     
     # Create resource record
     resource = Resource(
-        title=title or url,
+        title=link.title or url,
         description=None,
         resource_type=ResourceType.LINK,
         url=url,
@@ -326,12 +366,21 @@ async def delete_resource(
             detail="Resource not found or access denied"
         )
     
-    # Delete file if exists
+    # Stored files are shared by identical uploads; only remove the file
+    # once no other active resource points at it
     if resource.file_path and os.path.exists(resource.file_path):
-        try:
-            os.remove(resource.file_path)
-        except Exception as e:
-            print(f"Warning: Failed to delete file {resource.file_path}: {e}")
+        shared = db.scalar(
+            select(Resource.id).where(
+                Resource.file_path == resource.file_path,
+                Resource.id != resource.id,
+                Resource.is_active == True
+            ).limit(1)
+        )
+        if shared is None:
+            try:
+                await run_in_threadpool(os.remove, resource.file_path)
+            except Exception as e:
+                print(f"Warning: Failed to delete file {resource.file_path}: {e}")
     
     # Soft delete
     resource.is_active = False
@@ -385,9 +434,25 @@ async def toggle_pin_resource(
     }
 
 
+def _increment_download_count(resource_id: int) -> None:
+    """Bump a resource's download count after its file has been sent."""
+    db = SessionLocal()
+    try:
+        # Atomic in the database, so concurrent downloads are all counted
+        db.execute(
+            update(Resource)
+            .where(Resource.id == resource_id)
+            .values(download_count=Resource.download_count + 1)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
 @router.get("/download/{resource_id}")
 async def download_resource(
     resource_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -421,12 +486,28 @@ async def download_resource(
             detail="File not found"
         )
     
-    # Increment download count
-    resource.download_count += 1
-    db.commit()
+    # Count the download once the response is out, off the request path
+    background_tasks.add_task(_increment_download_count, resource.id)
     
-    # Return file
     filename = resource.description or "download"
+
+    # Behind nginx, hand the transfer to the proxy so it sendfile()s the
+    # bytes from disk instead of the app streaming them
+    if settings.UPLOAD_ACCEL_REDIRECT_PREFIX:
+        quoted = quote(filename)
+        if quoted != filename:
+            disposition = f"attachment; filename*=utf-8''{quoted}"
+        else:
+            disposition = f'attachment; filename="{filename}"'
+        return Response(
+            headers={
+                "X-Accel-Redirect": settings.UPLOAD_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + resource.file_path.lstrip("/"),
+                "Content-Disposition": disposition,
+            },
+            media_type="application/octet-stream"
+        )
+
+    # Return file
     return FileResponse(
         path=resource.file_path,
         filename=filename,
@@ -4,9 +4,13 @@ API router for tag management.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, raiseload
+from cachetools import TTLCache
 
-from app.core.db import get_db
+from app.core.db import get_db, get_list_db
 from app.models.tag import Tag
 from app.models.user import User
 from app.schemas.tag_schema import TagCreate, TagUpdate, TagResponse
@@ -15,6 +19,22 @@ from app.api.dependencies import require_ta, require_authenticated
 router = APIRouter()
 
 
+# Per-process cache of tag list responses keyed by the query parameters. Tags
+# change rarely and every write goes through this router, which clears it;
+# the TTL bounds staleness across worker processes.
+TAG_LIST_TTL_SECONDS = 30
+tag_list_cache: TTLCache = TTLCache(maxsize=256, ttl=TAG_LIST_TTL_SECONDS)
+
+
+def invalidate_tag_list() -> None:
+    """Drop cached tag lists after a tag is created, renamed or deleted."""
+    tag_list_cache.clear()
+
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
 @router.post(
     "/",
     response_model=TagResponse,
@@ -29,34 +49,59 @@ def create_tag(
     """
     Create a new tag. Accessible by TAs, Instructors, and Admins.
     """
-    existing_tag = db.query(Tag).filter(Tag.name == tag_in.name.lower()).first()
-    if existing_tag:
+    # One round trip: the unique index on name decides, and a conflict
+    # comes back as no row instead of a separate pre-check SELECT
+    values = {"name": tag_in.name.lower(), "created_by_id": current_user.id}
+    conflict_insert = _CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if conflict_insert is not None:
+        stmt = conflict_insert(Tag).values(**values).on_conflict_do_nothing(index_elements=["name"])
+        db_tag = db.execute(stmt.returning(Tag)).scalar_one_or_none()
+    else:
+        try:
+            db_tag = db.execute(insert(Tag).values(**values).returning(Tag)).scalar_one()
+        except IntegrityError:
+            # Only a duplicate name is a 409; anything else goes to the central handler
+            db.rollback()
+            if db.scalar(select(Tag.id).where(Tag.name == values["name"])) is None:
+                raise
+            db_tag = None
+    if db_tag is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A tag with this name already exists.",
         )
 
-    db_tag = Tag(name=tag_in.name.lower(), created_by_id=current_user.id)
-    db.add(db_tag)
     db.commit()
-    db.refresh(db_tag)
+    invalidate_tag_list()
     return db_tag
 
 
 @router.get("/", response_model=List[TagResponse], summary="List all tags or search by name")
 def get_all_tags(
     search: Optional[str] = Query(None, description="Search for tags by name (case-insensitive)."),
-    db: Session = Depends(get_db),
+    prefix_only: bool = Query(False, description="Only match tags whose name starts with the search term."),
+    db: Session = Depends(get_list_db),
     _: User = Depends(require_authenticated),
 ):
     """
     Retrieve a list of all tags. Supports searching by name.
     Accessible by any authenticated user.
     """
-    query = db.query(Tag)
-    if search:
+    cache_key = (search, prefix_only)
+    cached = tag_list_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Creators come in the same SELECT; any other lazy load is a bug
+    query = db.query(Tag).options(joinedload(Tag.creator), raiseload("*"))
+    if search and prefix_only:
+        # Names are stored lowercased, so a plain anchored LIKE can use the pattern index
+        query = query.filter(Tag.name.like(f"{search.lower()}%"))
+    elif search:
         query = query.filter(Tag.name.ilike(f"%{search}%"))
-    tags = query.order_by(Tag.name).all()
+    tags = [TagResponse.model_validate(tag) for tag in query.order_by(Tag.name).all()]
+    tag_list_cache[cache_key] = tags
     return tags
 
 
@@ -69,7 +114,7 @@ def get_tag_by_id(
     """
     Retrieve the details of a specific tag by its ID.
     """
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
+    tag = db.get(Tag, tag_id)
     if not tag:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
     return tag
@@ -85,12 +130,17 @@ def update_tag(
     """
     Update an existing tag's name. Accessible by TAs, Instructors, and Admins.
     """
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
+    tag = db.get(Tag, tag_id)
     if not tag:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
 
-    tag.name = tag_in.name.lower()
+    new_name = tag_in.name.lower()
+    if tag.name == new_name:
+        return tag
+
+    tag.name = new_name
     db.commit()
+    invalidate_tag_list()
     db.refresh(tag)
     return tag
 
@@ -104,10 +154,11 @@ def delete_tag(
     """
     Delete a tag from the database. Accessible by TAs, Instructors, and Admins.
     """
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
+    tag = db.get(Tag, tag_id)
     if not tag:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
 
     db.delete(tag)
     db.commit()
+    invalidate_tag_list()
     return
\ No newline at end of file
@@ -4,29 +4,76 @@ Task Management API Endpoints for AURA.
 Provides endpoints for monitoring and managing background tasks.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import case, func, literal, select, tuple_
+from sqlalchemy.orm import Session, load_only
 from typing import Optional
 from uuid import UUID
+from datetime import datetime
+import base64
+import binascii
+import json
+from cachetools import TTLCache
 
-from app.core.db import get_db
+from app.core.db import get_db, get_list_db, get_stats_db
 from app.api.dependencies import get_current_user
 from app.models.user import User
 from app.models.task import Task
 from app.models.enums import TaskStatusEnum, TaskTypeEnum
-from app.schemas.knowledge_schema import TaskOut
+from app.schemas.knowledge_schema import TaskOut, TaskSummaryOut
 
 
 router = APIRouter(prefix="/tasks", tags=["Background Tasks"])
 
 
-@router.get("/", response_model=list[TaskOut])
+# ============================================================================
+# Statistics Cache
+# ============================================================================
+
+# Per-process cache of the get_task_statistics summary, which is the same for
+# every caller. Deletes through this router clear it; tasks are created and
+# advanced by background workers, so the short TTL bounds staleness.
+TASK_STATS_TTL_SECONDS = 5
+TASK_STATS_CACHE_KEY = "summary"
+task_stats_cache: TTLCache = TTLCache(maxsize=1, ttl=TASK_STATS_TTL_SECONDS)
+
+
+def invalidate_task_statistics() -> None:
+    """Drop the cached task statistics after a write that changes the counts."""
+    task_stats_cache.clear()
+
+
+# ============================================================================
+# Keyset Pagination
+# ============================================================================
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_task_cursor(task: Task) -> str:
+    """Encode a task's (created_at, id) sort key as an opaque cursor token."""
+    payload = json.dumps({"created_at": task.created_at.isoformat(), "id": str(task.id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_task_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor token back into its (created_at, id) sort key."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["created_at"]), UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/", response_model=list[TaskSummaryOut])
 async def list_tasks(
-    page: int = Query(1, ge=1, description="Page number"),
+    response: Response,
+    page: int = Query(1, ge=1, description="Page number (ignored when a cursor is given)"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
-    task_type: Optional[str] = Query(None, description="Filter by task type"),
-    status: Optional[str] = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    task_type: Optional[TaskTypeEnum] = Query(None, description="Filter by task type"),
+    status: Optional[TaskStatusEnum] = Query(None, description="Filter by status"),
+    db: Session = Depends(get_list_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -34,9 +81,20 @@ async def list_tasks(
 
     - **task_type**: Filter by EMBEDDING or QUERY
     - **status**: Filter by PENDING, IN_PROGRESS, COMPLETED, or FAILED
+    - **cursor**: Continue after the previous page. A full page sets the
+      X-Next-Cursor response header; cursors stay fast at any depth,
+      unlike page numbers, which skip rows with OFFSET.
+
+    Metadata and error text are left out; fetch a single task for those.
     """
+    after = decode_task_cursor(cursor) if cursor else None
+
     try:
-        query = db.query(Task)
+        # Only the columns the list schema serializes
+        query = db.query(Task).options(load_only(
+            Task.id, Task.task_type, Task.status, Task.source_id,
+            Task.created_at, Task.updated_at, Task.completed_at
+        ))
 
         # Apply filters
         if task_type:
@@ -45,9 +103,18 @@ async def list_tasks(
             query = query.filter(Task.status == status)
 
         # Apply pagination
-        query = query.order_by(Task.created_at.desc())
-        skip = (page - 1) * size
-        tasks = query.offset(skip).limit(size).all()
+        query = query.order_by(Task.created_at.desc(), Task.id.desc())
+        if after:
+            after_created_at, after_id = after
+            query = query.filter(tuple_(Task.created_at, Task.id) < tuple_(
+                literal(after_created_at, Task.created_at.type), literal(after_id, Task.id.type)
+            ))
+        else:
+            query = query.offset((page - 1) * size)
+        tasks = query.limit(size).all()
+
+        if len(tasks) == size:
+            response.headers[NEXT_CURSOR_HEADER] = encode_task_cursor(tasks[-1])
 
         return tasks
 
@@ -69,7 +136,7 @@ async def get_task(
 
     Returns complete information including status, errors, and metadata.
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = db.get(Task, task_id)
 
     if not task:
         raise HTTPException(
@@ -91,7 +158,7 @@ async def delete_task(
 
     Only completed or failed tasks can be deleted.
     """
-    task = db.query(Task).filter(Task.id == task_id).first()
+    task = db.get(Task, task_id)
 
     if not task:
         raise HTTPException(
@@ -108,6 +175,7 @@ async def delete_task(
     try:
         db.delete(task)
         db.commit()
+        invalidate_task_statistics()
         return None
 
     except Exception as e:
@@ -120,7 +188,7 @@ async def delete_task(
 
 @router.get("/statistics/summary")
 async def get_task_statistics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_stats_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -128,30 +196,41 @@ async def get_task_statistics(
 
     Returns counts by status and type.
     """
-    try:
-        total_tasks = db.query(Task).count()
-        pending = db.query(Task).filter(Task.status == TaskStatusEnum.PENDING.value).count()
-        in_progress = db.query(Task).filter(Task.status == TaskStatusEnum.IN_PROGRESS.value).count()
-        completed = db.query(Task).filter(Task.status == TaskStatusEnum.COMPLETED.value).count()
-        failed = db.query(Task).filter(Task.status == TaskStatusEnum.FAILED.value).count()
+    cached = task_stats_cache.get(TASK_STATS_CACHE_KEY)
+    if cached is not None:
+        return cached
 
-        embedding_tasks = db.query(Task).filter(Task.task_type == TaskTypeEnum.EMBEDDING.value).count()
-        query_tasks = db.query(Task).filter(Task.task_type == TaskTypeEnum.QUERY.value).count()
-
-        return {
-            "total": total_tasks,
+    try:
+        # All counters in one scan; COUNT skips the NULLs from unmatched CASEs
+        def count_where(condition):
+            return func.count(case((condition, 1)))
+
+        row = db.execute(select(
+            func.count().label("total"),
+            count_where(Task.status == TaskStatusEnum.PENDING.value).label("pending"),
+            count_where(Task.status == TaskStatusEnum.IN_PROGRESS.value).label("in_progress"),
+            count_where(Task.status == TaskStatusEnum.COMPLETED.value).label("completed"),
+            count_where(Task.status == TaskStatusEnum.FAILED.value).label("failed"),
+            count_where(Task.task_type == TaskTypeEnum.EMBEDDING.value).label("embedding"),
+            count_where(Task.task_type == TaskTypeEnum.QUERY.value).label("query"),
+        ).select_from(Task)).one()
+
+        stats = {
+            "total": row.total,
             "by_status": {
-                "pending": pending,
-                "in_progress": in_progress,
-                "completed": completed,
-                "failed": failed
+                "pending": row.pending,
+                "in_progress": row.in_progress,
+                "completed": row.completed,
+                "failed": row.failed
             },
             "by_type": {
-                "embedding": embedding_tasks,
-                "query": query_tasks
+                "embedding": row.embedding,
+                "query": row.query
             },
-            "success_rate": round((completed / total_tasks * 100), 2) if total_tasks > 0 else 0
+            "success_rate": round((row.completed / row.total * 100), 2) if row.total > 0 else 0
         }
+        task_stats_cache[TASK_STATS_CACHE_KEY] = stats
+        return stats
 
     except Exception as e:
         raise HTTPException(
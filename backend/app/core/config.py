@@ -7,6 +7,7 @@ variables in your deployment environment.
 """
 
 import os
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -68,6 +69,21 @@ class Settings(BaseSettings):
         default=7,
         description="Refresh token expiration time in days"
     )
+    ARGON2_MEMORY_COST: int = Field(
+        default=65536,
+        ge=8,
+        description="Argon2 memory cost in KiB for new password hashes"
+    )
+    ARGON2_TIME_COST: int = Field(
+        default=3,
+        ge=1,
+        description="Argon2 iterations for new password hashes"
+    )
+    ARGON2_PARALLELISM: int = Field(
+        default=4,
+        ge=1,
+        description="Argon2 lanes for new password hashes"
+    )
 
     # CORS Settings
     CORS_ORIGINS: List[str] = Field(
@@ -101,6 +117,30 @@ class Settings(BaseSettings):
         default=False,
         description="Echo SQL queries (for debugging)"
     )
+    DB_POOL_SIZE: int = Field(
+        default=20,
+        ge=1,
+        description="Persistent connections kept by the pool (server databases only)"
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        description="Extra connections opened beyond the pool size under load"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=3600,
+        description="Seconds after which pooled connections are replaced (-1 disables)"
+    )
+    DB_LIST_STATEMENT_TIMEOUT_MS: int = Field(
+        default=2000,
+        ge=0,
+        description="PostgreSQL statement_timeout for list/search endpoints (0 disables)"
+    )
+    DB_STATS_STATEMENT_TIMEOUT_MS: int = Field(
+        default=10000,
+        ge=0,
+        description="PostgreSQL statement_timeout for aggregate statistics endpoints (0 disables)"
+    )
 
     # Pagination Settings
     DEFAULT_PAGE_SIZE: int = Field(
@@ -129,6 +169,11 @@ class Settings(BaseSettings):
         default="uploads",
         description="Directory for uploaded files"
     )
+    UPLOAD_ACCEL_REDIRECT_PREFIX: str = Field(
+        default="",
+        description="Internal nginx location (e.g. /protected/) that serves upload files "
+                    "via X-Accel-Redirect; empty streams files from the app"
+    )
 
     # Rate Limiting (for future implementation)
     RATE_LIMIT_PER_MINUTE: int = Field(
@@ -196,6 +241,12 @@ class Settings(BaseSettings):
         Be helpful, educational, and encouraging. Keep responses clear and concise.""",
         description="System prompt for chatbot"
     )
+    QUIZ_GENERATION_TIMEOUT_MINUTES: int = Field(
+        default=10,
+        ge=1,
+        description="Minutes after which a quiz still marked 'generating' is treated as failed "
+                    "(e.g. the worker restarted mid-job)"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -204,15 +255,15 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-# Create settings instance
-settings = Settings()
-
-
 # Helper function to get settings
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings.
 
+    The environment and .env file are read on the first call only; every
+    later call returns the same instance.
+
     Returns:
         Settings: Application settings instance
 
@@ -221,4 +272,8 @@ def get_settings() -> Settings:
         settings = get_settings()
         print(settings.APP_NAME)
     """
-    return settings
+    return Settings()
+
+
+# Shared settings instance (same object as get_settings())
+settings = get_settings()
@@ -5,8 +5,10 @@ This module handles SQLAlchemy engine creation, session management,
 and provides database dependencies for FastAPI routes.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from fastapi import Depends
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.core.config import settings
 
 
@@ -21,14 +23,58 @@ connect_args = {}
 if settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
+# Driver-level batching for executemany (bulk inserts/updates)
+# psycopg2: INSERTs already use multi-row VALUES; also batch UPDATE/DELETE
+# pyodbc: send parameter arrays instead of one round trip per row
+engine_options = {
+    # Rows per multi-row INSERT statement; bounds statement size for large seeds
+    "insertmanyvalues_page_size": 1000,
+}
+database_url = make_url(settings.DATABASE_URL)
+if database_url.get_backend_name() == "postgresql" and database_url.get_driver_name() == "psycopg2":
+    engine_options["executemany_mode"] = "values_plus_batch"
+elif database_url.get_backend_name() == "mssql" and database_url.get_driver_name() == "pyodbc":
+    engine_options["fast_executemany"] = True
+
+# Sync handlers run in FastAPI's threadpool (40 threads by default); size the
+# pool so concurrent list requests don't queue behind the default 5 + 10
+if database_url.get_backend_name() != "sqlite":
+    engine_options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args=connect_args,
     echo=settings.DB_ECHO,  # Log SQL queries if enabled in settings
     pool_pre_ping=True,  # Verify connections before using them
+    query_cache_size=1200,  # Room for every distinct statement the routers compile
+    **engine_options,
 )
 
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Configure each new SQLite connection.
+
+    WAL with synchronous=NORMAL lets readers proceed during writes and
+    only fsyncs at checkpoints instead of on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # read pages through a 256 MB memory map
+    cursor.close()
+
+
+if settings.DATABASE_URL.startswith("sqlite"):
+    event.listen(engine, "connect", set_sqlite_pragmas)
+
+
 # ============================================================================
 # Session Factory
 # ============================================================================
@@ -85,6 +131,34 @@ def get_db():
         db.close()
 
 
+def with_statement_timeout(milliseconds: int):
+    """
+    Build a dependency that returns the request session with a per-statement
+    time limit, so a runaway query is cancelled by PostgreSQL instead of
+    holding a pooled connection.
+
+    SET LOCAL lasts until the current transaction ends, which for read-only
+    endpoints is the whole request. Other databases have no equivalent
+    and get the session unchanged.
+
+    Example:
+        @app.get("/items")
+        def get_items(db: Session = Depends(with_statement_timeout(2000))):
+            ...
+    """
+    def dependency(db: Session = Depends(get_db)) -> Session:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text(f"SET LOCAL statement_timeout = {int(milliseconds)}"))
+        return db
+
+    return dependency
+
+
+# Session dependencies for endpoints that scan many rows
+get_list_db = with_statement_timeout(settings.DB_LIST_STATEMENT_TIMEOUT_MS)
+get_stats_db = with_statement_timeout(settings.DB_STATS_STATEMENT_TIMEOUT_MS)
+
+
 # ============================================================================
 # Database Initialization Helper
 # ============================================================================
@@ -109,7 +183,7 @@ def init_db():
     from app.models import (
         User, Query, QueryResponse, Resource, Announcement, Profile,
         # New models from merge
-        KnowledgeSource, KnowledgeChunk, Call, ChatSession, Task
+        KnowledgeSource, KnowledgeChunk, Call, ChatSession, Task, SeedMeta
     )
 
     # Create all tables
@@ -4,17 +4,33 @@ Security utilities for authentication and authorization.
 This module provides JWT token generation, validation, and password hashing utilities.
 """
 
+import base64
+import calendar
+import hashlib
+import hmac
+import json
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
+from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 from app.schemas.user_schema import TokenData, UserRole
 
 # Password hashing context using Argon2
-# Argon2 is recommended over bcrypt for modern applications
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Argon2 is recommended over bcrypt for modern applications. Cost parameters
+# only apply to new hashes; existing hashes carry their own and still verify.
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 
 # ============================================================================
@@ -61,11 +77,110 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the threadpool.
+
+    Argon2 deliberately takes tens of milliseconds; async handlers should
+    await this instead of calling hash_password on the event loop.
+    """
+    return await run_in_threadpool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the threadpool (see hash_password_async)."""
+    return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
 # ============================================================================
 # JWT Token Functions
 # ============================================================================
 
 
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used in JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+
+
+# HS256 tokens are assembled directly: the header segment never changes, so
+# it is encoded once here and each token only serializes and signs its claims
+_HS256_HEADER_SEGMENT = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+
+# HMAC state with the secret key already absorbed; copies skip the per-call
+# key padding and the two compression rounds it costs. Never updated itself.
+_HS256_MAC = hmac.new(settings.SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
+def _hs256_signature(signing_input: bytes) -> bytes:
+    """HMAC-SHA256 of signing_input under SECRET_KEY."""
+    mac = _HS256_MAC.copy()
+    mac.update(signing_input)
+    return mac.digest()
+
+
+def _encode_token(claims: Dict[str, Any]) -> str:
+    """
+    Encode claims as a JWT signed with settings.ALGORITHM.
+
+    datetime claims become integer timestamps, as python-jose does. Algorithms
+    other than HS256 go through jose.
+    """
+    if settings.ALGORITHM != "HS256":
+        return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+    payload = {
+        key: calendar.timegm(value.utctimetuple()) if isinstance(value, datetime) else value
+        for key, value in claims.items()
+    }
+    signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    return (signing_input + b"." + _b64url(_hs256_signature(signing_input))).decode("ascii")
+
+
+def _decode_token_payload(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT's signature and expiry and return its claims.
+
+    HS256 tokens are checked against the precomputed HMAC state; other
+    algorithms go through jose.
+
+    Raises:
+        JWTError: If the token is malformed, forged or expired
+    """
+    if settings.ALGORITHM != "HS256":
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    if token.count(".") != 2:
+        raise JWTError("Not enough segments")
+    try:
+        signing_input, _, signature_segment = token.encode("ascii").rpartition(b".")
+        header_segment, _, payload_segment = signing_input.partition(b".")
+        header = json.loads(_b64url_decode(header_segment))
+        payload = json.loads(_b64url_decode(payload_segment))
+        signature = _b64url_decode(signature_segment)
+    except (ValueError, UnicodeError):
+        raise JWTError("Invalid token encoding")
+
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise JWTError("The specified alg value is not allowed")
+    if not hmac.compare_digest(signature, _hs256_signature(signing_input)):
+        raise JWTError("Signature verification failed.")
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload")
+
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, int):
+            raise JWTError("Expiration Time claim (exp) must be an integer.")
+        if exp < time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
 def create_access_token(
     user_id: int,
     email: str,
@@ -108,13 +223,7 @@ def create_access_token(
         "type": "access"  # Token type
     }
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
-    )
-
-    return encoded_jwt
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(
@@ -155,13 +264,15 @@ def create_refresh_token(
         "type": "refresh"  # Token type
     }
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
-    )
+    return _encode_token(to_encode)
+
 
-    return encoded_jwt
+# Recently verified tokens, so repeat requests with the same bearer token skip
+# signature verification. Entries are re-checked against the token's own
+# expiry on every hit; only successful decodes are cached.
+TOKEN_CACHE_TTL_SECONDS = 60
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
 
 
 def decode_token(token: str, token_type: str = "access") -> TokenData:
@@ -184,12 +295,16 @@ def decode_token(token: str, token_type: str = "access") -> TokenData:
         >>> print(data.user_id)
         1
     """
+    cache_key = (token, token_type)
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        token_data, exp_timestamp = cached
+        if exp_timestamp is None or time.time() < exp_timestamp:
+            return token_data
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
+        payload = _decode_token_payload(token)
 
         # Verify token type
         if payload.get("type") != token_type:
@@ -215,12 +330,15 @@ def decode_token(token: str, token_type: str = "access") -> TokenData:
         # Convert expiration timestamp to datetime
         exp = datetime.fromtimestamp(exp_timestamp) if exp_timestamp else None
 
-        return TokenData(
+        token_data = TokenData(
             user_id=user_id,
             email=email,
             role=role,
             exp=exp
         )
+        with _token_cache_lock:
+            _token_cache[cache_key] = (token_data, exp_timestamp)
+        return token_data
 
     except JWTError as e:
         raise JWTError(f"Could not validate token: {str(e)}")
@@ -31,6 +31,7 @@ from app.models.knowledge import KnowledgeSource, KnowledgeChunk
 from app.models.call import Call
 from app.models.chat_session import ChatSession
 from app.models.task import Task
+from app.models.seed_meta import SeedMeta
 
 __all__ = [
     # Original models
@@ -64,4 +65,6 @@ __all__ = [
     "ChatSession",
     # Background tasks
     "Task",
+    # Seed data bookkeeping
+    "SeedMeta",
 ]
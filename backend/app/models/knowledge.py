@@ -5,11 +5,13 @@ This module defines models for storing knowledge sources and their vector embedd
 for semantic search using pgvector.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, ForeignKey, Index, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Text, ForeignKey, Index, Enum, insert
+from sqlalchemy.orm import Session, relationship
 from app.core.db import Base
 from app.models.types import GUID
 from datetime import datetime
+from typing import Any, Dict, Iterable, List
+import json
 import uuid
 
 try:
@@ -86,3 +88,40 @@ class KnowledgeChunk(Base):
         __table_args__ = (
             Index('ix_knowledge_chunks_source_id', 'source_id'),
         )
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Iterable[Dict[str, Any]], page_size: int = 1000) -> int:
+        """
+        Insert chunk rows with one executemany per page instead of one
+        INSERT per ORM object.
+
+        SQLAlchemy turns each page into multi-row INSERT statements
+        (insertmanyvalues), so ingesting a large source costs a handful of
+        round trips. Embeddings are converted to plain float lists once
+        here, or to JSON text when pgvector is not installed. The caller
+        owns the transaction.
+
+        Args:
+            session: Active database session
+            rows: Column dicts, e.g. {"source_id", "text", "index", "embedding"}
+            page_size: Rows sent per executemany call
+
+        Returns:
+            int: Number of rows inserted
+        """
+        total = 0
+        page: List[Dict[str, Any]] = []
+        for row in rows:
+            embedding = row.get("embedding")
+            if embedding is not None and not isinstance(embedding, str):
+                embedding = [float(x) for x in embedding]
+                row = {**row, "embedding": embedding if PGVECTOR_AVAILABLE else json.dumps(embedding)}
+            page.append(row)
+            if len(page) >= page_size:
+                session.execute(insert(cls), page)
+                total += len(page)
+                page = []
+        if page:
+            session.execute(insert(cls), page)
+            total += len(page)
+        return total
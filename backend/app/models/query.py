@@ -4,7 +4,7 @@ Query/Doubt database models.
 This module defines models for student queries, doubts, and their responses.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum as SQLEnum, func, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum as SQLEnum, Index, func, JSON
 from sqlalchemy.orm import relationship
 from app.core.db import Base
 from app.schemas.query_schema import QueryStatus, QueryPriority, QueryCategory
@@ -93,6 +93,17 @@ class Query(Base):
     assigned_to = relationship("User", foreign_keys=[assigned_to_id], back_populates="assigned_queries")
     responses = relationship("QueryResponse", back_populates="query", cascade="all, delete-orphan", order_by="QueryResponse.created_at")
 
+    # Indexes matching the list endpoint's filter + ORDER BY created_at DESC
+    __table_args__ = (
+        Index(
+            'ix_queries_student_created',
+            student_id,
+            created_at.desc(),
+            postgresql_include=['status', 'category', 'priority'],
+        ),
+        Index('ix_queries_created', created_at.desc()),
+    )
+
     def __repr__(self) -> str:
         """String representation of Query."""
         return f"<Query(id={self.id}, title='{self.title[:30]}...', status='{self.status.value}')>"
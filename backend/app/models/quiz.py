@@ -21,6 +21,7 @@ class Quiz(Base):
     use_latex = Column(Boolean, nullable=False, default=False)
     publish_mode = Column(String(50), nullable=False, default="manual")
     is_published = Column(Boolean, nullable=False, default=False)
+    generation_status = Column(String(20), nullable=False, default="completed")  # generating, completed, failed
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -4,11 +4,14 @@ Resource database model.
 This module defines the Resource model for educational materials.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum as SQLEnum, func, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Enum as SQLEnum, func, JSON, Index, text
 from sqlalchemy.orm import relationship
 from app.core.db import Base
 from app.schemas.resource_schema import ResourceType, ResourceVisibility
 
+_PRIVATE_ACTIVE = text("visibility = 'PRIVATE' AND is_active")
+_ACTIVE = text("is_active")
+
 
 class Resource(Base):
     """
@@ -88,6 +91,23 @@ class Resource(Base):
     # Relationships
     created_by = relationship("User", back_populates="resources")
 
+    # Partial indexes for the student "my resources" queries; predicates must
+    # match the router's WHERE clauses for the planner to use them
+    __table_args__ = (
+        Index(
+            'resources_user_private_active',
+            created_by_id, created_at.desc(),
+            postgresql_where=_PRIVATE_ACTIVE,
+            sqlite_where=_PRIVATE_ACTIVE,
+        ),
+        Index(
+            'resources_id_owner_active',
+            id, created_by_id,
+            postgresql_where=_ACTIVE,
+            sqlite_where=_ACTIVE,
+        ),
+    )
+
     def __repr__(self) -> str:
         """String representation of Resource."""
         return f"<Resource(id={self.id}, title='{self.title[:30]}...', type='{self.resource_type.value}')>"
@@ -0,0 +1,17 @@
+"""
+SQLAlchemy ORM model for SeedMeta.
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+
+from app.core.db import Base
+
+
+class SeedMeta(Base):
+    """Records which version of a seed data set has been applied."""
+    __tablename__ = "seed_meta"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -3,7 +3,7 @@ SQLAlchemy ORM model for SlideDeck.
 """
 
 from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, query_expression
 from sqlalchemy.sql import func
 
 from app.core.db import Base
@@ -27,6 +27,9 @@ class SlideDeck(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Number of slides, filled in by queries that use with_expression()
+    slide_count = query_expression()
+
     # Relationships
     course = relationship("Course", back_populates="slide_decks")
     creator = relationship("User", back_populates="slide_decks_created")
@@ -5,7 +5,7 @@ This module defines the Task model for tracking asynchronous background tasks
 like embedding generation, query processing, etc.
 """
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index
+from sqlalchemy import Column, DateTime, Text, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from app.core.db import Base
 from app.models.types import GUID
@@ -23,8 +23,9 @@ class Task(Base):
     __tablename__ = "tasks"
 
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    task_type = Column(String, nullable=False)  # TaskTypeEnum value
-    status = Column(String, nullable=False, default=TaskStatusEnum.PENDING.value)  # TaskStatusEnum value
+    # Native ENUM types on PostgreSQL; VARCHAR elsewhere
+    task_type = Column(SQLEnum(TaskTypeEnum, name="task_type"), nullable=False)
+    status = Column(SQLEnum(TaskStatusEnum, name="task_status"), nullable=False, default=TaskStatusEnum.PENDING)
     source_id = Column(GUID(), ForeignKey("knowledge_sources.id"), nullable=True)
     metadata_ = Column(Text)  # JSON string for additional task data
     error_message = Column(Text)
@@ -39,4 +40,6 @@ class Task(Base):
     __table_args__ = (
         Index('ix_tasks_status_created', 'status', 'created_at'),
         Index('ix_tasks_type_status', 'task_type', 'status'),
+        # Keyset pagination in list_tasks: ORDER BY created_at DESC, id DESC
+        Index('ix_tasks_created_id', created_at.desc(), id.desc()),
     )
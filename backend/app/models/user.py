@@ -12,6 +12,10 @@ from app.schemas.user_schema import UserRole
 import enum
 
 
+# Roles allowed to answer, resolve and moderate student queries
+STAFF_ROLES = frozenset({UserRole.TA, UserRole.INSTRUCTOR, UserRole.ADMIN})
+
+
 class User(Base):
     """
     User model representing all users in the system.
@@ -92,6 +96,16 @@ class User(Base):
     slide_decks_created = relationship("SlideDeck", back_populates="creator", cascade="all, delete-orphan")
     assigned_courses = relationship("UserCourse", back_populates="user", cascade="all, delete-orphan")
 
+    @property
+    def is_student(self) -> bool:
+        """Whether the user has the student role."""
+        return self.role == UserRole.STUDENT
+
+    @property
+    def is_staff(self) -> bool:
+        """Whether the user is a TA, instructor or admin."""
+        return self.role in STAFF_ROLES
+
     def set_password(self, password: str) -> None:
         """
         Hash and set the user's password using Argon2.
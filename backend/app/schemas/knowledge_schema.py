@@ -70,6 +70,20 @@ class KnowledgeChunkWithSource(KnowledgeChunkOut):
 
 
 # Task Schemas
+class TaskSummaryOut(BaseModel):
+    """Schema for a background task in list responses (no metadata or error text)."""
+    id: UUID
+    task_type: str
+    status: str
+    source_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class TaskOut(BaseModel):
     """Schema for background task response."""
     id: UUID
@@ -66,6 +66,7 @@ class QuizResponse(BaseModel):
     use_latex: bool
     publish_mode: str
     is_published: bool
+    generation_status: str = "completed"
     created_at: datetime
     updated_at: Optional[datetime]
 
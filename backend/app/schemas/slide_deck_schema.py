@@ -87,6 +87,19 @@ class SlideDeckResponse(SlideDeckBase):
         from_attributes = True
 
 
+class SlideDeckSummaryResponse(SlideDeckBase):
+    """Schema for listing slide decks without their slide content."""
+    id: int
+    course_id: int
+    slide_count: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    creator: UserSimpleResponse
+
+    class Config:
+        from_attributes = True
+
+
 class SlideDeckRefineRequest(BaseModel):
     """Schema for requesting AI-powered refinement of existing slides."""
     feedback: str = Field(..., description="Detailed feedback or instructions for refining the slides.")
@@ -37,4 +37,4 @@ class TagResponse(TagBase):
     creator: UserSimpleResponse
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
@@ -152,7 +152,9 @@ class ContentOptimizer:
                     max_words,
                     preserve_sentences=True
                 )
-                logger.info(f"Truncated slide {idx} from {word_count} to {ContentOptimizer.count_words(slide_copy['content'])} words")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Truncated slide %s from %s to %s words", idx, word_count,
+                                ContentOptimizer.count_words(slide_copy['content']))
             
             enhanced_slides.append(slide_copy)
         
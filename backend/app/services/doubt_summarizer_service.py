@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import logging
 from typing import List, Dict, Any
 from sqlalchemy.orm import Session
@@ -36,6 +38,37 @@ logger = logging.getLogger(__name__)
 from app.models.doubts import DoubtUpload, DoubtMessage
 from app.schemas.doubts import DoubtUploadCreate, WeeklySummaryResponse
 
+# -----------------------------------------------------------------------------
+# SINGLE-FLIGHT
+# -----------------------------------------------------------------------------
+
+# LLM calls currently running, keyed by a digest of their inputs
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def _single_flight(key: str, coro) -> Any:
+    """
+    Await `coro`, or the identical call already in flight under `key`.
+
+    The dashboard loads the summary, clusters and insights views together,
+    and each one asks the LLM the same question. Concurrent callers share
+    the first call's result instead of paying for it again. The shared task
+    is shielded so one caller disconnecting does not cancel it for the rest,
+    and each caller gets its own shallow copy of a dict result to add keys
+    to. Any other parsed value is returned unchanged.
+    """
+    fut = _inflight.get(key)
+    if fut is not None:
+        coro.close()
+    else:
+        fut = asyncio.ensure_future(coro)
+        _inflight[key] = fut
+        fut.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    result = await asyncio.shield(fut)
+    return dict(result) if isinstance(result, dict) else result
+
+
 # -----------------------------------------------------------------------------
 # SERVICE
 # -----------------------------------------------------------------------------
@@ -165,6 +198,13 @@ class DoubtSummarizerService:
         if not messages:
             return self._empty_state(course_code)
 
+        digest = hashlib.sha256(course_code.encode())
+        for message in messages:
+            digest.update(b"\0" + str(message).encode())
+        return await _single_flight(digest.hexdigest(), self._invoke_llm(messages, course_code))
+
+    async def _invoke_llm(self, messages: List[str], course_code: str) -> Dict[str, Any]:
+        """Run the summary prompt against the LLM."""
         prompt = PromptTemplate(
             template="""
 You are an expert academic assistant analyzing doubts for "{course_code}".
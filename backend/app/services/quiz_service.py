@@ -136,7 +136,7 @@ class QuizService:
         chain = prompt | self.llm | self.parser
 
         try:
-            logger.info(f"Generating quiz for course: {course_name}, topics: {topics}")
+            logger.info("Generating quiz for course: %s, topics: %s", course_name, topics)
             quiz_data = await chain.ainvoke({
                 "course_name": course_name,
                 "topics": ", ".join(topics),
@@ -194,7 +194,7 @@ class QuizService:
         chain = prompt | self.llm | self.parser
 
         try:
-            logger.info(f"Updating quiz with feedback: {feedback}")
+            logger.info("Updating quiz with feedback: %r", feedback[:100])
 
             # Serialize the original quiz data to a JSON string for the prompt
             original_quiz_json = json.dumps(quiz_data, indent=2)
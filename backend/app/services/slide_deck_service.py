@@ -135,7 +135,7 @@ class SlideDeckService:
         chain = prompt | self.llm | self.preview_parser
 
         try:
-            logger.info(f"Generating preview for {num_slides} slides for course: {course_name}")
+            logger.info("Generating preview for %s slides for course: %s", num_slides, course_name)
             preview_data = await chain.ainvoke({
                 "course_name": course_name,
                 "topics": ", ".join(topics),
@@ -264,7 +264,7 @@ class SlideDeckService:
         chain = prompt | self.llm | self.parser
 
         try:
-            logger.info(f"Generating {num_slides} slides for course: {course_name}, topics: {topics}")
+            logger.info("Generating %s slides for course: %s, topics: %s", num_slides, course_name, topics)
             deck_data = await chain.ainvoke({
                 "course_name": course_name,
                 "topics": ", ".join(topics),
@@ -295,10 +295,11 @@ class SlideDeckService:
                     has_graphs=include_graphs
                 )
                 
-                # Log content statistics
-                summary = content_optimizer.generate_content_summary(deck_data["slides"])
-                logger.info(f"Content Summary: {summary}")
-                logger.info(f"Slides within word limits: {summary['slides_within_limit']}/{summary['total_slides']}")
+                # Log content statistics (only computed when INFO is emitted)
+                if logger.isEnabledFor(logging.INFO):
+                    summary = content_optimizer.generate_content_summary(deck_data["slides"])
+                    logger.info("Content Summary: %s", summary)
+                    logger.info("Slides within word limits: %s/%s", summary['slides_within_limit'], summary['total_slides'])
             
             logger.info("Successfully generated slide deck content.")
             return deck_data
@@ -379,9 +380,9 @@ class SlideDeckService:
                 
                 # Log validation results
                 if not validation_result['is_valid']:
-                    logger.warning(f"Graph validation failed for slide {slide_idx} '{slide_title}': {validation_result['errors']}")
+                    logger.warning("Graph validation failed for slide %s '%s': %s", slide_idx, slide_title, validation_result['errors'])
                 if validation_result['warnings']:
-                    logger.info(f"Graph validation warnings for slide {slide_idx} '{slide_title}': {validation_result['warnings']}")
+                    logger.info("Graph validation warnings for slide %s '%s': %s", slide_idx, slide_title, validation_result['warnings'])
                 
                 # Generate chart image with axis metadata
                 chart_title = f"{slide_title} - Visualization"
@@ -427,9 +428,13 @@ class SlideDeckService:
                         }
                     }
                     
-                    logger.info(f"Successfully added {chart_type} chart to slide {slide_idx}: {slide_title} (validation: {'PASSED' if validation_result['is_valid'] else 'FAILED WITH WARNINGS'})")
+                    logger.info(
+                        "Successfully added %s chart to slide %s: %s (validation: %s)",
+                        chart_type, slide_idx, slide_title,
+                        'PASSED' if validation_result['is_valid'] else 'FAILED WITH WARNINGS',
+                    )
                 else:
-                    logger.warning(f"Chart generation returned None for slide {slide_idx}: {slide_title}. Skipping chart for this slide.")
+                    logger.warning("Chart generation returned None for slide %s: %s. Skipping chart for this slide.", slide_idx, slide_title)
             
             except Exception as chart_error:
                 logger.error(f"Error generating chart for slide {slide_idx} '{slide_title}': {chart_error}. Continuing without chart for this slide.")
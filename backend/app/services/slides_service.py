@@ -118,7 +118,7 @@ class SlidesService:
         chain = prompt | self.llm | self.parser
 
         try:
-            logger.info(f"Generating slides for theme '{theme.value}' with instructions: '{instructions[:50]}...'")
+            logger.info("Generating slides for theme '%s' with instructions: %r", theme.value, instructions[:50])
             slides_markdown = await chain.ainvoke({
                 "instructions": instructions,
                 "theme": theme.value,
@@ -10,10 +10,12 @@ This module initializes the FastAPI application with:
 - Comprehensive API documentation
 """
 
-from fastapi import FastAPI
+import logging
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse
 from contextlib import asynccontextmanager
+from sqlalchemy.exc import SQLAlchemyError
 from dotenv import load_dotenv
 from app.api.doubt_summarizer_router import router as doubt_router
 
@@ -27,6 +29,7 @@ except ImportError:
 
 from app.core.config import settings
 from app.core.db import init_db
+from app.core.security import pwd_context
 from app.api.auth import auth_router
 from app.api.chatbot import chatbot_router
 from app.api.knowledge import router as knowledge_router
@@ -44,6 +47,8 @@ from app.api.instructor_analytics import router as instructor_analytics_router
 from app.api import video_router
 from app.api.student_resource_router import router as student_resource_router
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # Application Lifecycle Management
 # ============================================================================
@@ -64,6 +69,10 @@ async def lifespan(app: FastAPI):
     init_db()
     print("Database initialized")
 
+    # passlib picks the Argon2 backend on first use; load it now so the
+    # first login doesn't pay for it
+    pwd_context.handler().get_backend()
+
     yield
 
     # Shutdown: Cleanup (if needed)
@@ -156,6 +165,7 @@ app = FastAPI(
     description=api_description,
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson is much faster on large list payloads
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
     openapi_url="/openapi.json",
@@ -180,9 +190,40 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=settings.CORS_ALLOW_METHODS,
     allow_headers=settings.CORS_ALLOW_HEADERS,
+    expose_headers=["X-Next-Cursor"],  # Keyset pagination token (tasks list)
 )
 
 
+# ============================================================================
+# Exception Handlers
+# ============================================================================
+
+
+@app.exception_handler(SQLAlchemyError)
+async def database_exception_handler(request: Request, exc: SQLAlchemyError):
+    """
+    Turn unhandled database errors into a generic 500 response.
+
+    The request's session is rolled back and closed by get_db; the SQL
+    error text is logged but never returned to the client.
+    """
+    logger.exception(f"Database error on {request.method} {request.url.path}")
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "A database error occurred. Please try again later."}
+    )
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Turn any other unhandled error into a generic 500 response."""
+    logger.exception(f"Unhandled error on {request.method} {request.url.path}")
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"}
+    )
+
+
 # ============================================================================
 # API Router Registration
 # ============================================================================
@@ -12,15 +12,20 @@ import os
 import sys
 import pytest
 from typing import Generator, Dict
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 
 # Add parent directory to path so we can import app modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Cheap Argon2 parameters for test users; must be set before app settings load
+os.environ.setdefault("ARGON2_MEMORY_COST", "1024")
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")
+
 from main import app
-from app.core.db import Base, get_db
+from app.core.db import Base, get_db, set_sqlite_pragmas
 
 # Import ALL models to register them with Base before create_all
 from app.models.user import User
@@ -39,6 +44,10 @@ from app.models.tag import Tag
 from app.models.announcement import Announcement
 
 from app.core.security import create_tokens
+from app.api.queries import query_stats_cache
+from app.api.tasks import task_stats_cache
+from app.api.tag_router import tag_list_cache
+from app.api.chatbot import _chat_session_ids
 
 
 # ============================================================================
@@ -53,6 +62,7 @@ test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False}
 )
+event.listen(test_engine, "connect", set_sqlite_pragmas)
 
 # Create test session factory
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
@@ -100,6 +110,7 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    reset_response_caches()
 
     with TestClient(app) as test_client:
         yield test_client
@@ -107,6 +118,14 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+def reset_response_caches() -> None:
+    """Clear in-process response caches so results don't leak between tests."""
+    query_stats_cache.clear()
+    task_stats_cache.clear()
+    tag_list_cache.clear()
+    _chat_session_ids.clear()
+
+
 # ============================================================================
 # User Creation Fixtures
 # ============================================================================
@@ -484,3 +484,46 @@ class TestRoleBasedAccess:
         response = client.get("/api/auth/me", headers=admin_auth_headers)
         assert response.status_code == 200
         assert response.json()["role"] == "admin"
+
+
+# ============================================================================
+# Token Encoding Tests
+# ============================================================================
+
+@pytest.mark.auth
+class TestTokenEncoding:
+    """Tests that locally assembled tokens match python-jose."""
+
+    def test_access_token_decodes_with_jose(self):
+        """Test that an access token verifies and decodes with jose."""
+        from jose import jwt
+        from app.core.config import settings
+        from app.core.security import create_access_token
+        from app.schemas.user_schema import UserRole
+
+        token = create_access_token(7, "jose@example.com", UserRole.TA)
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+        assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+        assert payload["sub"] == "7"
+        assert payload["role"] == "ta"
+        assert payload["type"] == "access"
+        assert isinstance(payload["exp"], int) and payload["exp"] > payload["iat"]
+
+    def test_expired_or_tampered_token_rejected(self, client: TestClient, authenticated_user):
+        """Test that expired tokens and tokens with a bad signature are refused."""
+        from datetime import timedelta
+        from app.core.security import create_access_token
+
+        expired = create_access_token(
+            authenticated_user.id, authenticated_user.email, authenticated_user.role,
+            expires_delta=timedelta(seconds=-1)
+        )
+        response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {expired}"})
+        assert response.status_code == 401
+
+        token = create_access_token(authenticated_user.id, authenticated_user.email, authenticated_user.role)
+        header, payload, signature = token.split(".")
+        tampered = f"{header}.{payload}.{signature[::-1]}"
+        response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {tampered}"})
+        assert response.status_code == 401
@@ -5,8 +5,11 @@ Covers:
 - missing LLM behavior
 - successful mocked LLM output
 - error propagation handling
+- sharing of concurrent identical LLM calls
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from app.services.doubt_summarizer_service import doubt_summarizer_service
@@ -117,3 +120,28 @@ class TestDoubtSummarizerService:
             )
 
         assert "Google AI is down" in result.get("error", "")
+
+    # ---------------------------------------------------------
+    # 5. CONCURRENT IDENTICAL CALLS SHARE ONE LLM REQUEST
+    # ---------------------------------------------------------
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_result(self):
+        messages = ["What is recursion?"]
+        course_code = "CS101"
+
+        with patch("app.services.doubt_summarizer_service.PromptTemplate") as mock_prompt:
+            mock_chain_instance = AsyncMock()
+            # A parser can hand back a list; it must pass through untouched
+            mock_chain_instance.ainvoke.return_value = ["not", "a", "dict"]
+
+            mock_prompt.return_value.__or__.return_value.__or__.return_value = (
+                mock_chain_instance
+            )
+
+            results = await asyncio.gather(*(
+                doubt_summarizer_service.generate_summary_topics_insights(messages, course_code)
+                for _ in range(3)
+            ))
+
+        assert results == [["not", "a", "dict"]] * 3
+        assert mock_chain_instance.ainvoke.await_count == 1
@@ -142,6 +142,64 @@ class TestListQueries:
         assert data["total"] == 2
         assert len(data["queries"]) == 2
 
+    def test_list_queries_item_fields(self, client: TestClient, db_session: Session):
+        """Test that list items carry names and response counts but not detail-only fields."""
+        # Create student and TA
+        student = User(
+            email="student@test.com",
+            full_name="Test Student",
+            role=UserRole.STUDENT,
+            password=hash_password("test123"),
+            is_active=True
+        )
+        ta = User(
+            email="ta@test.com",
+            full_name="Test TA",
+            role=UserRole.TA,
+            password=hash_password("test123"),
+            is_active=True
+        )
+        db_session.add_all([student, ta])
+        db_session.flush()
+
+        query = Query(
+            title="Query with replies",
+            description="Some description",
+            student_id=student.id,
+            assigned_to_id=ta.id,
+            status=QueryStatus.IN_PROGRESS,
+            category=QueryCategory.TECHNICAL,
+            priority=QueryPriority.MEDIUM,
+            tags=["python"]
+        )
+        db_session.add(query)
+        db_session.flush()
+        db_session.add_all([
+            QueryResponse(query_id=query.id, user_id=ta.id, content="First reply"),
+            QueryResponse(query_id=query.id, user_id=student.id, content="Second reply"),
+        ])
+        db_session.commit()
+
+        # Login as TA
+        login_response = client.post("/api/auth/login", json={
+            "email": "ta@test.com",
+            "password": "test123"
+        })
+        token = login_response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = client.get("/api/queries/", headers=headers)
+
+        assert response.status_code == 200
+        item = response.json()["queries"][0]
+
+        assert item["description"] == "Some description"
+        assert item["student_name"] == "Test Student"
+        assert item["assigned_to_name"] == "Test TA"
+        assert item["response_count"] == 2
+        assert "tags" not in item
+        assert "resolution_notes" not in item
+
     def test_list_queries_filter_by_status(self, client: TestClient, db_session: Session):
         """Test filtering queries by status."""
         # Create student
@@ -344,6 +402,67 @@ class TestGetQuery:
         assert data["description"] == "Test description"
         assert data["view_count"] == 1  # Incremented after view
 
+    def test_get_query_not_modified_with_etag(self, client: TestClient, db_session: Session):
+        """Test that a matching If-None-Match header returns 304."""
+        # Create student
+        student = User(
+            email="student@test.com",
+            full_name="Test Student",
+            role=UserRole.STUDENT,
+            password=hash_password("test123"),
+            is_active=True
+        )
+        db_session.add(student)
+        db_session.flush()
+
+        # Create query
+        query = Query(
+            title="Test Query",
+            description="Test description",
+            student_id=student.id,
+            status=QueryStatus.OPEN,
+            category=QueryCategory.TECHNICAL,
+            priority=QueryPriority.MEDIUM
+        )
+        db_session.add(query)
+        db_session.commit()
+
+        # Login
+        login_response = client.post("/api/auth/login", json={
+            "email": "student@test.com",
+            "password": "test123"
+        })
+        token = login_response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # First fetch returns the body and an ETag
+        response = client.get(f"/api/queries/{query.id}", headers=headers)
+
+        assert response.status_code == 200
+        etag = response.headers.get("etag")
+        assert etag
+
+        # Repeat fetch with the ETag is not modified
+        response = client.get(
+            f"/api/queries/{query.id}",
+            headers={**headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # A status change with the same response count yields a new tag
+        query.status = QueryStatus.RESOLVED
+        db_session.commit()
+        response = client.get(
+            f"/api/queries/{query.id}",
+            headers={**headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == QueryStatus.RESOLVED.value
+        assert response.headers["etag"] != etag
+
     def test_get_query_not_found(self, client: TestClient, auth_headers: dict):
         """Test getting non-existent query."""
         response = client.get("/api/queries/99999", headers=auth_headers)
@@ -504,6 +623,49 @@ class TestCreateQuery:
         assert data["query"]["status"] == "open"
         assert data["query"]["tags"] == ["algorithms", "sorting"]
 
+    def test_create_query_returns_stored_row(self, client: TestClient, db_session: Session):
+        """Test that the created query is returned with its database defaults."""
+        # Create student
+        student = User(
+            email="student@test.com",
+            full_name="Test Student",
+            role=UserRole.STUDENT,
+            password=hash_password("test123"),
+            is_active=True
+        )
+        db_session.add(student)
+        db_session.commit()
+
+        # Login
+        login_response = client.post("/api/auth/login", json={
+            "email": "student@test.com",
+            "password": "test123"
+        })
+        token = login_response.json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        query_data = {
+            "title": "Need help with recursion",
+            "description": "I do not understand the base case",
+            "category": "conceptual",
+            "priority": "high"
+        }
+
+        response = client.post("/api/queries/", json=query_data, headers=headers)
+
+        assert response.status_code == 201
+        data = response.json()["query"]
+
+        assert data["id"] is not None
+        assert data["status"] == "open"
+        assert data["category"] == "conceptual"
+        assert data["priority"] == "high"
+        assert data["student_name"] == "Test Student"
+        assert data["view_count"] == 0
+        assert data["response_count"] == 0
+        assert data["created_at"] is not None
+        assert db_session.query(Query).filter(Query.id == data["id"]).count() == 1
+
     def test_create_query_forbidden_for_ta(self, client: TestClient, db_session: Session):
         """Test that TAs cannot create queries."""
         # Create TA
@@ -686,6 +848,7 @@ class TestAddQueryResponse:
         # Verify query is now resolved
         db_session.refresh(query)
         assert query.status == QueryStatus.RESOLVED
+        assert query.resolved_at is not None
 
     def test_add_response_student_cannot_mark_solution(self, client: TestClient, db_session: Session):
         """Test that students cannot mark their response as solution."""
@@ -1054,3 +1217,73 @@ class TestQueryStatistics:
 
         assert data["total_queries"] == 0
         assert data["by_status"]["open"] == 0
+
+    def test_get_statistics_cached_until_write(self, client: TestClient, db_session: Session):
+        """Test that statistics are cached and refreshed after a response is added."""
+        # Create student and TA
+        student = User(
+            email="student@test.com",
+            full_name="Test Student",
+            role=UserRole.STUDENT,
+            password=hash_password("test123"),
+            is_active=True
+        )
+        ta = User(
+            email="ta@test.com",
+            full_name="Test TA",
+            role=UserRole.TA,
+            password=hash_password("test123"),
+            is_active=True
+        )
+        db_session.add_all([student, ta])
+        db_session.flush()
+
+        query = Query(
+            title="Open Query",
+            description="Test",
+            student_id=student.id,
+            status=QueryStatus.OPEN,
+            category=QueryCategory.TECHNICAL,
+            priority=QueryPriority.MEDIUM
+        )
+        db_session.add(query)
+        db_session.commit()
+
+        # Login as both users
+        student_token = client.post("/api/auth/login", json={
+            "email": "student@test.com",
+            "password": "test123"
+        }).json()["access_token"]
+        student_headers = {"Authorization": f"Bearer {student_token}"}
+        ta_token = client.post("/api/auth/login", json={
+            "email": "ta@test.com",
+            "password": "test123"
+        }).json()["access_token"]
+        ta_headers = {"Authorization": f"Bearer {ta_token}"}
+
+        response = client.get("/api/queries/statistics/summary", headers=student_headers)
+        assert response.json()["by_status"]["open"] == 1
+
+        # Rows written outside the router are served from cache until the TTL expires
+        db_session.add(Query(
+            title="Another Query",
+            description="Test",
+            student_id=student.id,
+            status=QueryStatus.OPEN,
+            category=QueryCategory.TECHNICAL,
+            priority=QueryPriority.MEDIUM
+        ))
+        db_session.commit()
+        response = client.get("/api/queries/statistics/summary", headers=student_headers)
+        assert response.json()["total_queries"] == 1
+
+        # Adding a response through the API invalidates the cache
+        client.post(
+            f"/api/queries/{query.id}/response",
+            json={"content": "Here is some help"},
+            headers=ta_headers
+        )
+        response = client.get("/api/queries/statistics/summary", headers=student_headers)
+        data = response.json()
+        assert data["total_queries"] == 2
+        assert data["by_status"]["in_progress"] == 1
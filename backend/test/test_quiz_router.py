@@ -3,8 +3,9 @@ API tests for the Quiz and Quiz Attempt endpoints.
 """
 
 import pytest
+from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from unittest.mock import AsyncMock
 
 from app.models.user import User
@@ -53,9 +54,18 @@ def test_quiz(db_session: Session, test_course: Course, authenticated_ta: User)
     return quiz
 
 
+@pytest.fixture
+def background_db(db_session: Session, monkeypatch):
+    """Points the background quiz generation jobs at the test database."""
+    monkeypatch.setattr(
+        "app.api.quiz_router.SessionLocal",
+        sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind()),
+    )
+
+
 @pytest.mark.asyncio
 async def test_generate_quiz_as_ta(
-    client: TestClient, ta_auth_headers: dict, test_course: Course, monkeypatch
+    client: TestClient, ta_auth_headers: dict, test_course: Course, background_db, monkeypatch
 ):
     """Tests that a TA can successfully generate and save a quiz."""
     # Mock the AI service call
@@ -73,14 +83,41 @@ async def test_generate_quiz_as_ta(
 
     response = client.post("/api/quizzes/generate", headers=ta_auth_headers, json=request_data)
 
-    assert response.status_code == 201
+    assert response.status_code == 202
     data = response.json()
     assert data["title"] == "New AI-Generated Quiz"
     assert data["course_id"] == test_course.id
-    assert data["questions"] == MOCK_QUIZ_QUESTIONS
+    assert data["generation_status"] == "generating"
+
+    # The background job has filled in the questions by the time the client returns
+    get_response = client.get(f"/api/quizzes/{data['id']}", headers=ta_auth_headers)
+    assert get_response.status_code == 200
+    assert get_response.json()["questions"] == MOCK_QUIZ_QUESTIONS
+    assert get_response.json()["generation_status"] == "completed"
     mock_generate.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_generate_quiz_ai_failure_marks_failed(
+    client: TestClient, ta_auth_headers: dict, test_course: Course, background_db, monkeypatch
+):
+    """Tests that an AI service error marks the placeholder quiz as failed."""
+    mock_generate = AsyncMock(return_value={"error": "model unavailable"})
+    monkeypatch.setattr("app.api.quiz_router.quiz_service.generate_quiz", mock_generate)
+
+    request_data = {
+        "course_id": test_course.id,
+        "title": "Failing AI-Generated Quiz",
+        "topics": ["Python basics"],
+    }
+
+    response = client.post("/api/quizzes/generate", headers=ta_auth_headers, json=request_data)
+    assert response.status_code == 202
+
+    get_response = client.get(f"/api/quizzes/{response.json()['id']}", headers=ta_auth_headers)
+    assert get_response.json()["generation_status"] == "failed"
+
+
 @pytest.mark.asyncio
 async def test_generate_quiz_as_student(client: TestClient, auth_headers: dict, test_course: Course):
     """Tests that a student cannot generate a quiz."""
@@ -98,7 +135,7 @@ async def test_generate_quiz_as_student(client: TestClient, auth_headers: dict,
 
 @pytest.mark.asyncio
 async def test_update_quiz_as_creator(
-    client: TestClient, ta_auth_headers: dict, test_quiz: Quiz, monkeypatch
+    client: TestClient, db_session: Session, ta_auth_headers: dict, test_quiz: Quiz, background_db, monkeypatch
 ):
     """Tests that the creator of a quiz can update it."""
     mock_update = AsyncMock(return_value={"questions": [{"updated": True}]})
@@ -110,12 +147,47 @@ async def test_update_quiz_as_creator(
         json={"feedback": "Make it better"},
     )
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["questions"] == {"questions": [{"updated": True}]}
+    assert response.status_code == 202
+    assert response.json()["generation_status"] == "generating"
+
+    # The job committed through its own session
+    db_session.expire_all()
+    get_response = client.get(f"/api/quizzes/{test_quiz.id}", headers=ta_auth_headers)
+    assert get_response.json()["questions"] == {"questions": [{"updated": True}]}
+    assert get_response.json()["generation_status"] == "completed"
     mock_update.assert_called_once()
 
 
+def test_stale_generation_is_marked_failed(
+    client: TestClient, db_session: Session, ta_auth_headers: dict, test_quiz: Quiz
+):
+    """Tests that a job lost mid-generation stops blocking polls and updates."""
+    test_quiz.generation_status = "generating"
+    test_quiz.updated_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    db_session.commit()
+
+    get_response = client.get(f"/api/quizzes/{test_quiz.id}", headers=ta_auth_headers)
+    assert get_response.json()["generation_status"] == "failed"
+
+
+def test_update_quiz_while_generating(
+    client: TestClient, db_session: Session, ta_auth_headers: dict, test_quiz: Quiz
+):
+    """Tests that a quiz with a fresh in-progress job cannot be claimed again."""
+    test_quiz.generation_status = "generating"
+    db_session.commit()
+
+    response = client.put(
+        f"/api/quizzes/{test_quiz.id}",
+        headers=ta_auth_headers,
+        json={"feedback": "Make it better"},
+    )
+    assert response.status_code == 409
+
+    get_response = client.get(f"/api/quizzes/{test_quiz.id}", headers=ta_auth_headers)
+    assert get_response.json()["generation_status"] == "generating"
+
+
 @pytest.mark.asyncio
 async def test_update_quiz_as_other_ta(
     client: TestClient, admin_auth_headers: dict, test_quiz: Quiz
@@ -207,6 +279,34 @@ def test_delete_quiz_as_other_user(
     assert "You can only delete quizzes you have created" in response.json()["detail"]
 
 
+def test_delete_quiz_not_found(client: TestClient, ta_auth_headers: dict):
+    """Tests that deleting a missing quiz returns 404."""
+    response = client.delete("/api/quizzes/99999", headers=ta_auth_headers)
+    assert response.status_code == 404
+
+
+def test_publish_and_unpublish_quiz_as_creator(
+    client: TestClient, ta_auth_headers: dict, test_quiz: Quiz
+):
+    """Tests that the creator can publish and unpublish their quiz."""
+    response = client.post(f"/api/quizzes/{test_quiz.id}/publish", headers=ta_auth_headers)
+    assert response.status_code == 200
+    assert response.json()["is_published"] is True
+
+    response = client.post(f"/api/quizzes/{test_quiz.id}/unpublish", headers=ta_auth_headers)
+    assert response.status_code == 200
+    assert response.json()["is_published"] is False
+
+
+def test_publish_quiz_as_other_user(
+    client: TestClient, admin_auth_headers: dict, test_quiz: Quiz
+):
+    """Tests that a user who is not the creator cannot publish the quiz."""
+    response = client.post(f"/api/quizzes/{test_quiz.id}/publish", headers=admin_auth_headers)
+    assert response.status_code == 403
+    assert "You can only publish quizzes you have created" in response.json()["detail"]
+
+
 def test_get_quiz_attempts_for_quiz(
     client: TestClient, ta_auth_headers: dict, test_quiz: Quiz
 ):
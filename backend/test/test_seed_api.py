@@ -90,6 +90,18 @@ class TestPopulateDatabase:
         total_users = db_session.query(User).count()
         assert total_users == 4
 
+    def test_populate_is_noop_once_seed_version_applied(self, client: TestClient, db_session: Session):
+        """Test that a repeat population skips all work, including tasks."""
+        client.post("/api/seed/populate")
+
+        response = client.post("/api/seed/populate")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["message"] == "Database already seeded"
+        assert data["tasks_created"] == 0
+        assert db_session.query(Task).count() == 5
+
     def test_populate_creates_knowledge_chunks(self, client: TestClient, db_session: Session):
         """Test that knowledge sources have associated chunks."""
         response = client.post("/api/seed/populate")
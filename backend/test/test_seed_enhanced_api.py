@@ -0,0 +1,106 @@
+"""
+Tests for the enhanced Seed API endpoints.
+
+This module tests:
+- POST /api/seed/populate-enhanced - Populate database with analytics mock data
+- DELETE /api/seed/clear-all - Clear all data from database
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.models.knowledge import KnowledgeSource, KnowledgeChunk
+from app.models.task import Task
+from app.models.query import Query, QueryResponse
+from app.models.chat_session import ChatSession
+
+
+@pytest.mark.api
+@pytest.mark.seed
+class TestPopulateEnhancedDatabase:
+    """Tests for the enhanced database population endpoint."""
+
+    def test_populate_enhanced_success(self, client: TestClient, db_session: Session):
+        """Test populating the database with enhanced seed data."""
+        response = client.post("/api/seed/populate-enhanced")
+
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["users_created"] == 15
+        assert data["knowledge_sources_created"] == 15
+        assert data["tasks_created"] == 15
+        assert data["queries_created"] >= 38 + 4 * 5
+        assert data["chat_sessions_created"] >= 8 * 2
+
+        # Counters match what was written
+        assert db_session.query(User).count() == data["users_created"]
+        assert db_session.query(Query).count() == data["queries_created"]
+        assert db_session.query(QueryResponse).count() == data["responses_created"]
+        assert db_session.query(KnowledgeSource).count() == data["knowledge_sources_created"]
+        assert db_session.query(KnowledgeChunk).count() == data["knowledge_sources_created"]
+        assert db_session.query(ChatSession).count() == data["chat_sessions_created"]
+        assert db_session.query(Task).count() == data["tasks_created"]
+
+    def test_populate_enhanced_links_responses_to_queries(self, client: TestClient, db_session: Session):
+        """Test that solutions reference existing queries and staff responders."""
+        client.post("/api/seed/populate-enhanced")
+
+        solutions = db_session.query(QueryResponse).filter(QueryResponse.is_solution == True).all()
+        assert len(solutions) > 0
+        for solution in solutions:
+            assert solution.query is not None
+            assert solution.created_at >= solution.query.created_at
+
+    def test_populate_enhanced_skips_existing_users(self, client: TestClient, db_session: Session):
+        """Test that a second population does not duplicate users."""
+        client.post("/api/seed/populate-enhanced")
+
+        response = client.post("/api/seed/populate-enhanced")
+        assert response.status_code == 200
+        assert response.json()["users_created"] == 0
+        assert db_session.query(User).count() == 15
+
+    def test_populate_enhanced_skips_hashing_when_users_exist(self, client: TestClient, monkeypatch):
+        """Test that a repeat population does not hash any passwords."""
+        client.post("/api/seed/populate-enhanced")
+
+        def fail_hash(password):
+            raise AssertionError("password hashed for an existing user")
+
+        monkeypatch.setattr("app.api.seed_enhanced.hash_password", fail_hash)
+        response = client.post("/api/seed/populate-enhanced")
+        assert response.status_code == 200
+        assert response.json()["users_created"] == 0
+
+
+@pytest.mark.api
+@pytest.mark.seed
+class TestClearAllData:
+    """Tests for the clear-all endpoint."""
+
+    def test_clear_all_data(self, client: TestClient, db_session: Session):
+        """Test that clear-all removes seeded rows from every table."""
+        client.post("/api/seed/populate-enhanced")
+
+        response = client.delete("/api/seed/clear-all")
+        assert response.status_code == 200
+        assert response.json()["message"] == "All data cleared successfully"
+
+        for model in (User, Query, QueryResponse, KnowledgeSource, KnowledgeChunk, ChatSession, Task):
+            assert db_session.query(model).count() == 0
+
+    def test_populate_after_clear_all(self, client: TestClient, db_session: Session):
+        """Test that /seed/populate seeds again after clear-all emptied the database."""
+        assert client.post("/api/seed/populate").json()["users_created"] > 0
+
+        assert client.delete("/api/seed/clear-all").status_code == 200
+
+        response = client.post("/api/seed/populate")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["message"] != "Database already seeded"
+        assert data["users_created"] > 0
+        assert db_session.query(KnowledgeSource).count() == data["knowledge_sources_created"]
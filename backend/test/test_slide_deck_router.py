@@ -2,6 +2,8 @@
 API tests for the Slide Deck endpoints.
 """
 
+from io import BytesIO
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -140,7 +142,9 @@ def test_get_all_slide_decks(client: TestClient, auth_headers: dict, test_slide_
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
-    assert any(d["id"] == test_slide_deck.id for d in data)
+    listed = next(d for d in data if d["id"] == test_slide_deck.id)
+    assert listed["slide_count"] == len(MOCK_SLIDE_CONTENT["slides"])
+    assert "slides" not in listed
 
 
 def test_get_slide_deck_by_id(client: TestClient, auth_headers: dict, test_slide_deck: SlideDeck):
@@ -152,6 +156,34 @@ def test_get_slide_deck_by_id(client: TestClient, auth_headers: dict, test_slide
     assert data["title"] == test_slide_deck.title
 
 
+def test_get_slide_deck_not_modified(client: TestClient, auth_headers: dict, test_slide_deck: SlideDeck):
+    """Tests that a matching If-None-Match returns 304 with no body."""
+    response = client.get(f"/api/slide-decks/{test_slide_deck.id}", headers=auth_headers)
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"/api/slide-decks/{test_slide_deck.id}",
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_slide_deck_etag_changes_within_same_second(
+    client: TestClient, ta_auth_headers: dict, test_slide_deck: SlideDeck
+):
+    """Tests that back-to-back edits never revalidate to a stale 304."""
+    url = f"/api/slide-decks/{test_slide_deck.id}"
+    client.put(url, headers=ta_auth_headers, json={"title": "First Edit"})
+    etag = client.get(url, headers=ta_auth_headers).headers["etag"]
+
+    client.put(url, headers=ta_auth_headers, json={"title": "Second Edit"})
+    response = client.get(url, headers={**ta_auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Second Edit"
+    assert response.headers["etag"] != etag
+
+
 def test_get_non_existent_slide_deck(client: TestClient, auth_headers: dict):
     """Tests retrieving a non-existent slide deck."""
     response = client.get("/api/slide-decks/9999", headers=auth_headers)
@@ -198,6 +230,21 @@ def test_update_slide_deck_as_other_user(
     assert "You can only update slide decks you have created" in response.json()["detail"]
 
 
+def test_update_slide_deck_without_changes(
+    client: TestClient, ta_auth_headers: dict, admin_auth_headers: dict, test_slide_deck: SlideDeck
+):
+    """Tests that an empty update returns the deck unchanged and still checks ownership."""
+    response = client.put(f"/api/slide-decks/{test_slide_deck.id}", headers=ta_auth_headers, json={})
+    assert response.status_code == 200
+    assert response.json()["title"] == test_slide_deck.title
+
+    response = client.put(f"/api/slide-decks/{test_slide_deck.id}", headers=admin_auth_headers, json={})
+    assert response.status_code == 403
+
+    response = client.put("/api/slide-decks/9999", headers=ta_auth_headers, json={})
+    assert response.status_code == 404
+
+
 def test_delete_slide_deck_as_creator(
     client: TestClient, ta_auth_headers: dict, test_slide_deck: SlideDeck
 ):
@@ -238,4 +285,34 @@ async def test_generate_slides_ai_service_error(
     response = client.post("/api/slide-decks/", headers=ta_auth_headers, json=request_data)
 
     assert response.status_code == 500
-    assert "AI service error: AI model is offline" in response.json()["detail"]
\ No newline at end of file
+    assert "AI service error: AI model is offline" in response.json()["detail"]
+
+def test_export_slide_deck_streams_whole_file(
+    client: TestClient, ta_auth_headers: dict, test_slide_deck: SlideDeck, monkeypatch
+):
+    """Tests that an export larger than one chunk arrives byte-for-byte."""
+    payload = bytes(range(256)) * 1024  # 256 KiB with plenty of newline bytes
+    monkeypatch.setattr("app.api.slide_deck_router.export_to_pdf", lambda **kwargs: BytesIO(payload))
+
+    response = client.get(
+        f"/api/slide-decks/{test_slide_deck.id}/export", headers=ta_auth_headers, params={"format": "pdf"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content == payload
+
+
+def test_export_slide_deck_as_other_user(
+    client: TestClient, admin_auth_headers: dict, test_slide_deck: SlideDeck
+):
+    """Tests that a user who is not the creator cannot export the slide deck."""
+    response = client.get(f"/api/slide-decks/{test_slide_deck.id}/export", headers=admin_auth_headers)
+    assert response.status_code == 403
+    assert "You can only export slide decks you have created" in response.json()["detail"]
+
+
+def test_export_slide_deck_not_found(client: TestClient, ta_auth_headers: dict):
+    """Tests exporting a slide deck that does not exist."""
+    response = client.get("/api/slide-decks/99999/export", headers=ta_auth_headers)
+    assert response.status_code == 404
@@ -0,0 +1,116 @@
+"""
+API tests for the Student Resource endpoints.
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.resource import Resource
+
+# Mark all tests in this file
+pytestmark = [pytest.mark.api, pytest.mark.resources]
+
+PDF_BYTES = b"%PDF-1.4\n% test document\n"
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    """Stores uploads in a per-test directory."""
+    monkeypatch.setattr("app.api.student_resource_router.UPLOAD_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _upload_pdf(client: TestClient, headers: dict, content: bytes = PDF_BYTES, name: str = "notes.pdf"):
+    return client.post(
+        "/api/student-resources/upload-document",
+        headers=headers,
+        files={"file": (name, content, "application/pdf")},
+    )
+
+
+def _part_files(upload_dir) -> list:
+    return [name for _, _, files in os.walk(upload_dir) for name in files if name.endswith(".part")]
+
+
+def test_identical_uploads_share_one_file(client: TestClient, auth_headers: dict, upload_dir):
+    """Tests that uploading the same content twice stores it once."""
+    first = _upload_pdf(client, auth_headers, name="a.pdf")
+    second = _upload_pdf(client, auth_headers, name="b.pdf")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["file_path"] == second.json()["file_path"]
+    assert second.json()["file_name"] == "b.pdf"
+    assert os.path.isfile(first.json()["file_path"])
+    assert _part_files(upload_dir) == []
+
+
+def test_delete_keeps_file_shared_with_another_upload(client: TestClient, auth_headers: dict):
+    """Tests that a shared file is only removed with its last resource."""
+    first = _upload_pdf(client, auth_headers).json()
+    second = _upload_pdf(client, auth_headers).json()
+    file_path = first["file_path"]
+
+    response = client.delete(f"/api/student-resources/{first['id']}", headers=auth_headers)
+    assert response.status_code == 204
+    assert os.path.isfile(file_path)
+
+    download = client.get(f"/api/student-resources/download/{second['id']}", headers=auth_headers)
+    assert download.status_code == 200
+    assert download.content == PDF_BYTES
+
+    response = client.delete(f"/api/student-resources/{second['id']}", headers=auth_headers)
+    assert response.status_code == 204
+    assert not os.path.exists(file_path)
+
+
+def test_oversized_upload_rejected(client: TestClient, auth_headers: dict, db_session: Session, upload_dir, monkeypatch):
+    """Tests that a file over the limit is rejected and leaves nothing behind."""
+    monkeypatch.setattr("app.api.student_resource_router.MAX_FILE_SIZE", 64)
+    monkeypatch.setattr("app.api.student_resource_router.UPLOAD_CHUNK_SIZE", 16)
+
+    response = _upload_pdf(client, auth_headers, content=PDF_BYTES + b"x" * 100)
+
+    assert response.status_code == 413
+    assert _part_files(upload_dir) == []
+    assert db_session.query(Resource).count() == 0
+
+
+def test_mismatched_signature_rejected(client: TestClient, auth_headers: dict, db_session: Session, upload_dir):
+    """Tests that content not matching its extension is rejected."""
+    response = _upload_pdf(client, auth_headers, content=b"MZ\x90\x00 not really a pdf")
+
+    assert response.status_code == 400
+    assert "does not match" in response.json()["detail"]
+    assert _part_files(upload_dir) == []
+    assert db_session.query(Resource).count() == 0
+
+
+def test_add_link_stores_normalized_url(client: TestClient, auth_headers: dict):
+    """Tests that a valid link is stored in its normalized form."""
+    response = client.post(
+        "/api/student-resources/add-link",
+        headers=auth_headers,
+        data={"url": "https://example.com", "title": "Example"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["title"] == "Example"
+    assert data["url"] == "https://example.com/"
+    assert data["resource_type"] == "link"
+
+
+def test_add_link_rejects_invalid_url(client: TestClient, auth_headers: dict, db_session: Session):
+    """Tests that a URL that is not http(s) fails validation."""
+    response = client.post(
+        "/api/student-resources/add-link",
+        headers=auth_headers,
+        data={"url": "not a url"},
+    )
+
+    assert response.status_code == 422
+    assert db_session.query(Resource).count() == 0
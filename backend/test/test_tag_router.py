@@ -101,6 +101,29 @@ def test_search_tags(client: TestClient, auth_headers: dict, test_tag: Tag):
     assert len(response.json()) == 0
 
 
+def test_search_tags_prefix_only(client: TestClient, auth_headers: dict, test_tag: Tag):
+    """Tests that prefix-only search matches the start of the name only."""
+    response = client.get("/api/tags/?search=PYTEST&prefix_only=true", headers=auth_headers)
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()] == [test_tag.id]
+
+    response = client.get("/api/tags/?search=tag&prefix_only=true", headers=auth_headers)
+    assert response.status_code == 200
+    assert all(t["id"] != test_tag.id for t in response.json())
+
+
+def test_tag_list_reflects_writes(client: TestClient, auth_headers: dict, ta_auth_headers: dict, test_tag: Tag):
+    """Tests that a cached tag list is refreshed after a tag is created."""
+    response = client.get("/api/tags/", headers=auth_headers)
+    assert all(t["name"] != "cached-list-tag" for t in response.json())
+
+    response = client.post("/api/tags/", json={"name": "cached-list-tag"}, headers=ta_auth_headers)
+    assert response.status_code == 201
+
+    response = client.get("/api/tags/", headers=auth_headers)
+    assert any(t["name"] == "cached-list-tag" for t in response.json())
+
+
 def test_get_tag_by_id(client: TestClient, auth_headers: dict, test_tag: Tag):
     """Tests successful retrieval of a single tag by its ID."""
     response = client.get(f"/api/tags/{test_tag.id}", headers=auth_headers)
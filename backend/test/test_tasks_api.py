@@ -83,6 +83,67 @@ class TestTasksList:
         tasks = response.json()
         assert len(tasks) == 5
 
+    def test_list_tasks_cursor_pagination(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session
+    ):
+        """Test keyset pagination through the X-Next-Cursor header."""
+        for i in range(25):
+            task = Task(
+                task_type=TaskTypeEnum.EMBEDDING.value,
+                status=TaskStatusEnum.COMPLETED.value
+            )
+            db_session.add(task)
+        db_session.commit()
+
+        response = client.get("/api/tasks/?size=10", headers=auth_headers)
+        assert response.status_code == 200
+        seen = [t["id"] for t in response.json()]
+
+        while "X-Next-Cursor" in response.headers:
+            response = client.get(
+                "/api/tasks/",
+                params={"size": 10, "cursor": response.headers["X-Next-Cursor"]},
+                headers=auth_headers
+            )
+            assert response.status_code == 200
+            seen.extend(t["id"] for t in response.json())
+
+        # Every task exactly once, in the same order as a single big page
+        assert len(seen) == 25
+        response = client.get("/api/tasks/?size=25", headers=auth_headers)
+        assert seen == [t["id"] for t in response.json()]
+
+    def test_list_tasks_omits_detail_fields(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session
+    ):
+        """Test that the list leaves out metadata and error text."""
+        task = Task(
+            task_type=TaskTypeEnum.EMBEDDING.value,
+            status=TaskStatusEnum.FAILED.value,
+            metadata_='{"key": "value"}',
+            error_message="Failed to process document"
+        )
+        db_session.add(task)
+        db_session.commit()
+
+        response = client.get("/api/tasks/", headers=auth_headers)
+        assert response.status_code == 200
+        listed = response.json()[0]
+        assert listed["status"] == TaskStatusEnum.FAILED.value
+        assert "metadata_" not in listed
+        assert "error_message" not in listed
+
+    def test_list_tasks_invalid_cursor(self, client: TestClient, auth_headers: dict):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/tasks/?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
     def test_list_tasks_filter_by_type(
         self,
         client: TestClient,
@@ -582,3 +643,7 @@ class TestTasksIntegration:
         # Verify task is deleted
         list_response = client.get("/api/tasks/", headers=auth_headers)
         assert len(list_response.json()) == 0
+
+        # Deleting through the API invalidates the cached statistics
+        stats_response = client.get("/api/tasks/statistics/summary", headers=auth_headers)
+        assert stats_response.json()["total"] == 0
@@ -0,0 +1,13 @@
+import { api } from '@/api'
+
+// Polls GET /quizzes/:id until the background AI job leaves 'generating'.
+// Gives up after maxAttempts polls so a lost job cannot spin the UI forever.
+export async function waitForQuizGeneration(quiz, { intervalMs = 2000, maxAttempts = 150 } = {}){
+  let current = quiz
+  for(let attempt = 0; current.generation_status === 'generating'; attempt++){
+    if(attempt >= maxAttempts) throw new Error('Quiz generation is taking too long. Please check back later.')
+    await new Promise((resolve)=> setTimeout(resolve, intervalMs))
+    current = (await api.get(`/quizzes/${current.id}`)).data
+  }
+  return current
+}